@@ -1,5 +1,12 @@
 import { useQueryClient } from "@tanstack/react-query";
-import { type FC, memo, useCallback, useEffect, useState } from "react";
+import {
+  type FC,
+  memo,
+  useCallback,
+  useEffect,
+  useRef,
+  useState,
+} from "react";
 import {
   Navigate,
   useLocation,
@@ -12,6 +19,7 @@ import { useGetConversationHistory, usePollTaskList } from "@/api/conversation";
 import { API_QUERY_KEYS } from "@/constants/api";
 import useSSE from "@/hooks/use-sse";
 import { getServerUrl } from "@/lib/api-client";
+import { SSEHttpError } from "@/lib/sse-client";
 import { tracker } from "@/lib/tracker";
 import {
   MultiSectionProvider,
@@ -83,9 +91,17 @@ const CommonAgentAreaContent: FC<CommonAgentAreaProps> = ({ agentName }) => {
     dispatchAgentStoreHistory(conversationId, taskList);
   }, [conversationId, taskList, dispatchAgentStoreHistory]);
 
+  // Request of the running stream, completed with the conversation id the
+  // server assigns so a dropped stream can be resumed instead of re-run
+  const streamRequestRef = useRef<AgentStreamRequest | null>(null);
+
   // Initialize SSE connection using the useSSE hook
   const { connect, close, isStreaming } = useSSE({
     url: getServerUrl("/agents/stream"),
+    resumeBody: () => {
+      const request = streamRequestRef.current;
+      return request?.conversation_id ? JSON.stringify(request) : undefined;
+    },
     handlers: {
       onData: (sseData: SSEData) => {
         // Update agent store using the reducer
@@ -95,6 +111,9 @@ const CommonAgentAreaContent: FC<CommonAgentAreaProps> = ({ agentName }) => {
         const { event, data } = sseData;
         switch (event) {
           case "conversation_started":
+            if (streamRequestRef.current) {
+              streamRequestRef.current.conversation_id = data.conversation_id;
+            }
             navigate(`/agent/${agentName}?id=${data.conversation_id}`, {
               replace: true,
             });
@@ -133,6 +152,20 @@ const CommonAgentAreaContent: FC<CommonAgentAreaProps> = ({ agentName }) => {
       },
       onError: (error: Error) => {
         console.error("❌ SSE connection error:", error);
+
+        // The missed events are no longer buffered: reload from history
+        const resumedId = streamRequestRef.current?.conversation_id;
+        if (
+          resumedId &&
+          error instanceof SSEHttpError &&
+          (error.status === 404 || error.status === 410)
+        ) {
+          queryClient.invalidateQueries({
+            queryKey: API_QUERY_KEYS.CONVERSATION.conversationHistory([
+              resumedId,
+            ]),
+          });
+        }
       },
       onClose: () => {
         console.log("🔌 SSE connection closed");
@@ -156,6 +189,7 @@ const CommonAgentAreaContent: FC<CommonAgentAreaProps> = ({ agentName }) => {
         });
 
         // Connect SSE client with request body to receive streaming response
+        streamRequestRef.current = { ...request };
         await connect(JSON.stringify(request));
       } catch (error) {
         console.error("Failed to send message:", error);
@@ -15,6 +15,29 @@ export interface SSEOptions {
   timeout?: number;
   /** Additional fetch request options */
   fetchOptions?: Omit<RequestInit, "method" | "body" | "headers" | "signal">;
+  /**
+   * Request body that resumes the stream after `lastEventId` (sent with a
+   * `Last-Event-ID` header). Return undefined when the stream cannot be
+   * resumed. Without it, a stream that ends early is just closed.
+   */
+  resumeBody?: (lastEventId: string) => BodyInit | undefined;
+  /** Consecutive resume attempts before giving up */
+  maxRetries?: number;
+  /** Delay before a resume attempt in ms, unless the server sent `retry:` */
+  retryDelay?: number;
+}
+
+/**
+ * HTTP error returned by the SSE endpoint
+ */
+export class SSEHttpError extends Error {
+  constructor(
+    readonly status: number,
+    statusText: string,
+  ) {
+    super(`HTTP ${status}: ${statusText}`);
+    this.name = "SSEHttpError";
+  }
 }
 
 export interface SSEEventHandlers {
@@ -36,12 +59,20 @@ export enum SSEReadyState {
   CLOSED = 2,
 }
 
+type ResolvedSSEOptions = Required<Omit<SSEOptions, "resumeBody">> &
+  Pick<SSEOptions, "resumeBody">;
+
 export class SSEClient {
-  private options: Required<SSEOptions>;
+  private options: ResolvedSSEOptions;
   private currentBody?: BodyInit;
   private handlers: SSEEventHandlers = {};
   private readyState: SSEReadyState = SSEReadyState.CLOSED;
   private abortController: AbortController | null = null;
+  /** Id of the last event received, used to resume the stream */
+  private lastEventId?: string;
+  /** Resume attempts since the last event was received */
+  private retries = 0;
+  private retryDelay: number;
 
   /**
    * Update ready state and notify handlers
@@ -56,14 +87,18 @@ export class SSEClient {
   constructor(options: SSEOptions, handlers?: SSEEventHandlers) {
     this.options = this.resolveOptions(options);
     this.handlers = handlers ?? {};
+    this.retryDelay = this.options.retryDelay;
   }
 
-  private resolveOptions(options: SSEOptions): Required<SSEOptions> {
+  private resolveOptions(options: SSEOptions): ResolvedSSEOptions {
     return {
       url: options.url,
       timeout: options.timeout ?? 30 * 1000,
       headers: { ...(options.headers ?? {}) },
       fetchOptions: { ...(options.fetchOptions ?? {}) },
+      resumeBody: options.resumeBody,
+      maxRetries: options.maxRetries ?? 3,
+      retryDelay: options.retryDelay ?? 1000,
     };
   }
 
@@ -79,42 +114,52 @@ export class SSEClient {
       return;
 
     this.currentBody = body;
+    this.lastEventId = undefined;
+    this.retries = 0;
+    this.retryDelay = this.options.retryDelay;
     this.setReadyState(SSEReadyState.CONNECTING);
     this.abortController = new AbortController();
 
     // Start connection in the background; errors are handled via event handlers
-    void this.startConnection().catch(() => {});
+    void this.startConnection(body).catch(() => {});
     return;
   }
 
   /**
    * Start the connection using fetch + ReadableStream
    */
-  private async startConnection(): Promise<void> {
+  private async startConnection(
+    body?: BodyInit,
+    lastEventId?: string,
+  ): Promise<void> {
     let didTimeout = false;
+    const controller = this.abortController;
     const timeoutId = setTimeout(() => {
       didTimeout = true;
-      this.abortController?.abort();
+      controller?.abort();
     }, this.options.timeout);
 
     try {
       const response = await fetch(this.options.url, {
         method: "POST",
-        body: this.currentBody,
-        signal: this.abortController?.signal,
+        body,
+        signal: controller?.signal,
         ...this.options.fetchOptions,
         headers: {
           Accept: "text/event-stream",
           "Cache-Control": "no-cache",
           "Content-Type": "application/json",
           ...this.options.headers,
+          ...(lastEventId !== undefined
+            ? { "Last-Event-ID": lastEventId }
+            : {}),
         },
       });
 
       clearTimeout(timeoutId);
 
       if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        throw new SSEHttpError(response.status, response.statusText);
       }
 
       if (!response.body) {
@@ -129,9 +174,10 @@ export class SSEClient {
       await this.readStream(response.body);
     } catch (error) {
       clearTimeout(timeoutId);
-      this.setReadyState(SSEReadyState.CLOSED);
 
       if (error instanceof Error && error.name === "AbortError") {
+        this.setReadyState(SSEReadyState.CLOSED);
+
         // Handshake timeout: emit error
         if (didTimeout) {
           const timeoutError = new Error("Handshake timeout");
@@ -144,12 +190,46 @@ export class SSEClient {
         return;
       }
 
-      // Other network/HTTP errors
+      // Network errors can be resumed; HTTP errors (e.g. 404/410 when the
+      // missed events are gone) are final
+      if (!(error instanceof SSEHttpError) && this.resume()) return;
+
+      this.setReadyState(SSEReadyState.CLOSED);
       this.handlers.onError?.(error as Error);
       return;
     }
   }
 
+  /**
+   * Reconnect with Last-Event-ID after the stream ended without being closed.
+   * Returns false when the stream cannot be resumed.
+   */
+  private resume(): boolean {
+    const lastEventId = this.lastEventId;
+    // A null controller means the caller closed the stream
+    if (
+      !this.abortController ||
+      lastEventId === undefined ||
+      this.retries >= this.options.maxRetries
+    )
+      return false;
+
+    const body = this.options.resumeBody?.(lastEventId);
+    if (body === undefined) return false;
+
+    this.retries += 1;
+    const controller = new AbortController();
+    this.abortController = controller;
+    this.setReadyState(SSEReadyState.CONNECTING);
+
+    setTimeout(() => {
+      // Closed or superseded by a new connect while waiting
+      if (this.abortController !== controller) return;
+      void this.startConnection(body, lastEventId).catch(() => {});
+    }, this.retryDelay);
+    return true;
+  }
+
   /**
    * Read the response stream and process SSE events
    */
@@ -163,6 +243,9 @@ export class SSEClient {
         const { done, value } = await reader.read();
 
         if (done) {
+          // Ended before the caller closed it (e.g. `stream_lagged`): resume
+          if (this.resume()) break;
+
           this.setReadyState(SSEReadyState.CLOSED);
           this.handlers.onClose?.();
           break;
@@ -184,6 +267,8 @@ export class SSEClient {
         }
       }
     } catch (error) {
+      if (this.resume()) return;
+
       this.setReadyState(SSEReadyState.CLOSED);
       this.handlers.onError?.(error as Error);
     } finally {
@@ -201,8 +286,15 @@ export class SSEClient {
     for (const line of lines) {
       if (line.startsWith("data:")) {
         data += `${line.slice(5).trim()}\n`;
+      } else if (line.startsWith("id:")) {
+        // Progress was made: resume from here, with a fresh retry budget
+        this.lastEventId = line.slice(3).trim();
+        this.retries = 0;
+      } else if (line.startsWith("retry:")) {
+        const retry = Number.parseInt(line.slice(6).trim(), 10);
+        if (!Number.isNaN(retry)) this.retryDelay = retry;
       }
-      // Ignore event: and retry: fields for simplicity
+      // Ignore event: fields for simplicity
     }
 
     if (!data) return;
@@ -58,6 +58,10 @@ export interface AgentEventMap {
   conversation_started: Pick<BaseEventData, "conversation_id">;
   thread_started: AgentThreadStartedMessage;
   done: Pick<BaseEventData, "conversation_id" | "thread_id">;
+  // The stream fell behind and ends here; resume after `last_event_id`
+  stream_lagged: Pick<BaseEventData, "conversation_id"> & {
+    metadata: { last_event_id: number };
+  };
 
   // Content Streaming Events
   message_chunk: AgentChunkMessage;
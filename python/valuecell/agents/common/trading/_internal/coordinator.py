@@ -672,7 +672,12 @@ class DefaultDecisionCoordinator(DecisionCoordinator):
             return []
 
     async def close(self) -> None:
-        """Release resources for the execution gateway if it supports closing."""
+        """Release resources of the features pipeline and execution gateway."""
+        try:
+            await self._features_pipeline.close()
+        except Exception:
+            # Avoid bubbling cleanup errors
+            pass
         try:
             close_fn = getattr(self._execution_gateway, "close", None)
             if callable(close_fn):
@@ -10,13 +10,17 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 
 from valuecell.agents.common.trading import models as agent_models
 from valuecell.server.db.repositories.strategy_repository import get_strategy_repository
 from valuecell.server.services import strategy_persistence
+from valuecell.server.services.strategy_cycle_writer import (
+    StrategyCycleWriter,
+    get_strategy_cycle_writer,
+)
 from valuecell.utils.ts import get_current_timestamp_ms
 
 if TYPE_CHECKING:
@@ -42,12 +46,23 @@ class StreamController:
     - State transitions (INITIALIZING -> WAITING_RUNNING -> RUNNING -> STOPPED)
     - Persistence of initial state, cycle results, and finalization
     - Waiting for external "running" signal from persistence layer
+
+    Cycle results are written by a :class:`StrategyCycleWriter` off the event
+    loop, batched with the cycles of other strategies.
     """
 
-    def __init__(self, strategy_id: str, timeout_s: int = 300) -> None:
+    def __init__(
+        self,
+        strategy_id: str,
+        timeout_s: int = 300,
+        cycle_writer: Optional[StrategyCycleWriter] = None,
+    ) -> None:
         self.strategy_id = strategy_id
         self.timeout_s = timeout_s
         self._state = ControllerState.INITIALIZING
+        self._cycle_writer = cycle_writer
+        # Cycles whose rows could not be written
+        self.failed_cycle_writes = 0
 
     @property
     def state(self) -> ControllerState:
@@ -219,65 +234,39 @@ class StreamController:
             )
             return None
 
-    def persist_cycle_results(self, result: DecisionCycleResult) -> None:
-        """Persist trades, portfolio view, and strategy summary for a cycle.
+    async def persist_cycle_results(self, result: DecisionCycleResult) -> bool:
+        """Persist compose cycle, instructions, trades, portfolio view, and
+        strategy summary of a cycle in one transaction.
 
-        Errors are logged but not raised to keep the decision loop resilient.
+        The write happens on the cycle writer's thread; this coroutine only
+        waits for its outcome. Errors are logged and counted in
+        ``failed_cycle_writes`` but not raised to keep the decision loop
+        resilient. Returns True when the rows were written.
         """
+        writer = self._cycle_writer or get_strategy_cycle_writer()
         try:
-            # Persist compose cycle and instructions first (NOOP included)
-            try:
-                strategy_persistence.persist_compose_cycle(
-                    strategy_id=self.strategy_id,
-                    compose_id=result.compose_id,
-                    ts_ms=result.timestamp_ms,
-                    cycle_index=result.cycle_index,
-                    rationale=result.rationale,
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to persist compose cycle for strategy={} compose_id={}",
-                    self.strategy_id,
-                    result.compose_id,
-                )
-
-            try:
-                strategy_persistence.persist_instructions(
-                    strategy_id=self.strategy_id,
-                    compose_id=result.compose_id,
-                    instructions=list(result.instructions or []),
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to persist compose instructions for strategy={} compose_id={}",
-                    self.strategy_id,
-                    result.compose_id,
-                )
-
-            for trade in result.trades:
-                item = strategy_persistence.persist_trade_history(
-                    self.strategy_id, trade
-                )
-                if item:
-                    logger.info(
-                        "Persisted trade {} for strategy={}",
-                        trade.trade_id,
-                        self.strategy_id,
-                    )
-
-            ok = strategy_persistence.persist_portfolio_view(result.portfolio_view)
-            if ok:
-                logger.info(
-                    "Persisted portfolio view for strategy={}", self.strategy_id
-                )
-
-            ok = strategy_persistence.persist_strategy_summary(result.strategy_summary)
-            if ok:
-                logger.info(
-                    "Persisted strategy summary for strategy={}", self.strategy_id
-                )
+            ok = await writer.write(self.strategy_id, result)
         except Exception:
-            logger.exception("Error persisting cycle results for {}", self.strategy_id)
+            self.failed_cycle_writes += 1
+            logger.exception(
+                "Error persisting cycle results for strategy={} compose_id={}",
+                self.strategy_id,
+                result.compose_id,
+            )
+            return False
+        if ok:
+            logger.info(
+                "Persisted cycle compose_id={} ({} trades) for strategy={}",
+                result.compose_id,
+                len(result.trades),
+                self.strategy_id,
+            )
+        else:
+            logger.info(
+                "Skip persisting cycle results: strategy={} not found (possibly deleted)",
+                self.strategy_id,
+            )
+        return ok
 
     def persist_portfolio_snapshot(self, runtime: StrategyRuntime) -> None:
         """Persist a final portfolio snapshot (used at shutdown).
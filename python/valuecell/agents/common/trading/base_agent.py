@@ -265,7 +265,7 @@ class BaseStrategyAgent(BaseAgent, ABC):
                 )
 
                 # Persist cycle results
-                controller.persist_cycle_results(result)
+                await controller.persist_cycle_results(result)
 
                 # Call user hook for post-cycle logic
                 try:
@@ -10,6 +10,8 @@ DEFAULT_MAX_POSITIONS = 5
 DEFAULT_MAX_SYMBOLS = 5
 DEFAULT_MAX_LEVERAGE = 10.0
 DEFAULT_CAP_FACTOR = 1.5
+# Composer cycles a feature keyframe is reused before a full refresh
+DEFAULT_FEATURE_KEYFRAME_INTERVAL = 10
 
 # Feature grouping constants
 FEATURE_GROUP_BY_KEY = "group_by_key"
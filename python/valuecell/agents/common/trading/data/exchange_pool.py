@@ -0,0 +1,183 @@
+"""Process-wide pool of shared ccxt.pro exchange clients.
+
+Creating a ccxt exchange object is cheap, but its first requests are not:
+they pay for ``load_markets``, TLS handshakes and rate-limiter warm-up. The
+pool hands out reference-counted leases on one client per (event loop,
+exchange id, options), so every strategy running in the process reuses the
+same connections and market metadata. The client is closed when its last
+lease is released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from valuecell.agents.common.trading.markets_cache import (
+    MarketsCache,
+    get_markets_cache,
+)
+from valuecell.agents.common.trading.utils import get_exchange_cls
+
+# Market metadata older than this is reloaded on the next lease refresh
+DEFAULT_MARKETS_TTL_SECONDS = 60 * 60
+# REST requests in flight per shared client, across all leases
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+# Options of the exchange client used for public market data
+MARKET_DATA_OPTIONS = {"newUpdates": False}
+
+_PoolKey = Tuple[str, str]
+
+
+def _pool_key(exchange_id: str, options: Optional[Dict[str, Any]]) -> _PoolKey:
+    return exchange_id, json.dumps(options or {}, sort_keys=True, default=str)
+
+
+class _PooledExchange:
+    """One shared exchange client and the leases holding it open."""
+
+    def __init__(self, exchange: Any, max_concurrent_requests: int):
+        self.exchange = exchange
+        self.refcount = 0
+        self.markets_loaded_at: Optional[float] = None
+        self.markets_lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrent_requests))
+
+
+class ExchangeLease:
+    """A strategy's handle on a pooled exchange client.
+
+    Use ``exchange`` for requests and ``close`` when done; closing a lease
+    never closes the shared client while other leases still hold it.
+    """
+
+    def __init__(
+        self, pool: ExchangeSessionPool, key: _PoolKey, entry: _PooledExchange
+    ):
+        self._pool = pool
+        self._key = key
+        self._entry: Optional[_PooledExchange] = entry
+
+    @property
+    def exchange(self) -> Any:
+        if self._entry is None:
+            raise RuntimeError("Exchange lease is closed")
+        return self._entry.exchange
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Concurrency budget of REST requests to the shared client."""
+        if self._entry is None:
+            raise RuntimeError("Exchange lease is closed")
+        return self._entry.semaphore
+
+    @property
+    def closed(self) -> bool:
+        return self._entry is None
+
+    async def ensure_markets(self) -> None:
+        """Load market metadata once per TTL, shared by all leases."""
+        if self._entry is None:
+            raise RuntimeError("Exchange lease is closed")
+        await self._pool._ensure_markets(self._entry)
+
+    async def close(self) -> None:
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            await self._pool._release(self._key, entry)
+
+
+class ExchangeSessionPool:
+    """Reference-counted ccxt.pro clients keyed by exchange id and options.
+
+    Instances are bound to the event loop that uses them; use
+    :func:`get_exchange_pool` rather than constructing pools directly.
+    """
+
+    def __init__(
+        self,
+        markets_ttl: float = DEFAULT_MARKETS_TTL_SECONDS,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        markets_cache: Optional[MarketsCache] = None,
+    ):
+        self._markets_ttl = markets_ttl
+        self._markets_cache = markets_cache
+        self._max_concurrent_requests = max_concurrent_requests
+        self._entries: Dict[_PoolKey, _PooledExchange] = {}
+
+    def acquire(
+        self, exchange_id: str, options: Optional[Dict[str, Any]] = None
+    ) -> ExchangeLease:
+        """Lease the shared client for ``exchange_id`` built with ``options``."""
+        key = _pool_key(exchange_id, options)
+        entry = self._entries.get(key)
+        if entry is None:
+            exchange_cls = get_exchange_cls(exchange_id)
+            entry = _PooledExchange(
+                exchange_cls(dict(options or {})), self._max_concurrent_requests
+            )
+            self._entries[key] = entry
+        entry.refcount += 1
+        return ExchangeLease(self, key, entry)
+
+    async def _ensure_markets(self, entry: _PooledExchange) -> None:
+        async with entry.markets_lock:
+            loaded_at = entry.markets_loaded_at
+            if (
+                loaded_at is not None
+                and time.monotonic() - loaded_at < self._markets_ttl
+            ):
+                return
+            cache = self._markets_cache or get_markets_cache()
+            if loaded_at is None:
+                # First load: prime from the on-disk cache when possible
+                await cache.load(entry.exchange)
+            else:
+                await cache.reload(entry.exchange)
+            entry.markets_loaded_at = time.monotonic()
+
+    async def _release(self, key: _PoolKey, entry: _PooledExchange) -> None:
+        entry.refcount -= 1
+        if entry.refcount > 0:
+            return
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+        await self._close_exchange(key[0], entry)
+
+    @staticmethod
+    async def _close_exchange(exchange_id: str, entry: _PooledExchange) -> None:
+        try:
+            await entry.exchange.close()
+        except Exception:
+            logger.exception(
+                "Failed to close pooled exchange connection for {}", exchange_id
+            )
+
+    async def close(self) -> None:
+        """Close every pooled client regardless of outstanding leases."""
+        entries = list(self._entries.items())
+        self._entries.clear()
+        for key, entry in entries:
+            await self._close_exchange(key[0], entry)
+
+
+# event loop -> pool
+_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ExchangeSessionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_exchange_pool() -> ExchangeSessionPool:
+    """Return the exchange pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = ExchangeSessionPool()
+        _POOLS[loop] = pool
+    return pool
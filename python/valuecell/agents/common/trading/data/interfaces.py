@@ -3,7 +3,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List
 
-from valuecell.agents.common.trading.models import Candle, MarketSnapShotType
+from valuecell.agents.common.trading.models import (
+    Candle,
+    CandleBatch,
+    MarketSnapShotType,
+)
 
 # Contracts for market data sources (module-local abstract interfaces).
 # These are plain ABCs (not Pydantic models) so implementations can be
@@ -31,6 +35,17 @@ class BaseMarketDataSource(ABC):
         """
         raise NotImplementedError
 
+    async def get_recent_candle_batches(
+        self, symbols: List[str], interval: str, lookback: int
+    ) -> List[CandleBatch]:
+        """Return recent candles as one columnar batch per symbol.
+
+        The default adapts ``get_recent_candles``; sources that receive raw
+        OHLCV rows should override it to skip building ``Candle`` models.
+        """
+        candles = await self.get_recent_candles(symbols, interval, lookback)
+        return CandleBatch.from_candles(candles)
+
     @abstractmethod
     async def get_market_snapshot(self, symbols: List[str]) -> MarketSnapShotType:
         """Return a lightweight market snapshot mapping symbol -> price.
@@ -42,3 +57,7 @@ class BaseMarketDataSource(ABC):
         """
 
         raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release connections held by the data source (default: no-op)."""
+        return None
@@ -1,18 +1,27 @@
 import asyncio
-import itertools
-from collections import defaultdict
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
 from valuecell.agents.common.trading.models import (
     Candle,
+    CandleBatch,
     InstrumentRef,
     MarketSnapShotType,
 )
-from valuecell.agents.common.trading.utils import get_exchange_cls, normalize_symbol
+from valuecell.agents.common.trading.utils import normalize_symbol
 
+from .exchange_pool import (
+    MARKET_DATA_OPTIONS,
+    ExchangeLease,
+    ExchangeSessionPool,
+    get_exchange_pool,
+)
 from .interfaces import BaseMarketDataSource
+from .stream_hub import MarketDataHub, get_market_data_hub
+
+# Longest wait for a market snapshot before returning what has arrived
+DEFAULT_SNAPSHOT_TIMEOUT_SECONDS = 5.0
 
 
 class SimpleMarketDataSource(BaseMarketDataSource):
@@ -23,13 +32,48 @@ class SimpleMarketDataSource(BaseMarketDataSource):
     specified exchange. If any error occurs (missing library, unknown
     exchange, network error), it falls back to the built-in synthetic
     generator so the runtime remains functional in tests and offline.
+
+    Requests go through a lease on the process-wide exchange pool, so
+    strategies trading on the same exchange share one client; call
+    ``close`` to release the lease when the strategy stops.
     """
 
-    def __init__(self, exchange_id: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        exchange_id: Optional[str] = None,
+        pool: Optional[ExchangeSessionPool] = None,
+        snapshot_timeout: float = DEFAULT_SNAPSHOT_TIMEOUT_SECONDS,
+    ) -> None:
         if not exchange_id:
             self._exchange_id = "okx"
         else:
             self._exchange_id = exchange_id
+        self._pool = pool
+        self._lease: Optional[ExchangeLease] = None
+        self._snapshot_timeout = snapshot_timeout
+
+    async def _get_exchange(self) -> ExchangeLease:
+        """Return the lease on the pooled client, refreshing stale markets.
+
+        Callers keep the returned lease rather than reading ``self._lease``
+        again after an await, since ``close`` may reset it meanwhile.
+        """
+        lease = self._lease
+        if lease is None or lease.closed:
+            pool = self._pool or get_exchange_pool()
+            lease = self._lease = pool.acquire(self._exchange_id, MARKET_DATA_OPTIONS)
+        try:
+            await lease.ensure_markets()
+        except Exception as exc:
+            # Requests can still succeed; ccxt loads markets lazily as well
+            logger.warning("Failed to load markets for {}: {}", self._exchange_id, exc)
+        return lease
+
+    async def close(self) -> None:
+        """Release the exchange lease; the pooled client stays shared."""
+        lease, self._lease = self._lease, None
+        if lease is not None:
+            await lease.close()
 
     def _normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format for specific exchanges.
@@ -55,51 +99,50 @@ class SimpleMarketDataSource(BaseMarketDataSource):
 
         return base_symbol
 
+    async def _fetch_ohlcv(
+        self, lease: ExchangeLease, symbol: str, interval: str, lookback: int
+    ) -> List[list]:
+        """Fetch raw OHLCV rows of a normalized symbol."""
+        exchange, semaphore = lease.exchange, lease.semaphore
+        # ccxt.pro uses async fetch_ohlcv with normalized symbol
+        async with semaphore:
+            return await exchange.fetch_ohlcv(
+                symbol,
+                timeframe=interval,
+                since=None,
+                limit=lookback,
+            )
+
+    def _cached_ticker(self, symbol: str) -> Optional[dict]:
+        """Ticker of a normalized symbol known without a request, if any."""
+        return None
+
     async def get_recent_candles(
         self, symbols: List[str], interval: str, lookback: int
     ) -> List[Candle]:
-        async def _fetch_and_process(symbol: str) -> List[Candle]:
-            # instantiate exchange class by name (e.g., ccxtpro.kraken)
-            exchange_cls = get_exchange_cls(self._exchange_id)
-            exchange = exchange_cls({"newUpdates": False})
+        batches = await self.get_recent_candle_batches(symbols, interval, lookback)
+        return [candle for batch in batches for candle in batch.to_candles()]
 
-            symbol_candles: List[Candle] = []
+    async def get_recent_candle_batches(
+        self, symbols: List[str], interval: str, lookback: int
+    ) -> List[CandleBatch]:
+        async def _fetch_and_process(symbol: str) -> Optional[CandleBatch]:
             normalized_symbol = self._normalize_symbol(symbol)
             try:
-                try:
-                    # ccxt.pro uses async fetch_ohlcv with normalized symbol
-                    raw = await exchange.fetch_ohlcv(
-                        normalized_symbol,
-                        timeframe=interval,
-                        since=None,
-                        limit=lookback,
-                    )
-                finally:
-                    try:
-                        await exchange.close()
-                    except Exception:
-                        pass
+                lease = await self._get_exchange()
+                raw = await self._fetch_ohlcv(
+                    lease, normalized_symbol, interval, lookback
+                )
 
                 # raw is list of [ts, open, high, low, close, volume]
-                for row in raw:
-                    ts, open_v, high_v, low_v, close_v, vol = row
-                    symbol_candles.append(
-                        Candle(
-                            ts=int(ts),
-                            instrument=InstrumentRef(
-                                symbol=symbol,
-                                exchange_id=self._exchange_id,
-                                # quote_ccy="USD",
-                            ),
-                            open=float(open_v),
-                            high=float(high_v),
-                            low=float(low_v),
-                            close=float(close_v),
-                            volume=float(vol),
-                            interval=interval,
-                        )
-                    )
-                return symbol_candles
+                if not raw:
+                    return None
+                instrument = InstrumentRef(
+                    symbol=symbol,
+                    exchange_id=self._exchange_id,
+                    # quote_ccy="USD",
+                )
+                return CandleBatch.from_rows(instrument, interval, raw)
             except Exception as exc:
                 logger.warning(
                     "Failed to fetch candles for {} (normalized: {}) from {}, data interval is {}, return empty candles. Error: {}",
@@ -109,19 +152,17 @@ class SimpleMarketDataSource(BaseMarketDataSource):
                     interval,
                     exc,
                 )
-                return []
+                return None
 
         # Run fetch for each symbol concurrently
         tasks = [_fetch_and_process(symbol) for symbol in symbols]
         results = await asyncio.gather(*tasks)
-
-        # Flatten the list of lists results into a single list of candles
-        candles: List[Candle] = list(itertools.chain.from_iterable(results))
+        batches = [batch for batch in results if batch is not None]
 
         logger.debug(
-            f"Fetch {len(candles)} candles symbols: {symbols}, interval: {interval}, lookback: {lookback}"
+            f"Fetch {sum(len(b) for b in batches)} candles symbols: {symbols}, interval: {interval}, lookback: {lookback}"
         )
-        return candles
+        return batches
 
     async def get_market_snapshot(self, symbols: List[str]) -> MarketSnapShotType:
         """Fetch latest prices for the given symbols using exchange endpoints.
@@ -130,6 +171,12 @@ class SimpleMarketDataSource(BaseMarketDataSource):
         `fetch_open_interest` / `fetch_funding_rate` when available) to build
         a mapping symbol -> last price. On any failure for a symbol, the
         symbol will be omitted from the snapshot.
+
+        Symbols and endpoints are fetched concurrently within the pooled
+        client's request budget, using the bulk ``fetch_tickers`` /
+        ``fetch_open_interests`` / ``fetch_funding_rates`` endpoints when
+        the exchange supports them. Whatever has arrived after
+        ``snapshot_timeout`` seconds is returned as a partial snapshot.
         Example:
         ```
         "BTC/USDT": {
@@ -204,51 +251,189 @@ class SimpleMarketDataSource(BaseMarketDataSource):
         }
         ```
         """
-        snapshot = defaultdict(dict)
-
-        exchange_cls = get_exchange_cls(self._exchange_id)
-        exchange = exchange_cls({"newUpdates": False})
         try:
-            for symbol in symbols:
-                sym = normalize_symbol(symbol)
-                try:
-                    ticker = await exchange.fetch_ticker(sym)
-                    snapshot[symbol]["price"] = ticker
-
-                    # best-effort: warm other endpoints (open interest / funding)
-                    try:
-                        oi = await exchange.fetch_open_interest(sym)
-                        snapshot[symbol]["open_interest"] = oi
-                    except Exception:
-                        logger.exception(
-                            "Failed to fetch open interest for {} at {}",
-                            symbol,
-                            self._exchange_id,
-                        )
-
-                    try:
-                        fr = await exchange.fetch_funding_rate(sym)
-                        snapshot[symbol]["funding_rate"] = fr
-                    except Exception:
-                        logger.exception(
-                            "Failed to fetch funding rate for {} at {}",
-                            symbol,
-                            self._exchange_id,
-                        )
-                    logger.debug(f"Fetch market snapshot for {sym} data: {snapshot}")
-                except Exception:
-                    logger.exception(
-                        "Failed to fetch market snapshot for {} at {}",
-                        symbol,
-                        self._exchange_id,
-                    )
-        finally:
+            lease = await self._get_exchange()
+            exchange, semaphore = lease.exchange, lease.semaphore
+        except Exception:
+            logger.exception("Failed to get exchange client for {}", self._exchange_id)
+            return {}
+
+        # requested symbol -> ccxt symbol
+        requested = {symbol: normalize_symbol(symbol) for symbol in symbols}
+        ccxt_symbols = list(dict.fromkeys(requested.values()))
+        # field -> ccxt symbol -> payload
+        results: Dict[str, Dict[str, dict]] = {
+            "price": {},
+            "open_interest": {},
+            "funding_rate": {},
+        }
+        for sym in ccxt_symbols:
+            ticker = self._cached_ticker(sym)
+            if ticker is not None:
+                results["price"][sym] = ticker
+
+        has = getattr(exchange, "has", None) or {}
+
+        async def _fetch_one(field: str, method: str, sym: str) -> None:
             try:
-                await exchange.close()
+                async with semaphore:
+                    results[field][sym] = await getattr(exchange, method)(sym)
             except Exception:
                 logger.exception(
-                    "Failed to close exchange connection for {}",
-                    self._exchange_id,
+                    "Failed to fetch {} for {} at {}", field, sym, self._exchange_id
+                )
+
+        async def _fetch_many(
+            field: str, method: str, bulk: Tuple[str, str], pending: List[str]
+        ) -> None:
+            if not pending:
+                return
+            bulk_feature, bulk_method = bulk
+            if has.get(bulk_feature) and len(pending) > 1:
+                try:
+                    async with semaphore:
+                        data = await getattr(exchange, bulk_method)(pending)
+                    results[field].update(
+                        (sym, data[sym]) for sym in pending if sym in (data or {})
+                    )
+                    return
+                except Exception as exc:
+                    logger.warning(
+                        "Bulk {} failed at {}, fetching per symbol: {}",
+                        bulk_feature,
+                        self._exchange_id,
+                        exc,
+                    )
+            await asyncio.gather(*(_fetch_one(field, method, sym) for sym in pending))
+
+        missing_prices = [sym for sym in ccxt_symbols if sym not in results["price"]]
+        tasks = [
+            asyncio.create_task(
+                _fetch_many(
+                    "price",
+                    "fetch_ticker",
+                    ("fetchTickers", "fetch_tickers"),
+                    missing_prices,
                 )
+            ),
+            asyncio.create_task(
+                _fetch_many(
+                    "open_interest",
+                    "fetch_open_interest",
+                    ("fetchOpenInterests", "fetch_open_interests"),
+                    ccxt_symbols,
+                )
+            ),
+            asyncio.create_task(
+                _fetch_many(
+                    "funding_rate",
+                    "fetch_funding_rate",
+                    ("fetchFundingRates", "fetch_funding_rates"),
+                    ccxt_symbols,
+                )
+            ),
+        ]
+        _, pending_tasks = await asyncio.wait(tasks, timeout=self._snapshot_timeout)
+        if pending_tasks:
+            logger.warning(
+                "Market snapshot at {} timed out after {}s; returning partial data",
+                self._exchange_id,
+                self._snapshot_timeout,
+            )
+            for task in pending_tasks:
+                task.cancel()
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+        # Symbols without a price are omitted, as before
+        snapshot: MarketSnapShotType = {}
+        for symbol, sym in requested.items():
+            if sym not in results["price"]:
+                continue
+            snapshot[symbol] = {
+                field: values[sym] for field, values in results.items() if sym in values
+            }
+        logger.debug(f"Fetch market snapshot for {ccxt_symbols} data: {snapshot}")
+        return snapshot
+
+
+class StreamingMarketDataSource(SimpleMarketDataSource):
+    """Serve candles and tickers from the shared websocket market data hub.
+
+    Every requested (symbol, interval) series and ticker is subscribed once
+    on the exchange's :class:`MarketDataHub` and then read from its in-memory
+    ring buffers. A series that is not live yet, stale or has a gap is
+    backfilled over REST and merged back into the hub, so the first cycle
+    behaves like :class:`SimpleMarketDataSource` and later ones skip the
+    round-trips. Open interest and funding rates still come from REST.
+    """
+
+    def __init__(
+        self,
+        exchange_id: Optional[str] = None,
+        pool: Optional[ExchangeSessionPool] = None,
+        hub: Optional[MarketDataHub] = None,
+        snapshot_timeout: float = DEFAULT_SNAPSHOT_TIMEOUT_SECONDS,
+    ) -> None:
+        super().__init__(exchange_id, pool, snapshot_timeout)
+        self._hub = hub
+        self._candle_subscriptions: Set[Tuple[str, str]] = set()
+        self._ticker_subscriptions: Set[str] = set()
+
+    def _get_hub(self) -> MarketDataHub:
+        if self._hub is None:
+            self._hub = get_market_data_hub(self._exchange_id)
+        return self._hub
+
+    async def _fetch_ohlcv(
+        self, lease: ExchangeLease, symbol: str, interval: str, lookback: int
+    ) -> List[list]:
+        hub = self._get_hub()
+        key = (symbol, interval)
+        try:
+            if key not in self._candle_subscriptions:
+                hub.subscribe_candles(symbol, interval)
+                self._candle_subscriptions.add(key)
+            rows = hub.recent_candles(symbol, interval, lookback)
+        except Exception as exc:
+            logger.warning(
+                "Candle stream unavailable for {} {} on {}: {}",
+                symbol,
+                interval,
+                self._exchange_id,
+                exc,
+            )
+            rows = None
+        if rows is not None:
+            return rows
+
+        rows = await super()._fetch_ohlcv(lease, symbol, interval, lookback)
+        if key in self._candle_subscriptions:
+            hub.store_candles(symbol, interval, rows)
+        return rows
+
+    def _cached_ticker(self, symbol: str) -> Optional[dict]:
+        hub = self._get_hub()
+        try:
+            if symbol not in self._ticker_subscriptions:
+                hub.subscribe_ticker(symbol)
+                self._ticker_subscriptions.add(symbol)
+            return hub.latest_ticker(symbol)
+        except Exception as exc:
+            logger.warning(
+                "Ticker stream unavailable for {} on {}: {}",
+                symbol,
+                self._exchange_id,
+                exc,
+            )
+            return None
 
-        return dict(snapshot)
+    async def close(self) -> None:
+        """Drop this source's hub subscriptions, then its exchange lease."""
+        if self._hub is not None:
+            for symbol, interval in self._candle_subscriptions:
+                await self._hub.unsubscribe_candles(symbol, interval)
+            for symbol in self._ticker_subscriptions:
+                await self._hub.unsubscribe_ticker(symbol)
+        self._candle_subscriptions.clear()
+        self._ticker_subscriptions.clear()
+        await super().close()
@@ -0,0 +1,290 @@
+"""Shared websocket market data with in-memory rolling candle stores.
+
+A :class:`MarketDataHub` subscribes once per (exchange, symbol, interval)
+through ccxt.pro ``watch_ohlcv`` / ``watch_ticker`` and keeps the newest
+candles of every series in a fixed-size ring buffer. Strategies watching the
+same symbols share the subscription, so a decision cycle reads candles from
+memory instead of re-downloading them over REST. Callers fall back to REST
+(and hand the result back via ``store_candles``) whenever a series is not
+live, is stale, or has a gap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .exchange_pool import (
+    MARKET_DATA_OPTIONS,
+    ExchangeLease,
+    ExchangeSessionPool,
+    get_exchange_pool,
+)
+
+# Candles kept per (symbol, interval) series
+DEFAULT_CANDLE_CAPACITY = 512
+# Streamed data older than this (or two candle intervals) is not served
+DEFAULT_MIN_STALENESS_SECONDS = 5.0
+# Upper bound of the reconnect backoff of a failing watcher
+DEFAULT_MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+# [ts, open, high, low, close, volume]
+OHLCVRow = List[Any]
+
+
+class _Stream:
+    """State shared by every subscriber of one watched series."""
+
+    def __init__(self) -> None:
+        self.refcount = 0
+        self.task: Optional[asyncio.Task] = None
+        self.live = False
+        self.updated_at = float("-inf")
+
+    def mark_updated(self) -> None:
+        self.live = True
+        self.updated_at = time.monotonic()
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.live and time.monotonic() - self.updated_at <= max_age
+
+
+class _CandleSeries(_Stream):
+    """Ring buffer of the newest candles of one symbol and interval."""
+
+    def __init__(self, interval_ms: int, capacity: int) -> None:
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.rows: Deque[OHLCVRow] = deque(maxlen=capacity)
+        # Rows up to this timestamp came from REST and may legitimately
+        # skip empty intervals; streamed rows after it must be contiguous.
+        self.backfilled_until = 0
+
+    def merge(self, rows: List[OHLCVRow]) -> None:
+        """Insert or update candles, keeping the buffer sorted by timestamp."""
+        for row in rows:
+            ts = int(row[0])
+            if not self.rows or ts > self.rows[-1][0]:
+                self.rows.append([ts, *row[1:6]])
+            elif ts == self.rows[-1][0]:
+                # The still-open candle is updated in place
+                self.rows[-1] = [ts, *row[1:6]]
+            else:
+                self._rebuild(rows)
+                return
+
+    def merge_tail(self, rows: List[OHLCVRow]) -> None:
+        """Merge only the rows not older than the newest buffered candle.
+
+        ccxt.pro returns its whole cached window on every update; skipping
+        the known prefix keeps each update O(1).
+        """
+        start = len(rows)
+        if self.rows:
+            last = self.rows[-1][0]
+            while start > 0 and rows[start - 1][0] >= last:
+                start -= 1
+        else:
+            start = 0
+        self.merge(rows[start:])
+
+    def _rebuild(self, rows: List[OHLCVRow]) -> None:
+        by_ts = {row[0]: row for row in self.rows}
+        for row in rows:
+            by_ts[int(row[0])] = [int(row[0]), *row[1:6]]
+        self.rows.clear()
+        self.rows.extend(by_ts[ts] for ts in sorted(by_ts))
+
+    def recent(self, lookback: int) -> Optional[List[OHLCVRow]]:
+        """The newest ``lookback`` candles, or None if they are incomplete."""
+        if lookback <= 0 or len(self.rows) < lookback:
+            return None
+        rows = list(self.rows)[-lookback:]
+        for prev, cur in zip(rows, rows[1:]):
+            if cur[0] > self.backfilled_until and cur[0] - prev[0] != self.interval_ms:
+                return None
+        return [list(row) for row in rows]
+
+
+class _TickerStream(_Stream):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ticker: Optional[Dict[str, Any]] = None
+
+
+class MarketDataHub:
+    """Websocket subscriptions and rolling market data of one exchange.
+
+    Subscriptions are reference counted: the watcher of a series starts with
+    its first subscriber and stops with its last one. The hub leases the
+    pooled exchange client while any subscription is active. Instances are
+    bound to one event loop; use :func:`get_market_data_hub`.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        pool: Optional[ExchangeSessionPool] = None,
+        capacity: int = DEFAULT_CANDLE_CAPACITY,
+        min_staleness: float = DEFAULT_MIN_STALENESS_SECONDS,
+    ) -> None:
+        self.exchange_id = exchange_id
+        self.capacity = max(1, capacity)
+        self._pool = pool
+        self._min_staleness = min_staleness
+        self._lease: Optional[ExchangeLease] = None
+        self._candles: Dict[Tuple[str, str], _CandleSeries] = {}
+        self._tickers: Dict[str, _TickerStream] = {}
+
+    # ---- subscriptions ----
+
+    def _exchange(self) -> Any:
+        if self._lease is None or self._lease.closed:
+            pool = self._pool or get_exchange_pool()
+            self._lease = pool.acquire(self.exchange_id, MARKET_DATA_OPTIONS)
+        return self._lease.exchange
+
+    def _supports(self, feature: str) -> bool:
+        has = getattr(self._exchange(), "has", None) or {}
+        return bool(has.get(feature))
+
+    def subscribe_candles(self, symbol: str, interval: str) -> None:
+        """Start (or join) the candle stream of ``symbol`` at ``interval``."""
+        key = (symbol, interval)
+        series = self._candles.get(key)
+        if series is None:
+            exchange = self._exchange()
+            interval_ms = int(exchange.parse_timeframe(interval) * 1000)
+            series = _CandleSeries(interval_ms, self.capacity)
+            self._candles[key] = series
+            if self._supports("watchOHLCV"):
+                series.task = asyncio.create_task(
+                    self._watch(series, self._watch_candles, symbol, interval)
+                )
+        series.refcount += 1
+
+    def subscribe_ticker(self, symbol: str) -> None:
+        """Start (or join) the ticker stream of ``symbol``."""
+        stream = self._tickers.get(symbol)
+        if stream is None:
+            stream = _TickerStream()
+            self._tickers[symbol] = stream
+            if self._supports("watchTicker"):
+                stream.task = asyncio.create_task(
+                    self._watch(stream, self._watch_ticker, symbol)
+                )
+        stream.refcount += 1
+
+    async def unsubscribe_candles(self, symbol: str, interval: str) -> None:
+        await self._release(self._candles, (symbol, interval))
+
+    async def unsubscribe_ticker(self, symbol: str) -> None:
+        await self._release(self._tickers, symbol)
+
+    async def _release(self, streams: Dict, key) -> None:
+        stream = streams.get(key)
+        if stream is None:
+            return
+        stream.refcount -= 1
+        if stream.refcount > 0:
+            return
+        del streams[key]
+        if stream.task is not None:
+            stream.task.cancel()
+            await asyncio.gather(stream.task, return_exceptions=True)
+        if not self._candles and not self._tickers and self._lease is not None:
+            lease, self._lease = self._lease, None
+            await lease.close()
+
+    async def close(self) -> None:
+        """Stop every watcher and release the exchange client."""
+        streams = list(self._candles.values()) + list(self._tickers.values())
+        self._candles.clear()
+        self._tickers.clear()
+        tasks = [s.task for s in streams if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._lease is not None:
+            lease, self._lease = self._lease, None
+            await lease.close()
+
+    # ---- reads ----
+
+    def _max_age(self, interval_ms: int = 0) -> float:
+        return max(self._min_staleness, 2 * interval_ms / 1000)
+
+    def recent_candles(
+        self, symbol: str, interval: str, lookback: int
+    ) -> Optional[List[OHLCVRow]]:
+        """Serve candles from memory when the live series covers ``lookback``."""
+        series = self._candles.get((symbol, interval))
+        if series is None or not series.is_fresh(self._max_age(series.interval_ms)):
+            return None
+        return series.recent(lookback)
+
+    def store_candles(self, symbol: str, interval: str, rows: List[OHLCVRow]) -> None:
+        """Merge REST-fetched candles into a subscribed series."""
+        series = self._candles.get((symbol, interval))
+        if series is None or not rows:
+            return
+        series.merge(rows)
+        series.backfilled_until = max(series.backfilled_until, int(rows[-1][0]))
+
+    def latest_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        stream = self._tickers.get(symbol)
+        if stream is None or not stream.is_fresh(self._max_age()):
+            return None
+        return stream.ticker
+
+    # ---- watchers ----
+
+    async def _watch(self, stream: _Stream, watch_once, *args) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await watch_once(stream, *args)
+                stream.mark_updated()
+                delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                stream.live = False
+                logger.warning(
+                    "Market data stream {} {} on {} failed, retrying in {}s: {}",
+                    watch_once.__name__,
+                    args,
+                    self.exchange_id,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, DEFAULT_MAX_RECONNECT_DELAY_SECONDS)
+
+    async def _watch_candles(
+        self, series: _CandleSeries, symbol: str, interval: str
+    ) -> None:
+        rows = await self._exchange().watch_ohlcv(symbol, timeframe=interval)
+        series.merge_tail(rows or [])
+
+    async def _watch_ticker(self, stream: _TickerStream, symbol: str) -> None:
+        stream.ticker = await self._exchange().watch_ticker(symbol)
+
+
+# event loop -> exchange id -> hub
+_HUBS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, MarketDataHub]]" = weakref.WeakKeyDictionary()
+
+
+def get_market_data_hub(exchange_id: str) -> MarketDataHub:
+    """Return the shared hub of ``exchange_id`` on the running event loop."""
+    hubs = _HUBS.setdefault(asyncio.get_running_loop(), {})
+    hub = hubs.get(exchange_id)
+    if hub is None:
+        hub = MarketDataHub(exchange_id)
+        hubs[exchange_id] = hub
+    return hub
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-from typing import Dict
+from typing import Dict, Optional
 
 from agno.agent import Agent as AgnoAgent
 from loguru import logger
@@ -9,6 +8,7 @@ from loguru import logger
 from valuecell.utils import env as env_utils
 from valuecell.utils import model as model_utils
 
+from ...constants import FEATURE_GROUP_BY_KEY, FEATURE_GROUP_BY_MARKET_SNAPSHOT
 from ...models import (
     ComposeContext,
     ComposeResult,
@@ -18,11 +18,10 @@ from ...models import (
 )
 from ...utils import (
     extract_market_section,
-    group_features,
-    prune_none,
     send_discord_message,
 )
 from ..interfaces import BaseComposer
+from .prompt_context import PromptContextBuilder
 from .system_prompt import SYSTEM_PROMPT
 
 
@@ -48,8 +47,14 @@ class LlmComposer(BaseComposer):
         *,
         default_slippage_bps: int = 25,
         quantity_precision: float = 1e-9,
+        prompt_builder: Optional[PromptContextBuilder] = None,
     ) -> None:
         self._request = request
+        trading_config = request.trading_config
+        self._prompt_builder = prompt_builder or PromptContextBuilder(
+            delta_features=trading_config.delta_features,
+            keyframe_interval=trading_config.feature_keyframe_interval,
+        )
         self._default_slippage_bps = default_slippage_bps
         self._quantity_precision = quantity_precision
         cfg = self._request.llm_model_config
@@ -135,19 +140,27 @@ class LlmComposer(BaseComposer):
     def _build_llm_prompt(self, context: ComposeContext) -> str:
         """Build structured prompt for LLM decision-making.
 
-        Produces a compact JSON with:
+        The prompt opens with a stable prefix (instructions, strategy prompt,
+        constraints) so provider-side prompt caching can reuse it, followed
+        by a compact JSON Context with:
         - summary: portfolio metrics + risk signals
         - market: compacted price/OI/funding data
-        - features: organized by interval (1m structural, 1s realtime)
-        - portfolio: current positions
-        - digest: per-symbol historical performance
+        - positions: current positions
+        - features: columnar per group (1m structural, 1s realtime), rounded
+          by the prompt builder and optionally delta-encoded
         """
         pv = context.portfolio
 
         # Build components
         summary = self._build_summary(context)
-        features = group_features(context.features)
-        market = extract_market_section(features.get("market_snapshot", []))
+        market = extract_market_section(
+            [
+                fv.model_dump(mode="json")
+                for fv in context.features
+                if (fv.meta or {}).get(FEATURE_GROUP_BY_KEY)
+                == FEATURE_GROUP_BY_MARKET_SNAPSHOT
+            ]
+        )
 
         # Portfolio positions
         positions = [
@@ -168,17 +181,6 @@ class LlmComposer(BaseComposer):
             else {}
         )
 
-        payload = prune_none(
-            {
-                "strategy_prompt": self._build_prompt_text(),
-                "summary": summary,
-                "market": market,
-                "features": features,
-                "positions": positions,
-                "constraints": constraints,
-            }
-        )
-
         instructions = (
             "Read Context and decide. "
             "features.1m = structural trends (240 periods), features.1s = realtime signals (180 periods). "
@@ -189,7 +191,17 @@ class LlmComposer(BaseComposer):
             "Output JSON with items array."
         )
 
-        return f"{instructions}\n\nContext:\n{json.dumps(payload, ensure_ascii=False)}"
+        return self._prompt_builder.build(
+            instructions=instructions,
+            strategy_prompt=self._build_prompt_text(),
+            constraints=constraints,
+            features=context.features,
+            context={
+                "summary": summary,
+                "market": market,
+                "positions": positions,
+            },
+        )
 
     async def _call_llm(self, prompt: str) -> TradePlanProposal:
         """Invoke an LLM asynchronously and parse the response into LlmPlanProposal.
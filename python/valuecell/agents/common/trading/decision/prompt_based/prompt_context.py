@@ -0,0 +1,280 @@
+"""Compact, cache-friendly prompt layout for the LLM composer.
+
+The prompt starts with a prefix that only changes when the strategy changes
+(instructions, strategy prompt, constraints), so providers that cache prompt
+prefixes can reuse it across cycles. Features are encoded column-wise per
+group. Feature and market values are rounded to a fixed number of
+significant digits; portfolio amounts (cash, PnL, quantities, constraints)
+keep a fixed number of decimal places so large balances stay exact.
+
+With ``delta_features`` enabled a full feature *keyframe* is appended to the
+prefix and refreshed every ``keyframe_interval`` cycles; each cycle then only
+lists the values that changed since the keyframe. The model stays stateless:
+every prompt carries the keyframe plus the changes.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...constants import DEFAULT_FEATURE_KEYFRAME_INTERVAL, FEATURE_GROUP_BY_KEY
+from ...models import FeatureVector
+from ...utils import prune_none
+
+# Significant digits kept for feature and market values
+DEFAULT_SIGNIFICANT_DIGITS = 6
+# Decimal places kept for portfolio amounts (cash, PnL, quantities)
+DEFAULT_DECIMAL_PLACES = 8
+# Context sections holding market data, rounded to significant digits
+_MARKET_SECTIONS = frozenset({"market"})
+
+# group -> {"cols": [...], "rows": {symbol: [...]}}
+EncodedFeatures = Dict[str, Dict[str, Any]]
+
+_FEATURES_HINT = (
+    "Each features.<group> is columnar: 'cols' names the values and "
+    "'rows' maps symbol -> values in 'cols' order; 'ts' is the newest "
+    "feature timestamp (ms). "
+)
+_DELTA_HINT = (
+    "Keyframe holds the full features as of 'ts'; Context.features lists only "
+    "values that changed since the keyframe (null = unchanged, missing "
+    "symbol = unchanged). "
+)
+
+
+def _compact(rounded: float) -> Any:
+    return int(rounded) if rounded.is_integer() and abs(rounded) < 1e15 else rounded
+
+
+def quantize(value: Any, digits: int = DEFAULT_SIGNIFICANT_DIGITS) -> Any:
+    """Round floats (recursively) to ``digits`` significant digits."""
+    if isinstance(value, float):
+        if value == 0.0 or not math.isfinite(value):
+            return value
+        return _compact(
+            round(value, digits - 1 - int(math.floor(math.log10(abs(value)))))
+        )
+    if isinstance(value, dict):
+        return {k: quantize(v, digits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [quantize(v, digits) for v in value]
+    return value
+
+
+def round_decimals(value: Any, places: int = DEFAULT_DECIMAL_PLACES) -> Any:
+    """Round floats (recursively) to ``places`` decimal places.
+
+    Unlike :func:`quantize` this keeps every digit left of the decimal
+    point, so money and quantities are never coarsened.
+    """
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return value
+        return _compact(round(value, places))
+    if isinstance(value, dict):
+        return {k: round_decimals(v, places) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_decimals(v, places) for v in value]
+    return value
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_features(
+    features: List[FeatureVector], digits: int = DEFAULT_SIGNIFICANT_DIGITS
+) -> EncodedFeatures:
+    """Encode feature vectors column-wise per group, dropping empty values."""
+    groups: Dict[str, List[FeatureVector]] = {}
+    for fv in features:
+        group = (fv.meta or {}).get(FEATURE_GROUP_BY_KEY)
+        if group:
+            groups.setdefault(str(group), []).append(fv)
+
+    encoded: EncodedFeatures = {}
+    for group, items in groups.items():
+        cols: List[str] = []
+        for fv in items:
+            cols.extend(k for k, v in fv.values.items() if v is not None)
+        cols = list(dict.fromkeys(cols))
+        if not cols:
+            continue
+        rows = {
+            fv.instrument.symbol: [quantize(fv.values.get(col), digits) for col in cols]
+            for fv in items
+        }
+        encoded[group] = {
+            "ts": max(fv.ts for fv in items),
+            "cols": cols,
+            "rows": rows,
+        }
+    return encoded
+
+
+def diff_features(base: EncodedFeatures, current: EncodedFeatures) -> EncodedFeatures:
+    """Values of ``current`` that differ from ``base``, in the same layout."""
+    delta: EncodedFeatures = {}
+    for group, block in current.items():
+        base_block = base.get(group) or {}
+        base_cols = base_block.get("cols") or []
+        base_rows = base_block.get("rows") or {}
+        changed: Dict[str, Dict[str, Any]] = {}
+        for symbol, values in block["rows"].items():
+            previous = dict(zip(base_cols, base_rows.get(symbol) or []))
+            diff = {
+                col: value
+                for col, value in zip(block["cols"], values)
+                if col not in previous or previous[col] != value
+            }
+            if diff:
+                changed[symbol] = diff
+        if not changed:
+            continue
+        cols = list(dict.fromkeys(col for diff in changed.values() for col in diff))
+        delta[group] = {
+            "ts": block["ts"],
+            "cols": cols,
+            "rows": {
+                symbol: [diff.get(col) for col in cols]
+                for symbol, diff in changed.items()
+            },
+        }
+    return delta
+
+
+def has_cleared_values(base: EncodedFeatures, current: EncodedFeatures) -> bool:
+    """Whether a value of ``base`` is gone from ``current``.
+
+    Deltas use null for "unchanged", so a value that became None, or a
+    column that disappeared, cannot be expressed as a delta.
+    """
+    for group, base_block in base.items():
+        block = current.get(group)
+        if block is None:
+            continue
+        cols = block["cols"]
+        for symbol, base_values in base_block["rows"].items():
+            current_values = dict(zip(cols, block["rows"].get(symbol) or []))
+            for col, value in zip(base_block["cols"], base_values):
+                if value is not None and current_values.get(col) is None:
+                    return True
+    return False
+
+
+def _row_keys(encoded: EncodedFeatures) -> set:
+    return {
+        (group, symbol) for group, block in encoded.items() for symbol in block["rows"]
+    }
+
+
+class PromptContextBuilder:
+    """Lay out composer prompts with a stable prefix and compact features.
+
+    Instances hold the feature keyframe between cycles, so use one builder
+    per strategy.
+    """
+
+    def __init__(
+        self,
+        *,
+        significant_digits: int = DEFAULT_SIGNIFICANT_DIGITS,
+        decimal_places: int = DEFAULT_DECIMAL_PLACES,
+        delta_features: bool = False,
+        keyframe_interval: int = DEFAULT_FEATURE_KEYFRAME_INTERVAL,
+    ) -> None:
+        self._digits = max(1, significant_digits)
+        self._places = max(0, decimal_places)
+        self._delta_features = delta_features
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._keyframe: Optional[EncodedFeatures] = None
+        self._keyframe_text = ""
+        self._keyframe_age = 0
+
+    def reset(self) -> None:
+        """Drop the keyframe; the next prompt carries full features again."""
+        self._keyframe = None
+        self._keyframe_text = ""
+        self._keyframe_age = 0
+
+    def stable_prefix(
+        self, instructions: str, strategy_prompt: str, constraints: Dict
+    ) -> str:
+        """Prompt part that stays byte-identical while the strategy is unchanged."""
+        hints = _FEATURES_HINT + (_DELTA_HINT if self._delta_features else "")
+        sections = [
+            f"{instructions} {hints}".strip(),
+            f"Strategy:\n{strategy_prompt}",
+        ]
+        if constraints:
+            sections.append(
+                f"Constraints:\n{_dumps(round_decimals(constraints, self._places))}"
+            )
+        return "\n\n".join(sections)
+
+    def _features_section(self, encoded: EncodedFeatures) -> Tuple[str, Any]:
+        """Keyframe text for the prefix and the features for the context."""
+        if not self._delta_features:
+            return "", encoded
+
+        stale = (
+            self._keyframe is None
+            or self._keyframe_age >= self._keyframe_interval
+            or _row_keys(encoded) != _row_keys(self._keyframe)
+            or has_cleared_values(self._keyframe, encoded)
+        )
+        delta = {} if stale else diff_features(self._keyframe, encoded)
+        # A delta as large as the full features buys nothing: refresh instead
+        if not stale and len(_dumps(delta)) * 2 > len(_dumps(encoded)):
+            stale = True
+        if stale:
+            self._keyframe = encoded
+            self._keyframe_text = f"Keyframe:\n{_dumps(encoded)}"
+            self._keyframe_age = 0
+            delta = {}
+        self._keyframe_age += 1
+        return self._keyframe_text, delta
+
+    def build(
+        self,
+        *,
+        instructions: str,
+        strategy_prompt: str,
+        constraints: Dict,
+        features: List[FeatureVector],
+        context: Dict[str, Any],
+    ) -> str:
+        """Render the prompt for one cycle.
+
+        Args:
+            instructions: static decision instructions
+            strategy_prompt: resolved strategy prompt text
+            constraints: portfolio constraints
+            features: feature vectors of this cycle
+            context: per-cycle sections (summary, market, positions, ...);
+                market data is rounded to significant digits, the other
+                sections to decimal places
+        """
+        encoded = encode_features(features, self._digits)
+        keyframe, features_payload = self._features_section(encoded)
+
+        prefix = self.stable_prefix(instructions, strategy_prompt, constraints)
+        if keyframe:
+            prefix = f"{prefix}\n\n{keyframe}"
+        # Features are positional: nulls stay in place, only empty groups go
+        payload = prune_none(
+            {
+                key: (
+                    quantize(value, self._digits)
+                    if key in _MARKET_SECTIONS
+                    else round_decimals(value, self._places)
+                )
+                for key, value in context.items()
+            }
+        )
+        if features_payload:
+            payload["features"] = features_payload
+        return f"{prefix}\n\nContext:\n{_dumps(payload)}"
@@ -0,0 +1,212 @@
+"""
+Unit tests for valuecell.agents.common.trading.decision.prompt_based.prompt_context
+"""
+
+import json
+import math
+from types import SimpleNamespace
+
+from valuecell.agents.common.trading.constants import FEATURE_GROUP_BY_KEY
+from valuecell.agents.common.trading.decision.prompt_based import (
+    composer as composer_mod,
+)
+from valuecell.agents.common.trading.decision.prompt_based.prompt_context import (
+    PromptContextBuilder,
+    diff_features,
+    encode_features,
+    has_cleared_values,
+    quantize,
+    round_decimals,
+)
+from valuecell.agents.common.trading.models import (
+    FeatureVector,
+    InstrumentRef,
+    LLMModelConfig,
+    TradingConfig,
+    UserRequest,
+)
+
+
+def _fv(symbol: str, group: str = "interval_1m", ts: int = 1, **values):
+    return FeatureVector(
+        ts=ts,
+        instrument=InstrumentRef(symbol=symbol),
+        values=values,
+        meta={FEATURE_GROUP_BY_KEY: group},
+    )
+
+
+def _context(prompt: str) -> dict:
+    return json.loads(prompt.split("Context:\n", 1)[1])
+
+
+def _build(builder: PromptContextBuilder, features, context=None) -> str:
+    return builder.build(
+        instructions="Decide.",
+        strategy_prompt="Trade BTC.",
+        constraints={"max_leverage": 10.0},
+        features=features,
+        context=context or {},
+    )
+
+
+def test_quantize_rounds_to_significant_digits():
+    assert quantize(1234567.89) == 1234570
+    assert quantize(0.000123456789) == 0.000123457
+    assert quantize(3.0) == 3
+    assert quantize({"a": [1.23456789, "x", None]}) == {"a": [1.23457, "x", None]}
+    assert quantize(0.0) == 0.0
+    assert math.isnan(quantize(float("nan")))
+
+
+def test_round_decimals_keeps_large_amounts_exact():
+    assert round_decimals(1234567.89) == 1234567.89
+    assert round_decimals(0.1 + 0.2) == 0.3
+    assert round_decimals(0.123456789123) == 0.12345679
+    assert round_decimals({"qty": [2.0, 0.000000001]}) == {"qty": [2, 0]}
+
+
+def test_encode_features_is_columnar_per_group():
+    encoded = encode_features(
+        [
+            _fv("BTC", ts=5, close=101.123456789),
+            _fv("ETH", ts=7, close=2.5, rsi=40.0),
+            _fv("BTC", group="interval_1s", close=101.0),
+            # Vectors without a group are left out
+            FeatureVector(ts=1, instrument=InstrumentRef(symbol="X"), values={}),
+        ]
+    )
+
+    assert set(encoded) == {"interval_1m", "interval_1s"}
+    block = encoded["interval_1m"]
+    assert block["ts"] == 7
+    assert block["cols"] == ["close", "rsi"]
+    # Values stay positional: a missing value is a null in its column
+    assert block["rows"] == {"BTC": [101.123, None], "ETH": [2.5, 40]}
+
+
+def test_diff_features_lists_only_changed_values():
+    base = encode_features([_fv("BTC", close=1.0, rsi=50.0), _fv("ETH", close=2.0)])
+    current = encode_features(
+        [_fv("BTC", ts=2, close=1.5, rsi=50.0), _fv("ETH", ts=2, close=2.0)]
+    )
+
+    assert diff_features(base, current) == {
+        "interval_1m": {"ts": 2, "cols": ["close"], "rows": {"BTC": [1.5]}}
+    }
+    assert diff_features(current, current) == {}
+
+
+def test_has_cleared_values():
+    base = encode_features([_fv("BTC", close=1.0, rsi=50.0)])
+
+    assert not has_cleared_values(base, base)
+    # A value gone from a row that still has the column ...
+    assert has_cleared_values(
+        base,
+        encode_features([_fv("BTC", close=1.0), _fv("ETH", close=2.0, rsi=40.0)]),
+    )
+    # ... or a column gone altogether
+    assert has_cleared_values(base, encode_features([_fv("BTC", close=1.0)]))
+
+
+def test_build_rounds_market_data_but_not_portfolio_amounts():
+    prompt = _build(
+        PromptContextBuilder(),
+        [],
+        {
+            "summary": {"free_cash": 1234567.89, "unrealized_pnl": None},
+            "market": {"BTC": {"price": 65432.123456}},
+            "positions": [{"symbol": "BTC", "qty": 0.123456789}],
+        },
+    )
+
+    assert _context(prompt) == {
+        "summary": {"free_cash": 1234567.89},
+        "market": {"BTC": {"price": 65432.1}},
+        "positions": [{"symbol": "BTC", "qty": 0.12345679}],
+    }
+    assert 'Constraints:\n{"max_leverage":10}' in prompt
+
+
+def test_full_features_without_delta_mode():
+    builder = PromptContextBuilder()
+    features = [_fv("BTC", close=1.0)]
+
+    for _ in range(2):
+        prompt = _build(builder, features)
+        assert "Keyframe:" not in prompt
+        assert _context(prompt)["features"]["interval_1m"]["rows"] == {"BTC": [1]}
+
+
+def test_delta_mode_sends_changes_against_a_refreshed_keyframe():
+    builder = PromptContextBuilder(delta_features=True, keyframe_interval=3)
+    values = dict(rsi=50.0, ema_12=99.0, ema_26=98.0, macd=1.0)
+    features = [
+        _fv(symbol, close=100.0 + i, **values)
+        for i, symbol in enumerate(["BTC", "ETH", "SOL", "BNB"])
+    ]
+
+    first = _build(builder, features)
+    prefix = first.split("Context:\n", 1)[0]
+    assert "Keyframe:" in prefix
+    assert "features" not in _context(first)
+
+    features[0] = _fv("BTC", close=100.5, **values)
+    second = _build(builder, features)
+    # Same prefix, so provider prompt caches keep hitting
+    assert second.startswith(prefix)
+    assert _context(second)["features"] == {
+        "interval_1m": {"ts": 1, "cols": ["close"], "rows": {"BTC": [100.5]}}
+    }
+
+    _build(builder, features)
+    # The keyframe is refreshed every keyframe_interval cycles
+    fourth = _build(builder, features)
+    assert not fourth.startswith(prefix)
+    assert '"BTC":[100.5,' in fourth.split("Context:\n", 1)[0]
+    assert "features" not in _context(fourth)
+
+
+def test_delta_mode_refreshes_when_a_delta_cannot_express_the_change():
+    builder = PromptContextBuilder(delta_features=True)
+    _build(builder, [_fv("BTC", close=1.0, rsi=50.0)])
+
+    # A value that disappeared cannot be sent as a delta (null = unchanged)
+    cleared = _build(builder, [_fv("BTC", close=1.0)])
+    assert '"cols":["close"],"rows":{"BTC":[1]}' in cleared.split("Context:\n", 1)[0]
+
+    # Nor can a new symbol
+    added = _build(builder, [_fv("BTC", close=1.0), _fv("ETH", close=2.0)])
+    assert '"ETH":[2]' in added.split("Context:\n", 1)[0]
+
+    builder.reset()
+    assert "Keyframe:" in _build(builder, [_fv("BTC", close=1.0)])
+
+
+def test_composer_builds_prompts_per_strategy_config(monkeypatch):
+    monkeypatch.setattr(
+        composer_mod.model_utils, "create_model_with_provider", lambda **_: object()
+    )
+    monkeypatch.setattr(
+        composer_mod.model_utils, "model_should_use_json_mode", lambda _: False
+    )
+    monkeypatch.setattr(
+        composer_mod, "AgnoAgent", lambda **kwargs: SimpleNamespace(**kwargs)
+    )
+
+    def request(**trading) -> UserRequest:
+        return UserRequest(
+            llm_model_config=LLMModelConfig(
+                provider="openai", model_id="gpt", api_key="key"
+            ),
+            trading_config=TradingConfig(symbols=["BTC-USD"], **trading),
+        )
+
+    builder = composer_mod.LlmComposer(
+        request(delta_features=True, feature_keyframe_interval=4)
+    )._prompt_builder
+    assert builder._delta_features is True
+    assert builder._keyframe_interval == 4
+
+    assert composer_mod.LlmComposer(request())._prompt_builder._delta_features is False
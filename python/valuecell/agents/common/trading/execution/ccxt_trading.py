@@ -10,7 +10,7 @@ Supports:
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import ccxt.async_support as ccxt
 from loguru import logger
@@ -25,8 +25,75 @@ from valuecell.agents.common.trading.models import (
     derive_side_from_action,
 )
 
+from ..markets_cache import MarketsCache, get_markets_cache
 from .interfaces import BaseExecutionGateway
 
+# Orders in flight at once across symbols (further capped by the rate limit)
+DEFAULT_MAX_CONCURRENT_ORDERS = 4
+
+# Actions that only reduce exposure; they run before any opening order
+_REDUCING_ACTIONS = ("close_long", "close_short")
+
+
+def _instruction_action(inst: TradeInstruction) -> str:
+    """High-level action of an instruction (structured field, then meta)."""
+    return (inst.action.value if getattr(inst, "action", None) else None) or str(
+        (inst.meta or {}).get("action") or ""
+    ).lower()
+
+
+class _MarginLedger:
+    """Free USDT shared by the opening orders of one ``execute`` phase.
+
+    The balance is fetched once; each order reserves its estimated margin
+    under the lock before it is submitted, so orders running concurrently
+    cannot all pass the precheck against the same free balance.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._free: Optional[float] = None
+
+    async def reserve(
+        self,
+        required: float,
+        fetch_free: Callable[[], Awaitable[Optional[float]]],
+    ) -> Tuple[bool, Optional[float]]:
+        """Reserve ``required`` USDT.
+
+        Returns whether it fits and the free balance it was checked against
+        (None when the balance is unknown, in which case the order proceeds).
+        """
+        async with self._lock:
+            if self._free is None:
+                self._free = await fetch_free()
+            free = self._free
+            if free is None:
+                return True, None
+            if free < required:
+                return False, free
+            self._free = free - required
+            return True, free
+
+    def release(self, amount: float) -> None:
+        """Return a reservation whose order was not placed."""
+        if self._free is not None:
+            self._free += amount
+
+
+class _MarginReservation:
+    """Margin one order holds in a ledger until the order is placed."""
+
+    def __init__(self, ledger: _MarginLedger) -> None:
+        self.ledger = ledger
+        self.amount = 0.0
+        self.placed = False
+
+    def release_unless_placed(self) -> None:
+        if not self.placed and self.amount:
+            self.ledger.release(self.amount)
+            self.amount = 0.0
+
 
 class CCXTExecutionGateway(BaseExecutionGateway):
     """Async execution gateway using CCXT unified API for real exchanges.
@@ -52,6 +119,8 @@ class CCXTExecutionGateway(BaseExecutionGateway):
         margin_mode: str = "cross",
         position_mode: str = "oneway",
         ccxt_options: Optional[Dict] = None,
+        max_concurrent_orders: int = DEFAULT_MAX_CONCURRENT_ORDERS,
+        markets_cache: Optional[MarketsCache] = None,
     ) -> None:
         """Initialize CCXT exchange gateway.
 
@@ -67,6 +136,10 @@ class CCXTExecutionGateway(BaseExecutionGateway):
             margin_mode: Default margin mode ('isolated' or 'cross')
             position_mode: Position mode ('oneway' or 'hedged'), default 'oneway'
             ccxt_options: Additional CCXT exchange options
+            max_concurrent_orders: Upper bound of instructions executed
+                concurrently (different symbols only)
+            markets_cache: On-disk market metadata cache (default: the
+                process-wide one)
         """
         self.exchange_id = exchange_id.lower()
         self.api_key = api_key
@@ -79,6 +152,8 @@ class CCXTExecutionGateway(BaseExecutionGateway):
         self.margin_mode = margin_mode
         self.position_mode = position_mode
         self._ccxt_options = ccxt_options or {}
+        self._max_concurrent_orders = max(1, max_concurrent_orders)
+        self._markets_cache = markets_cache
 
         # Track leverage settings per symbol to avoid redundant calls
         self._leverage_cache: Dict[str, float] = {}
@@ -157,9 +232,9 @@ class CCXTExecutionGateway(BaseExecutionGateway):
                 f"⚠️ Could not set position mode ({self.position_mode}) on {self.exchange_id}: {e}"
             )
 
-        # Load markets
+        # Load markets, from the on-disk cache when possible
         try:
-            await self._exchange.load_markets()
+            await (self._markets_cache or get_markets_cache()).load(self._exchange)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to load markets for {self.exchange_id}: {e}"
@@ -733,6 +808,13 @@ class CCXTExecutionGateway(BaseExecutionGateway):
     ) -> List[TxResult]:
         """Execute trade instructions on the real exchange via CCXT.
 
+        Closing instructions run first, then the rest. Within each phase,
+        different symbols are submitted concurrently (bounded by
+        ``_order_budget``) while instructions of the same symbol keep their
+        order. Opening orders reserve their estimated margin against one
+        free-balance reading per phase before they are submitted. Results
+        are returned in instruction order.
+
         Args:
             instructions: List of trade instructions to execute
             market_features: Optional market features (not used for real execution)
@@ -748,57 +830,107 @@ class CCXTExecutionGateway(BaseExecutionGateway):
             f"💰 CCXTExecutionGateway: Executing {len(instructions)} instructions"
         )
         exchange = await self._get_exchange()
-        results: List[TxResult] = []
+        results: List[Optional[TxResult]] = [None] * len(instructions)
+        budget = asyncio.Semaphore(self._order_budget(exchange))
+
+        async def _run_symbol(indexes: List[int], margin: _MarginLedger) -> None:
+            # Instructions of one symbol keep their order
+            for index in indexes:
+                async with budget:
+                    results[index] = await self._execute_guarded(
+                        instructions[index], exchange, margin
+                    )
 
-        for inst in instructions:
-            side = (
-                getattr(inst, "side", None)
-                or derive_side_from_action(getattr(inst, "action", None))
-                or TradeSide.BUY
+        # Reducing orders first so the margin they free is available to opens,
+        # then everything else; symbols within a phase run concurrently.
+        reducing = [
+            i
+            for i, inst in enumerate(instructions)
+            if _instruction_action(inst) in _REDUCING_ACTIONS
+        ]
+        reducing_set = set(reducing)
+        others = [i for i in range(len(instructions)) if i not in reducing_set]
+        for phase in (reducing, others):
+            by_symbol: Dict[str, List[int]] = {}
+            for index in phase:
+                symbol = instructions[index].instrument.symbol
+                by_symbol.setdefault(symbol, []).append(index)
+            # Balance is read after the previous phase freed its margin
+            margin = _MarginLedger()
+            await asyncio.gather(
+                *(_run_symbol(ix, margin) for ix in by_symbol.values())
             )
-            logger.info(
-                f"  📤 Processing {inst.instrument.symbol} {side.value} qty={inst.quantity}"
-            )
-            try:
-                result = await self._execute_single(inst, exchange)
-                results.append(result)
-            except Exception as e:
-                # Create error result for failed instruction
-                results.append(
-                    TxResult(
-                        instruction_id=inst.instruction_id,
-                        instrument=inst.instrument,
-                        side=side,
-                        requested_qty=float(inst.quantity),
-                        filled_qty=0.0,
-                        status=TxStatus.ERROR,
-                        reason=str(e),
-                        meta=inst.meta,
-                    )
-                )
 
-        return results
+        return [result for result in results if result is not None]
+
+    def _order_budget(self, exchange: ccxt.Exchange) -> int:
+        """Concurrent orders allowed, bounded by the exchange's request rate.
+
+        ccxt throttles each request by ``rateLimit`` (ms between requests);
+        allowing more orders in flight than requests per second would only
+        queue them inside the throttler.
+        """
+        budget = self._max_concurrent_orders
+        try:
+            rate_limit_ms = float(getattr(exchange, "rateLimit", 0) or 0)
+        except (TypeError, ValueError):
+            rate_limit_ms = 0.0
+        if rate_limit_ms > 0:
+            budget = min(budget, max(1, int(1000 // rate_limit_ms)))
+        return budget
+
+    async def _execute_guarded(
+        self,
+        inst: TradeInstruction,
+        exchange: ccxt.Exchange,
+        margin: Optional[_MarginLedger] = None,
+    ) -> TxResult:
+        """Execute one instruction, turning failures into an ERROR result."""
+        side = (
+            getattr(inst, "side", None)
+            or derive_side_from_action(getattr(inst, "action", None))
+            or TradeSide.BUY
+        )
+        logger.info(
+            f"  📤 Processing {inst.instrument.symbol} {side.value} qty={inst.quantity}"
+        )
+        try:
+            return await self._execute_single(inst, exchange, margin)
+        except Exception as e:
+            # Create error result for failed instruction
+            return TxResult(
+                instruction_id=inst.instruction_id,
+                instrument=inst.instrument,
+                side=side,
+                requested_qty=float(inst.quantity),
+                filled_qty=0.0,
+                status=TxStatus.ERROR,
+                reason=str(e),
+                meta=inst.meta,
+            )
 
     async def _execute_single(
-        self, inst: TradeInstruction, exchange: ccxt.Exchange
+        self,
+        inst: TradeInstruction,
+        exchange: ccxt.Exchange,
+        margin: Optional[_MarginLedger] = None,
     ) -> TxResult:
         """Execute a single trade instruction.
 
         Args:
             inst: Trade instruction to execute
             exchange: CCXT exchange instance
+            margin: Free-margin ledger shared with concurrent orders
 
         Returns:
             Transaction result with execution details
         """
         # Dispatch by high-level action if provided (prefer structured field)
-        action = (inst.action.value if getattr(inst, "action", None) else None) or str(
-            (inst.meta or {}).get("action") or ""
-        ).lower()
+        action = _instruction_action(inst)
         if action == "open_long":
-            return await self._exec_open_long(inst, exchange)
+            return await self._exec_open_long(inst, exchange, margin)
         if action == "open_short":
-            return await self._exec_open_short(inst, exchange)
+            return await self._exec_open_short(inst, exchange, margin)
         if action == "close_long":
             return await self._exec_close_long(inst, exchange)
         if action == "close_short":
@@ -807,7 +939,7 @@ class CCXTExecutionGateway(BaseExecutionGateway):
             return await self._exec_noop(inst)
 
         # Fallback to generic submission
-        return await self._submit_order(inst, exchange)
+        return await self._submit_order(inst, exchange, margin=margin)
 
     def _apply_exchange_specific_precision(
         self, symbol: str, amount: float, price: float | None, exchange: ccxt.Exchange
@@ -859,7 +991,25 @@ class CCXTExecutionGateway(BaseExecutionGateway):
         inst: TradeInstruction,
         exchange: ccxt.Exchange,
         params_override: Optional[Dict] = None,
+        margin: Optional[_MarginLedger] = None,
     ) -> TxResult:
+        # Margin reserved by the precheck goes back to the ledger unless the
+        # order is placed, whatever ends the attempt (error, cancellation)
+        reservation = _MarginReservation(margin or _MarginLedger())
+        try:
+            return await self._place_order(inst, exchange, reservation, params_override)
+        finally:
+            reservation.release_unless_placed()
+
+    async def _place_order(
+        self,
+        inst: TradeInstruction,
+        exchange: ccxt.Exchange,
+        reservation: _MarginReservation,
+        params_override: Optional[Dict] = None,
+    ) -> TxResult:
+        margin = reservation.ledger
+
         # Normalize symbol for CCXT
         symbol = self._normalize_symbol(inst.instrument.symbol)
 
@@ -891,9 +1041,7 @@ class CCXTExecutionGateway(BaseExecutionGateway):
 
         # Setup leverage and margin mode only for opening positions
         # For closing positions (reduceOnly), skip these as they are not needed
-        action = (inst.action.value if getattr(inst, "action", None) else None) or str(
-            (inst.meta or {}).get("action") or ""
-        ).lower()
+        action = _instruction_action(inst)
         is_opening = action in ("open_long", "open_short")
 
         if is_opening:
@@ -980,12 +1128,16 @@ class CCXTExecutionGateway(BaseExecutionGateway):
                     required = await self._estimate_required_margin_okx(
                         symbol, amount, price, inst.leverage, exchange
                     )
-                    free_usdt = await self._get_free_usdt_okx(exchange)
-                    if (
-                        required is not None
-                        and free_usdt is not None
-                        and free_usdt < required
-                    ):
+                    fits, free_usdt = (
+                        await margin.reserve(
+                            required, lambda: self._get_free_usdt_okx(exchange)
+                        )
+                        if required is not None
+                        else (True, None)
+                    )
+                    if fits and required is not None:
+                        reservation.amount = required
+                    if not fits:
                         reject_reason = f"insufficient_margin:need~{required:.6f}USDT,free~{free_usdt:.6f}USDT"
                         logger.warning(f"  🚫 Skipping order due to {reject_reason}")
                         return TxResult(
@@ -1021,12 +1173,17 @@ class CCXTExecutionGateway(BaseExecutionGateway):
                         required = await self._estimate_required_margin_binance_linear(
                             symbol, amount, price, inst.leverage, exchange
                         )
-                        free_usdt = await self._get_free_usdt_binance(exchange)
-                        if (
-                            required is not None
-                            and free_usdt is not None
-                            and free_usdt < required
-                        ):
+                        fits, free_usdt = (
+                            await margin.reserve(
+                                required,
+                                lambda: self._get_free_usdt_binance(exchange),
+                            )
+                            if required is not None
+                            else (True, None)
+                        )
+                        if fits and required is not None:
+                            reservation.amount = required
+                        if not fits:
                             reject_reason = f"insufficient_margin_binance_usdtm:need~{required:.6f}USDT,free~{free_usdt:.6f}USDT"
                             logger.warning(
                                 f"  🚫 Skipping order due to {reject_reason}"
@@ -1129,6 +1286,7 @@ class CCXTExecutionGateway(BaseExecutionGateway):
                 price=price,
                 params=params,
             )
+            reservation.placed = True
             logger.info(
                 f"  ✓ Order created: id={order.get('id')}, status={order.get('status')}, filled={order.get('filled')}"
             )
@@ -1221,7 +1379,10 @@ class CCXTExecutionGateway(BaseExecutionGateway):
         )
 
     async def _exec_open_long(
-        self, inst: TradeInstruction, exchange: ccxt.Exchange
+        self,
+        inst: TradeInstruction,
+        exchange: ccxt.Exchange,
+        margin: Optional[_MarginLedger] = None,
     ) -> TxResult:
         # Ensure we do not mark reduceOnly on open
         # Use exchange-specific param name
@@ -1229,17 +1390,20 @@ class CCXTExecutionGateway(BaseExecutionGateway):
             overrides = {"reduce_only": False}
         else:
             overrides = {"reduceOnly": False}
-        return await self._submit_order(inst, exchange, overrides)
+        return await self._submit_order(inst, exchange, overrides, margin)
 
     async def _exec_open_short(
-        self, inst: TradeInstruction, exchange: ccxt.Exchange
+        self,
+        inst: TradeInstruction,
+        exchange: ccxt.Exchange,
+        margin: Optional[_MarginLedger] = None,
     ) -> TxResult:
         # Use exchange-specific param name
         if self.exchange_id == "bybit":
             overrides = {"reduce_only": False}
         else:
             overrides = {"reduceOnly": False}
-        return await self._submit_order(inst, exchange, overrides)
+        return await self._submit_order(inst, exchange, overrides, margin)
 
     async def _exec_close_long(
         self, inst: TradeInstruction, exchange: ccxt.Exchange
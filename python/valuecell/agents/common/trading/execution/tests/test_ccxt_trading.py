@@ -0,0 +1,241 @@
+"""
+Unit tests for CCXTExecutionGateway.execute against a fake exchange
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from valuecell.agents.common.trading.execution.ccxt_trading import (
+    CCXTExecutionGateway,
+    _MarginLedger,
+)
+from valuecell.agents.common.trading.models import (
+    InstrumentRef,
+    PriceMode,
+    TradeDecisionAction,
+    TradeInstruction,
+    TradeSide,
+    TxStatus,
+)
+
+_SIDES = {
+    TradeDecisionAction.OPEN_LONG: TradeSide.BUY,
+    TradeDecisionAction.CLOSE_SHORT: TradeSide.BUY,
+    TradeDecisionAction.OPEN_SHORT: TradeSide.SELL,
+    TradeDecisionAction.CLOSE_LONG: TradeSide.SELL,
+}
+
+
+class FakeExchange:
+    """Binance-like USDT-M exchange recording the orders it receives."""
+
+    def __init__(
+        self,
+        symbols: List[str],
+        free_usdt: float = 1e9,
+        rate_limit: float = 0,
+        delay: float = 0.01,
+    ) -> None:
+        self.markets = {
+            symbol: {"contract": True, "linear": True, "settle": "USDT"}
+            for symbol in symbols
+        }
+        self.rateLimit = rate_limit
+        self.has = {"fetchTicker": True, "fetchOrder": False}
+        self.free_usdt = free_usdt
+        self.delay = delay
+        self.balance_calls = 0
+        self.orders: List[str] = []
+        self.in_flight: Dict[str, int] = {}
+        self.max_in_flight = 0
+        self.max_in_flight_per_symbol = 0
+        self.fail: set = set()
+        self.block: Optional[asyncio.Event] = None
+
+    def amount_to_precision(self, symbol, amount):
+        return str(amount)
+
+    def price_to_precision(self, symbol, price):
+        return str(price)
+
+    async def fetch_ticker(self, symbol):
+        return {"last": 100.0}
+
+    async def fetch_balance(self, params=None):
+        self.balance_calls += 1
+        return {"free": {"USDT": self.free_usdt}}
+
+    async def create_order(self, symbol, type, side, amount, price, params):
+        client_id = params["clientOrderId"]
+        if self.block is not None:
+            await self.block.wait()
+        if client_id in self.fail:
+            raise RuntimeError("exchange rejected order")
+        self.in_flight[symbol] = self.in_flight.get(symbol, 0) + 1
+        self.max_in_flight_per_symbol = max(
+            self.max_in_flight_per_symbol, self.in_flight[symbol]
+        )
+        self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+        await asyncio.sleep(self.delay)
+        self.in_flight[symbol] -= 1
+        self.orders.append(client_id)
+        return {"id": client_id, "status": "closed", "filled": amount, "average": 100.0}
+
+
+def _inst(
+    instruction_id: str,
+    symbol: str,
+    action: TradeDecisionAction,
+    quantity: float = 1.0,
+    **kwargs,
+) -> TradeInstruction:
+    return TradeInstruction(
+        instruction_id=instruction_id,
+        compose_id="compose",
+        instrument=InstrumentRef(symbol=symbol),
+        action=action,
+        side=_SIDES[action],
+        quantity=quantity,
+        **kwargs,
+    )
+
+
+def _gateway(exchange: FakeExchange, **kwargs) -> CCXTExecutionGateway:
+    gateway = CCXTExecutionGateway("binance", **kwargs)
+    gateway._exchange = exchange
+    return gateway
+
+
+@pytest.mark.asyncio
+async def test_closes_run_before_opens_and_results_keep_instruction_order():
+    exchange = FakeExchange(["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+    instructions = [
+        _inst("open-btc", "BTC-USDT", TradeDecisionAction.OPEN_LONG),
+        _inst("close-eth", "ETH-USDT", TradeDecisionAction.CLOSE_LONG),
+        _inst("open-sol", "SOL-USDT", TradeDecisionAction.OPEN_SHORT),
+        _inst("close-sol", "SOL-USDT", TradeDecisionAction.CLOSE_SHORT),
+    ]
+
+    results = await _gateway(exchange).execute(instructions)
+
+    assert set(exchange.orders[:2]) == {"close-eth", "close-sol"}
+    assert set(exchange.orders[2:]) == {"open-btc", "open-sol"}
+    assert [r.instruction_id for r in results] == [
+        i.instruction_id for i in instructions
+    ]
+    assert all(r.status == TxStatus.FILLED for r in results)
+
+
+@pytest.mark.asyncio
+async def test_symbols_run_concurrently_but_each_symbol_in_order():
+    exchange = FakeExchange(["BTC/USDT", "ETH/USDT"])
+    instructions = [
+        _inst(f"{symbol}-{n}", f"{symbol}-USDT", TradeDecisionAction.OPEN_LONG)
+        for n in range(3)
+        for symbol in ("BTC", "ETH")
+    ]
+
+    await _gateway(exchange).execute(instructions)
+
+    assert exchange.max_in_flight == 2
+    assert exchange.max_in_flight_per_symbol == 1
+    for symbol in ("BTC", "ETH"):
+        placed = [oid for oid in exchange.orders if oid.startswith(symbol)]
+        assert placed == [f"{symbol}-0", f"{symbol}-1", f"{symbol}-2"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_bounds_orders_in_flight():
+    symbols = ["BTC", "ETH", "SOL", "BNB", "XRP"]
+    # 500 ms between requests -> two requests per second
+    exchange = FakeExchange([f"{s}/USDT" for s in symbols], rate_limit=500)
+    gateway = _gateway(exchange, max_concurrent_orders=4)
+    instructions = [
+        _inst(s, f"{s}-USDT", TradeDecisionAction.OPEN_LONG) for s in symbols
+    ]
+
+    results = await gateway.execute(instructions)
+
+    assert len(results) == 5
+    assert exchange.max_in_flight == 2
+    assert gateway._order_budget(FakeExchange([], rate_limit=0)) == 4
+    assert gateway._order_budget(FakeExchange([], rate_limit=2000)) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_opens_share_one_margin_reading():
+    # Each open needs 0.5 * 100 / 1 * 1.02 = 51 USDT
+    exchange = FakeExchange(["BTC/USDT", "ETH/USDT", "SOL/USDT"], free_usdt=110.0)
+    instructions = [
+        _inst(s, f"{s}-USDT", TradeDecisionAction.OPEN_LONG, quantity=0.5)
+        for s in ("BTC", "ETH", "SOL")
+    ]
+
+    results = await _gateway(exchange).execute(instructions)
+
+    statuses = sorted(r.status.value for r in results)
+    assert statuses == sorted(
+        [TxStatus.FILLED.value, TxStatus.FILLED.value, TxStatus.REJECTED.value]
+    )
+    (rejected,) = [r for r in results if r.status == TxStatus.REJECTED]
+    assert rejected.reason.startswith("insufficient_margin_binance_usdtm")
+    assert exchange.balance_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_order_returns_its_margin():
+    exchange = FakeExchange(["BTC/USDT"], free_usdt=60.0)
+    exchange.fail.add("first")
+    instructions = [
+        _inst("first", "BTC-USDT", TradeDecisionAction.OPEN_LONG, quantity=0.5),
+        _inst("second", "BTC-USDT", TradeDecisionAction.OPEN_LONG, quantity=0.5),
+    ]
+
+    first, second = await _gateway(exchange).execute(instructions)
+
+    assert first.status == TxStatus.ERROR
+    # The failed order's 51 USDT went back, so the retry still fits
+    assert second.status == TxStatus.FILLED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_order_returns_its_margin():
+    exchange = FakeExchange(["BTC/USDT"], free_usdt=100.0)
+    exchange.block = asyncio.Event()
+    gateway = _gateway(exchange)
+    ledger = _MarginLedger()
+    inst = _inst(
+        "open",
+        "BTC-USDT",
+        TradeDecisionAction.OPEN_LONG,
+        quantity=0.5,
+        price_mode=PriceMode.LIMIT,
+        limit_price=100.0,
+    )
+
+    pending = asyncio.create_task(
+        gateway._submit_order(inst, exchange, {"reduceOnly": False}, ledger)
+    )
+    await asyncio.sleep(0.01)
+    assert ledger._free == pytest.approx(49.0)
+
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert ledger._free == pytest.approx(100.0)
+
+
+@pytest.mark.asyncio
+async def test_placed_order_keeps_its_margin():
+    exchange = FakeExchange(["BTC/USDT"], free_usdt=100.0)
+    ledger = _MarginLedger()
+    inst = _inst("open", "BTC-USDT", TradeDecisionAction.OPEN_LONG, quantity=0.5)
+
+    result = await _gateway(exchange)._submit_order(
+        inst, exchange, {"reduceOnly": False}, ledger
+    )
+
+    assert result.status == TxStatus.FILLED
+    assert ledger._free == pytest.approx(49.0)
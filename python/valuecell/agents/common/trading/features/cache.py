@@ -0,0 +1,151 @@
+"""Process-wide cache of candle features shared across strategies.
+
+Strategies running in one process often trade the same symbols on the same
+exchange and compute identical candle features every cycle. The
+:class:`FeatureCache` keeps the computed :class:`FeatureVector` of each series
+keyed by its identity and last closed candle, so only the first strategy of a
+cycle fetches and computes; concurrent requests for a key that is already
+being computed wait for that computation instead of repeating it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import ccxt.pro as ccxtpro
+from loguru import logger
+
+from valuecell.agents.common.trading.models import FeatureVector
+
+# Cached features are served for at most this long, bounding how stale the
+# still-open candle may get within an interval
+DEFAULT_FEATURE_CACHE_TTL_SECONDS = 5.0
+# Entries kept before the least recently used ones are evicted
+DEFAULT_FEATURE_CACHE_MAX_ENTRIES = 4096
+
+FeatureKey = Tuple[Hashable, ...]
+# Computes the features of the given keys; keys without a result are omitted
+FeatureLoader = Callable[[List[FeatureKey]], Awaitable[Dict[FeatureKey, FeatureVector]]]
+
+
+def last_closed_candle_ts(interval: str, now_ms: int) -> Optional[int]:
+    """Open timestamp (ms) of the newest closed candle of ``interval``."""
+    try:
+        interval_ms = int(ccxtpro.Exchange.parse_timeframe(interval) * 1000)
+    except Exception:
+        logger.warning("Unknown candle interval {}; caching by TTL only", interval)
+        return None
+    if interval_ms <= 0:
+        return None
+    return (now_ms // interval_ms - 1) * interval_ms
+
+
+class FeatureCache:
+    """TTL/LRU cache of feature vectors with single-flight loading.
+
+    Cached vectors are shared between callers and must be treated as
+    read-only. Instances are bound to one event loop; use
+    :func:`get_feature_cache`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_FEATURE_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_FEATURE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max(1, max_entries)
+        # key -> (expires_at, features), least recently used first
+        self._entries: "OrderedDict[FeatureKey, Tuple[float, FeatureVector]]" = (
+            OrderedDict()
+        )
+        self._inflight: Dict[FeatureKey, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: FeatureKey) -> Optional[FeatureVector]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, features = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return features
+
+    def put(self, key: FeatureKey, features: FeatureVector) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, features)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_many(
+        self, keys: List[FeatureKey], load: FeatureLoader
+    ) -> Dict[FeatureKey, FeatureVector]:
+        """Return the features of ``keys``, loading the missing ones once.
+
+        Keys cached and fresh are served directly, keys another caller is
+        loading are awaited, and the rest are passed to a single ``load``
+        call. Keys that could not be loaded are absent from the result.
+        """
+        found: Dict[FeatureKey, FeatureVector] = {}
+        waiting: Dict[FeatureKey, asyncio.Future] = {}
+        missing: List[FeatureKey] = []
+        for key in dict.fromkeys(keys):
+            features = self.get(key)
+            if features is not None:
+                found[key] = features
+            elif key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._inflight.update(futures)
+            loaded: Dict[FeatureKey, FeatureVector] = {}
+            try:
+                loaded = await load(missing)
+            finally:
+                # Waiters of a failed or cancelled load get no features
+                for key, future in futures.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+                    features = loaded.get(key)
+                    if features is not None:
+                        self.put(key, features)
+                        found[key] = features
+                    future.set_result(features)
+
+        for key, future in waiting.items():
+            # Shielded: a cancelled waiter must not cancel the shared load
+            features = await asyncio.shield(future)
+            if features is not None:
+                found[key] = features
+        return found
+
+
+# event loop -> cache
+_CACHES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FeatureCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_feature_cache() -> FeatureCache:
+    """Return the feature cache of the running event loop."""
+    loop = asyncio.get_running_loop()
+    cache = _CACHES.get(loop)
+    if cache is None:
+        cache = FeatureCache()
+        _CACHES[loop] = cache
+    return cache
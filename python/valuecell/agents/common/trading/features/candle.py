@@ -1,20 +1,76 @@
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 from valuecell.agents.common.trading.constants import (
     FEATURE_GROUP_BY_INTERVAL_PREFIX,
     FEATURE_GROUP_BY_KEY,
 )
-from valuecell.agents.common.trading.models import Candle, FeatureVector
+from valuecell.agents.common.trading.models import Candle, CandleBatch, FeatureVector
 
+from .indicators import IndicatorState, seed_states
 from .interfaces import CandleBasedFeatureComputer
 
 
 class SimpleCandleFeatureComputer(CandleBasedFeatureComputer):
-    """Computes basic momentum and volume features."""
+    """Computes basic momentum and volume features.
+
+    Indicators are maintained incrementally per (symbol, interval): candles
+    already folded into the state are skipped, so each call costs O(new
+    candles) rather than O(window). The newest candle of a window is treated
+    as still open and applied to a copy of the state only. A window that does
+    not overlap the state (first call, gap, restart) reseeds it; series
+    sharing a timestamp grid are seeded together over a (symbols x time)
+    array.
+    """
+
+    def __init__(self) -> None:
+        # (symbol, interval) -> indicators over the closed candles seen so far
+        self._states: Dict[Tuple[str, str], IndicatorState] = {}
+
+    def _needs_seed(self, batch: CandleBatch) -> bool:
+        """Whether ``batch`` cannot continue its series' current state."""
+        state = self._states.get((batch.symbol, batch.interval))
+        return (
+            state is None
+            or state.last_ts is None
+            or state.last_ts < batch.ts[0]
+            or state.last_ts >= batch.ts[-1]
+        )
+
+    def _seed_aligned(self, batches: List[CandleBatch]) -> None:
+        """Seed series sharing a timestamp grid in one vectorized pass.
+
+        Ragged or lone series are left to ``_advance``, which seeds them one
+        candle at a time.
+        """
+        groups: Dict[Tuple[str, bytes], List[CandleBatch]] = defaultdict(list)
+        for batch in batches:
+            if len(batch) > 1 and self._needs_seed(batch):
+                groups[(batch.interval, batch.ts.tobytes())].append(batch)
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            closes = np.stack([batch.close[:-1] for batch in group])
+            for batch, state in zip(group, seed_states(group[0].ts[:-1], closes)):
+                self._states[(batch.symbol, batch.interval)] = state
+
+    def _advance(self, batch: CandleBatch) -> IndicatorState:
+        """Fold the closed candles of ``batch`` into its series' state."""
+        key = (batch.symbol, batch.interval)
+        ts = batch.ts
+        first = 0
+        if self._needs_seed(batch):
+            state = IndicatorState()
+            self._states[key] = state
+        else:
+            state = self._states[key]
+            first = int(np.searchsorted(ts, state.last_ts, side="right"))
+        closed = slice(first, len(batch) - 1)
+        for candle_ts, close in zip(ts[closed].tolist(), batch.close[closed].tolist()):
+            state.update(candle_ts, close)
+        return state
 
     def compute_features(
         self,
@@ -23,127 +79,43 @@ class SimpleCandleFeatureComputer(CandleBasedFeatureComputer):
     ) -> List[FeatureVector]:
         if not candles:
             return []
+        return self.compute_batch_features(CandleBatch.from_candles(candles), meta)
 
-        grouped: Dict[str, List[Candle]] = defaultdict(list)
-        for candle in candles:
-            grouped[candle.instrument.symbol].append(candle)
+    def compute_batch_features(
+        self,
+        batches: Optional[List[CandleBatch]] = None,
+        meta: Optional[Dict[str, object]] = None,
+    ) -> List[FeatureVector]:
+        batches = [batch for batch in batches or [] if len(batch)]
+        self._seed_aligned(batches)
 
         features: List[FeatureVector] = []
-        for symbol, series in grouped.items():
-            # Build a DataFrame for indicator calculations
-            series.sort(key=lambda item: item.ts)
-            rows = [
-                {
-                    "ts": c.ts,
-                    "open": c.open,
-                    "high": c.high,
-                    "low": c.low,
-                    "close": c.close,
-                    "volume": c.volume,
-                    "interval": c.interval,
-                }
-                for c in series
-            ]
-            df = pd.DataFrame(rows)
-
-            # EMAs
-            df["ema_12"] = df["close"].ewm(span=12, adjust=False).mean()
-            df["ema_26"] = df["close"].ewm(span=26, adjust=False).mean()
-            df["ema_50"] = df["close"].ewm(span=50, adjust=False).mean()
-
-            # MACD
-            df["macd"] = df["ema_12"] - df["ema_26"]
-            df["macd_signal"] = df["macd"].ewm(span=9, adjust=False).mean()
-            df["macd_histogram"] = df["macd"] - df["macd_signal"]
-
-            # RSI
-            delta = df["close"].diff()
-            gain = delta.clip(lower=0).rolling(window=14).mean()
-            loss = (-delta).clip(lower=0).rolling(window=14).mean()
-            rs = gain / loss.replace(0, np.inf)
-            df["rsi"] = 100 - (100 / (1 + rs))
-
-            # Bollinger Bands
-            df["bb_middle"] = df["close"].rolling(window=20).mean()
-            bb_std = df["close"].rolling(window=20).std()
-            df["bb_upper"] = df["bb_middle"] + (bb_std * 2)
-            df["bb_lower"] = df["bb_middle"] - (bb_std * 2)
-
-            last = df.iloc[-1]
-            prev = df.iloc[-2] if len(df) > 1 else last
-
-            change_pct = (
-                (float(last.close) - float(prev.close)) / float(prev.close)
-                if prev.close
-                else 0.0
-            )
+        for batch in batches:
+            last_ts = int(batch.ts[-1])
+            last_close = float(batch.close[-1])
+            prev_close = float(batch.close[-2]) if len(batch) > 1 else last_close
+
+            # Apply the still-open candle without committing it
+            state = self._advance(batch).copy()
+            state.update(last_ts, last_close)
+
+            change_pct = (last_close - prev_close) / prev_close if prev_close else 0.0
 
             values = {
-                "close": float(last.close),
-                "volume": float(last.volume),
+                "close": last_close,
+                "volume": float(batch.volume[-1]),
                 "change_pct": float(change_pct),
-                "ema_12": (
-                    float(last.get("ema_12", np.nan))
-                    if not pd.isna(last.get("ema_12"))
-                    else None
-                ),
-                "ema_26": (
-                    float(last.get("ema_26", np.nan))
-                    if not pd.isna(last.get("ema_26"))
-                    else None
-                ),
-                "ema_50": (
-                    float(last.get("ema_50", np.nan))
-                    if not pd.isna(last.get("ema_50"))
-                    else None
-                ),
-                "macd": (
-                    float(last.get("macd", np.nan))
-                    if not pd.isna(last.get("macd"))
-                    else None
-                ),
-                "macd_signal": (
-                    float(last.get("macd_signal", np.nan))
-                    if not pd.isna(last.get("macd_signal"))
-                    else None
-                ),
-                "macd_histogram": (
-                    float(last.get("macd_histogram", np.nan))
-                    if not pd.isna(last.get("macd_histogram"))
-                    else None
-                ),
-                "rsi": (
-                    float(last.get("rsi", np.nan))
-                    if not pd.isna(last.get("rsi"))
-                    else None
-                ),
-                "bb_upper": (
-                    float(last.get("bb_upper", np.nan))
-                    if not pd.isna(last.get("bb_upper"))
-                    else None
-                ),
-                "bb_middle": (
-                    float(last.get("bb_middle", np.nan))
-                    if not pd.isna(last.get("bb_middle"))
-                    else None
-                ),
-                "bb_lower": (
-                    float(last.get("bb_lower", np.nan))
-                    if not pd.isna(last.get("bb_lower"))
-                    else None
-                ),
+                **state.values(),
             }
 
             # Build feature meta
-            window_start_ts = int(rows[0]["ts"]) if rows else int(last["ts"])
-            window_end_ts = int(last["ts"])
-            interval = series[-1].interval
+            interval = batch.interval
             fv_meta = {
                 FEATURE_GROUP_BY_KEY: f"{FEATURE_GROUP_BY_INTERVAL_PREFIX}{interval}",
                 "interval": interval,
-                "count": len(series),
-                "window_start_ts": window_start_ts,
-                "window_end_ts": window_end_ts,
+                "count": len(batch),
+                "window_start_ts": int(batch.ts[0]),
+                "window_end_ts": last_ts,
             }
             if meta:
                 # Merge provided meta (doesn't overwrite core keys unless intended)
@@ -152,8 +124,8 @@ class SimpleCandleFeatureComputer(CandleBasedFeatureComputer):
 
             features.append(
                 FeatureVector(
-                    ts=int(last["ts"]),
-                    instrument=series[-1].instrument,
+                    ts=last_ts,
+                    instrument=batch.instrument,
                     values=values,
                     meta=fv_meta,
                 )
@@ -0,0 +1,212 @@
+"""Incremental technical indicators over a stream of candle closes.
+
+:class:`IndicatorState` folds closes in one at a time and keeps just enough
+state (EMA values and short fixed-size windows) to report EMA 12/26/50,
+MACD, RSI-14 and 20-period Bollinger Bands in O(1) per candle. The values
+follow the definitions of the pandas computation used previously:
+``ewm(span, adjust=False)`` EMAs seeded with the first close, an RSI built
+from simple rolling means of gains and losses, and Bollinger Bands from the
+sample standard deviation.
+
+:func:`seed_states` builds the states of many series sharing a timestamp
+grid at once, running the recurrences over a (symbols x time) array.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+EMA_SPANS = (12, 26, 50)
+MACD_SIGNAL_SPAN = 9
+RSI_WINDOW = 14
+BOLLINGER_WINDOW = 20
+BOLLINGER_STD_MULTIPLIER = 2.0
+
+
+def _ema_alpha(span: int) -> float:
+    return 2.0 / (span + 1.0)
+
+
+class IndicatorState:
+    """Indicator state of one (symbol, interval) candle series.
+
+    Feed closes in timestamp order with :meth:`update`; :meth:`values`
+    reports the indicators as of the last close. Use :meth:`copy` to apply a
+    still-open candle tentatively without committing it.
+    """
+
+    __slots__ = (
+        "last_ts",
+        "last_close",
+        "_emas",
+        "_macd_signal",
+        "_deltas",
+        "_gain_sum",
+        "_loss_sum",
+        "_loss_count",
+        "_closes",
+        "_origin",
+        "_close_sum",
+        "_close_sq_sum",
+    )
+
+    def __init__(self) -> None:
+        self.last_ts: Optional[int] = None
+        self.last_close: Optional[float] = None
+        self._emas: Dict[int, float] = {}
+        self._macd_signal: Optional[float] = None
+        # Gains and losses of the last RSI_WINDOW close-to-close changes
+        self._deltas: Deque[float] = deque()
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        # Losing changes in the window; an exact zero loss must not hinge on
+        # the rounding left in ``_loss_sum``
+        self._loss_count = 0
+        # Last BOLLINGER_WINDOW closes; sums are taken relative to the first
+        # close seen to keep the variance free of cancellation errors.
+        self._closes: Deque[float] = deque()
+        self._origin: Optional[float] = None
+        self._close_sum = 0.0
+        self._close_sq_sum = 0.0
+
+    def copy(self) -> "IndicatorState":
+        clone = IndicatorState.__new__(IndicatorState)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone._emas = dict(self._emas)
+        clone._deltas = deque(self._deltas)
+        clone._closes = deque(self._closes)
+        return clone
+
+    def update(self, ts: int, close: float) -> None:
+        """Fold in the close of the candle ending at ``ts``."""
+        close = float(close)
+        for span in EMA_SPANS:
+            prev = self._emas.get(span)
+            self._emas[span] = (
+                close if prev is None else prev + _ema_alpha(span) * (close - prev)
+            )
+        macd = self._emas[12] - self._emas[26]
+        if self._macd_signal is None:
+            self._macd_signal = macd
+        else:
+            self._macd_signal += _ema_alpha(MACD_SIGNAL_SPAN) * (
+                macd - self._macd_signal
+            )
+
+        if self.last_close is not None:
+            delta = close - self.last_close
+            self._deltas.append(delta)
+            self._gain_sum += max(delta, 0.0)
+            self._loss_sum += max(-delta, 0.0)
+            self._loss_count += delta < 0
+            if len(self._deltas) > RSI_WINDOW:
+                dropped = self._deltas.popleft()
+                self._gain_sum -= max(dropped, 0.0)
+                self._loss_sum -= max(-dropped, 0.0)
+                self._loss_count -= dropped < 0
+
+        if self._origin is None:
+            self._origin = close
+        shifted = close - self._origin
+        self._closes.append(shifted)
+        self._close_sum += shifted
+        self._close_sq_sum += shifted * shifted
+        if len(self._closes) > BOLLINGER_WINDOW:
+            dropped = self._closes.popleft()
+            self._close_sum -= dropped
+            self._close_sq_sum -= dropped * dropped
+
+        self.last_ts = int(ts)
+        self.last_close = close
+
+    def values(self) -> Dict[str, Optional[float]]:
+        """Indicator values as of the last close; None while warming up."""
+        if self.last_close is None:
+            return {}
+
+        ema_12 = self._emas[12]
+        ema_26 = self._emas[26]
+        macd = ema_12 - ema_26
+        values: Dict[str, Optional[float]] = {
+            "ema_12": ema_12,
+            "ema_26": ema_26,
+            "ema_50": self._emas[50],
+            "macd": macd,
+            "macd_signal": self._macd_signal,
+            "macd_histogram": macd - self._macd_signal,
+            "rsi": None,
+            "bb_upper": None,
+            "bb_middle": None,
+            "bb_lower": None,
+        }
+
+        if len(self._deltas) == RSI_WINDOW:
+            gain = max(self._gain_sum, 0.0) / RSI_WINDOW
+            loss = max(self._loss_sum, 0.0) / RSI_WINDOW
+            # No losses in the window reads as RS = 0, as in the pandas version
+            rs = gain / loss if self._loss_count and loss > 0 else 0.0
+            values["rsi"] = 100.0 - 100.0 / (1.0 + rs)
+
+        n = len(self._closes)
+        if n == BOLLINGER_WINDOW:
+            mean = self._close_sum / n
+            variance = max(self._close_sq_sum - n * mean * mean, 0.0) / (n - 1)
+            std = math.sqrt(variance)
+            middle = self._origin + mean
+            values["bb_middle"] = middle
+            values["bb_upper"] = middle + BOLLINGER_STD_MULTIPLIER * std
+            values["bb_lower"] = middle - BOLLINGER_STD_MULTIPLIER * std
+
+        return values
+
+
+def seed_states(ts: np.ndarray, closes: np.ndarray) -> List[IndicatorState]:
+    """Seed one state per row of ``closes`` in a single vectorized pass.
+
+    Args:
+        ts: timestamps of the columns, shared by every series
+        closes: (symbols x time) array of closes in timestamp order
+    Returns:
+        States equivalent to feeding each row through ``IndicatorState.update``.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.ndim != 2 or closes.shape[1] == 0:
+        return []
+
+    alphas = np.array([_ema_alpha(span) for span in EMA_SPANS])[:, None]
+    signal_alpha = _ema_alpha(MACD_SIGNAL_SPAN)
+    emas = np.repeat(closes[None, :, 0], len(EMA_SPANS), axis=0)
+    signal = emas[0] - emas[1]
+    for t in range(1, closes.shape[1]):
+        emas += alphas * (closes[:, t] - emas)
+        signal += signal_alpha * ((emas[0] - emas[1]) - signal)
+
+    deltas = np.diff(closes, axis=1)[:, -RSI_WINDOW:]
+    gains = np.clip(deltas, 0.0, None).sum(axis=1)
+    losses = np.clip(-deltas, 0.0, None).sum(axis=1)
+    loss_counts = (deltas < 0).sum(axis=1)
+    origins = closes[:, 0]
+    window = closes[:, -BOLLINGER_WINDOW:] - origins[:, None]
+
+    states: List[IndicatorState] = []
+    for i in range(closes.shape[0]):
+        state = IndicatorState()
+        state.last_ts = int(ts[-1])
+        state.last_close = float(closes[i, -1])
+        state._emas = {span: float(emas[j, i]) for j, span in enumerate(EMA_SPANS)}
+        state._macd_signal = float(signal[i])
+        state._deltas = deque(deltas[i].tolist())
+        state._gain_sum = float(gains[i])
+        state._loss_sum = float(losses[i])
+        state._loss_count = int(loss_counts[i])
+        state._closes = deque(window[i].tolist())
+        state._origin = float(origins[i])
+        state._close_sum = float(window[i].sum())
+        state._close_sq_sum = float(np.square(window[i]).sum())
+        states.append(state)
+    return states
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from valuecell.agents.common.trading.models import (
     Candle,
+    CandleBatch,
     FeaturesPipelineResult,
     FeatureVector,
 )
@@ -38,6 +39,19 @@ class CandleBasedFeatureComputer(ABC):
         """
         raise NotImplementedError
 
+    def compute_batch_features(
+        self,
+        batches: Optional[List[CandleBatch]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> List[FeatureVector]:
+        """Build feature vectors from columnar candle batches.
+
+        The default expands the batches into ``Candle`` models and calls
+        ``compute_features``; columnar implementations should override it.
+        """
+        candles = [c for batch in batches or [] for c in batch.to_candles()]
+        return self.compute_features(candles=candles, meta=meta)
+
 
 class BaseFeaturesPipeline(ABC):
     """Abstract pipeline that produces feature vectors (including market features)."""
@@ -51,3 +65,7 @@ class BaseFeaturesPipeline(ABC):
         into this call.
         """
         raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release resources held by the pipeline (default: no-op)."""
+        return None
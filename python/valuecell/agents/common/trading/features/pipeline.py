@@ -20,9 +20,11 @@ from valuecell.agents.common.trading.models import (
     FeatureVector,
     UserRequest,
 )
+from valuecell.utils.ts import get_current_timestamp_ms
 
 from ..data.interfaces import BaseMarketDataSource
-from ..data.market import SimpleMarketDataSource
+from ..data.market import StreamingMarketDataSource
+from .cache import FeatureCache, get_feature_cache, last_closed_candle_ts
 from .candle import SimpleCandleFeatureComputer
 from .interfaces import (
     BaseFeaturesPipeline,
@@ -32,7 +34,14 @@ from .market_snapshot import MarketSnapshotFeatureComputer
 
 
 class DefaultFeaturesPipeline(BaseFeaturesPipeline):
-    """Default pipeline using the simple data source and feature computer."""
+    """Default pipeline using the simple data source and feature computer.
+
+    With ``share_features`` (or an explicit ``feature_cache``) candle
+    features are looked up in a process-wide :class:`FeatureCache` keyed by
+    exchange, components, symbol, interval, lookback and last closed candle,
+    so strategies with overlapping universes fetch and compute each series
+    once per cycle.
+    """
 
     def __init__(
         self,
@@ -42,6 +51,8 @@ class DefaultFeaturesPipeline(BaseFeaturesPipeline):
         candle_feature_computer: CandleBasedFeatureComputer,
         market_snapshot_computer: MarketSnapshotFeatureComputer,
         candle_configurations: Optional[List[CandleConfig]] = None,
+        feature_cache: Optional[FeatureCache] = None,
+        share_features: bool = False,
     ) -> None:
         self._request = request
         self._market_data_source = market_data_source
@@ -53,6 +64,48 @@ class DefaultFeaturesPipeline(BaseFeaturesPipeline):
             CandleConfig(interval="1s", lookback=60 * 3),
             CandleConfig(interval="1m", lookback=60 * 4),
         ]
+        self._feature_cache = feature_cache
+        self._share_features = share_features
+
+    def _get_feature_cache(self) -> Optional[FeatureCache]:
+        if self._feature_cache is None and self._share_features:
+            self._feature_cache = get_feature_cache()
+        return self._feature_cache
+
+    async def _compute_candle_features(
+        self, symbols: List[str], interval: str, lookback: int
+    ) -> List[FeatureVector]:
+        batches = await self._market_data_source.get_recent_candle_batches(
+            symbols, interval, lookback
+        )
+        return self._candle_feature_computer.compute_batch_features(batches=batches)
+
+    async def _cached_candle_features(
+        self, cache: FeatureCache, interval: str, lookback: int
+    ) -> List[FeatureVector]:
+        closed_ts = last_closed_candle_ts(interval, get_current_timestamp_ms())
+        # Results also depend on which components produced them
+        scope = (
+            self._request.exchange_config.exchange_id,
+            type(self._market_data_source).__qualname__,
+            type(self._candle_feature_computer).__qualname__,
+        )
+        keys = {
+            (*scope, symbol, interval, lookback, closed_ts): symbol
+            for symbol in self._symbols
+        }
+
+        async def _load(missing):
+            features = await self._compute_candle_features(
+                [keys[key] for key in missing], interval, lookback
+            )
+            by_symbol = {fv.instrument.symbol: fv for fv in features}
+            return {
+                key: by_symbol[keys[key]] for key in missing if keys[key] in by_symbol
+            }
+
+        cached = await cache.get_many(list(keys), _load)
+        return [cached[key] for key in keys if key in cached]
 
     async def build(self) -> FeaturesPipelineResult:
         """
@@ -62,10 +115,12 @@ class DefaultFeaturesPipeline(BaseFeaturesPipeline):
 
         async def _fetch_candles(interval: str, lookback: int) -> List[FeatureVector]:
             """Fetches candles and computes features for a single (interval, lookback) pair."""
-            _candles = await self._market_data_source.get_recent_candles(
-                self._symbols, interval, lookback
-            )
-            return self._candle_feature_computer.compute_features(candles=_candles)
+            cache = self._get_feature_cache()
+            if cache is None:
+                return await self._compute_candle_features(
+                    self._symbols, interval, lookback
+                )
+            return await self._cached_candle_features(cache, interval, lookback)
 
         async def _fetch_market_features() -> List[FeatureVector]:
             """Fetches market snapshot for all symbols and computes features."""
@@ -101,10 +156,14 @@ class DefaultFeaturesPipeline(BaseFeaturesPipeline):
 
         return FeaturesPipelineResult(features=candle_features)
 
+    async def close(self) -> None:
+        """Release the market data source's exchange lease."""
+        await self._market_data_source.close()
+
     @classmethod
     def from_request(cls, request: UserRequest) -> DefaultFeaturesPipeline:
         """Factory creating the default pipeline from a user request."""
-        market_data_source = SimpleMarketDataSource(
+        market_data_source = StreamingMarketDataSource(
             exchange_id=request.exchange_config.exchange_id
         )
         candle_feature_computer = SimpleCandleFeatureComputer()
@@ -114,4 +173,5 @@ class DefaultFeaturesPipeline(BaseFeaturesPipeline):
             market_data_source=market_data_source,
             candle_feature_computer=candle_feature_computer,
             market_snapshot_computer=market_snapshot_computer,
+            share_features=True,
         )
@@ -0,0 +1,111 @@
+"""
+Unit tests for valuecell.agents.common.trading.features.cache module
+"""
+
+import asyncio
+
+import pytest
+
+from valuecell.agents.common.trading.features.cache import (
+    FeatureCache,
+    get_feature_cache,
+    last_closed_candle_ts,
+)
+from valuecell.agents.common.trading.models import FeatureVector, InstrumentRef
+
+
+def _features(symbol: str) -> FeatureVector:
+    return FeatureVector(ts=0, instrument=InstrumentRef(symbol=symbol), values={})
+
+
+def test_last_closed_candle_ts():
+    # 10:00:30 -> the 09:59 minute candle is the newest closed one
+    now_ms = (10 * 60 + 0.5) * 60_000
+    assert last_closed_candle_ts("1m", int(now_ms)) == (10 * 60 - 1) * 60_000
+    assert last_closed_candle_ts("1h", int(now_ms)) == 9 * 3_600_000
+    assert last_closed_candle_ts("not-an-interval", int(now_ms)) is None
+
+
+def test_entries_expire_and_least_recently_used_are_evicted():
+    cache = FeatureCache(ttl=60, max_entries=2)
+    cache.put(("a",), _features("A"))
+    cache.put(("b",), _features("B"))
+    assert cache.get(("a",)) is not None  # "b" is now least recently used
+    cache.put(("c",), _features("C"))
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    assert len(cache) == 2
+
+    expired = FeatureCache(ttl=0)
+    expired.put(("a",), _features("A"))
+    assert expired.get(("a",)) is None
+    assert len(expired) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_load():
+    cache = FeatureCache()
+    calls = []
+    release = asyncio.Event()
+
+    async def load(keys):
+        calls.append(list(keys))
+        await release.wait()
+        return {key: _features(key[0]) for key in keys}
+
+    first = asyncio.create_task(cache.get_many([("A",), ("B",)], load))
+    await asyncio.sleep(0)
+    # "A" is in flight; only "C" is loaded again
+    second = asyncio.create_task(cache.get_many([("A",), ("C",)], load))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert set(await first) == {("A",), ("B",)}
+    assert set(await second) == {("A",), ("C",)}
+    assert calls == [[("A",), ("B",)], [("C",)]]
+
+    # Served from the cache afterwards
+    assert set(await cache.get_many([("B",)], load)) == {("B",)}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_load_leaves_keys_loadable():
+    cache = FeatureCache()
+    release = asyncio.Event()
+
+    async def failing(keys):
+        await release.wait()
+        raise RuntimeError("exchange down")
+
+    async def load(keys):
+        return {key: _features(key[0]) for key in keys}
+
+    owner = asyncio.create_task(cache.get_many([("A",)], failing))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_many([("A",)], load))
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await owner
+    # Waiters of a failed load get no features instead of the error
+    assert await waiter == {}
+    assert set(await cache.get_many([("A",)], load)) == {("A",)}
+
+
+@pytest.mark.asyncio
+async def test_keys_missing_from_load_are_not_cached():
+    cache = FeatureCache()
+
+    async def load(keys):
+        return {("A",): _features("A")}
+
+    assert set(await cache.get_many([("A",), ("B",)], load)) == {("A",)}
+    assert cache.get(("B",)) is None
+
+
+@pytest.mark.asyncio
+async def test_feature_cache_is_shared_within_a_loop():
+    assert get_feature_cache() is get_feature_cache()
@@ -0,0 +1,197 @@
+"""
+Unit tests for the incremental indicators and the candle feature computer,
+checked against the pandas computation they replace.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuecell.agents.common.trading.features.candle import (
+    SimpleCandleFeatureComputer,
+)
+from valuecell.agents.common.trading.features.indicators import (
+    IndicatorState,
+    seed_states,
+)
+from valuecell.agents.common.trading.models import CandleBatch, InstrumentRef
+
+INDICATORS = (
+    "ema_12",
+    "ema_26",
+    "ema_50",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "rsi",
+    "bb_upper",
+    "bb_middle",
+    "bb_lower",
+)
+MINUTE_MS = 60_000
+
+
+def _reference(closes) -> Dict[str, Optional[float]]:
+    """Indicators of the last close, as the former pandas implementation."""
+    df = pd.DataFrame({"close": np.asarray(closes, dtype=float)})
+    df["ema_12"] = df["close"].ewm(span=12, adjust=False).mean()
+    df["ema_26"] = df["close"].ewm(span=26, adjust=False).mean()
+    df["ema_50"] = df["close"].ewm(span=50, adjust=False).mean()
+    df["macd"] = df["ema_12"] - df["ema_26"]
+    df["macd_signal"] = df["macd"].ewm(span=9, adjust=False).mean()
+    df["macd_histogram"] = df["macd"] - df["macd_signal"]
+    delta = df["close"].diff()
+    gain = delta.clip(lower=0).rolling(window=14).mean()
+    loss = (-delta).clip(lower=0).rolling(window=14).mean()
+    rs = gain / loss.replace(0, np.inf)
+    df["rsi"] = 100 - (100 / (1 + rs))
+    df["bb_middle"] = df["close"].rolling(window=20).mean()
+    bb_std = df["close"].rolling(window=20).std()
+    df["bb_upper"] = df["bb_middle"] + (bb_std * 2)
+    df["bb_lower"] = df["bb_middle"] - (bb_std * 2)
+    last = df.iloc[-1]
+    return {
+        name: None if pd.isna(last[name]) else float(last[name]) for name in INDICATORS
+    }
+
+
+def _assert_matches(values: Dict[str, Optional[float]], closes) -> None:
+    expected = _reference(closes)
+    for name in INDICATORS:
+        if expected[name] is None:
+            assert values[name] is None, name
+        else:
+            assert values[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-9), (
+                name
+            )
+
+
+def _random_walk(n: int, seed: int = 7, start: float = 100.0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return start + np.cumsum(rng.normal(0.0, 1.0, n))
+
+
+def _batch(symbol: str, ts: np.ndarray, closes: np.ndarray) -> CandleBatch:
+    rows = [(t, c, c, c, c, 1.0) for t, c in zip(ts.tolist(), closes.tolist())]
+    return CandleBatch.from_rows(InstrumentRef(symbol=symbol), "1m", rows)
+
+
+def test_incremental_updates_match_pandas_at_every_step():
+    closes = _random_walk(80)
+    state = IndicatorState()
+    for i, close in enumerate(closes):
+        state.update(i * MINUTE_MS, close)
+        _assert_matches(state.values(), closes[: i + 1])
+    assert state.last_ts == 79 * MINUTE_MS
+    assert state.last_close == closes[-1]
+
+
+def test_window_without_losses_reads_as_zero_rsi():
+    closes = np.linspace(100.0, 130.0, 30)
+    state = IndicatorState()
+    for i, close in enumerate(closes):
+        state.update(i * MINUTE_MS, close)
+    assert state.values()["rsi"] == 0.0
+    _assert_matches(state.values(), closes)
+
+
+def test_bollinger_bands_stay_exact_at_large_prices():
+    # Sums relative to the first close avoid cancellation at this magnitude
+    closes = _random_walk(40, seed=3, start=1e9)
+    state = IndicatorState()
+    for i, close in enumerate(closes):
+        state.update(i * MINUTE_MS, close)
+    values = state.values()
+    expected = _reference(closes)
+    assert values["bb_middle"] == pytest.approx(expected["bb_middle"], rel=1e-12)
+    band = values["bb_upper"] - values["bb_middle"]
+    assert band == pytest.approx(expected["bb_upper"] - expected["bb_middle"], rel=1e-6)
+
+
+def test_copy_does_not_commit_tentative_updates():
+    closes = _random_walk(30)
+    state = IndicatorState()
+    for i, close in enumerate(closes):
+        state.update(i * MINUTE_MS, close)
+    before = state.values()
+
+    tentative = state.copy()
+    tentative.update(30 * MINUTE_MS, closes[-1] + 5.0)
+
+    assert state.values() == before
+    assert state.last_ts == 29 * MINUTE_MS
+    _assert_matches(tentative.values(), np.append(closes, closes[-1] + 5.0))
+
+
+@pytest.mark.parametrize("length", [1, 2, 14, 15, 20, 60])
+def test_seed_states_match_incremental_updates(length):
+    ts = np.arange(length) * MINUTE_MS
+    closes = np.stack([_random_walk(length, seed=s) for s in range(3)])
+
+    seeded = seed_states(ts, closes)
+
+    assert len(seeded) == 3
+    for row, state in zip(closes, seeded):
+        assert state.last_ts == ts[-1]
+        assert state.last_close == row[-1]
+        _assert_matches(state.values(), row)
+        # A seeded state keeps following the series like an updated one
+        state.update(length * MINUTE_MS, row[-1] + 1.0)
+        _assert_matches(state.values(), np.append(row, row[-1] + 1.0))
+
+
+def test_seed_states_rejects_empty_input():
+    assert seed_states(np.array([], dtype=np.int64), np.empty((2, 0))) == []
+
+
+def _values(features, symbol: str) -> Dict[str, Optional[float]]:
+    (vector,) = [f for f in features if f.instrument.symbol == symbol]
+    return vector.values
+
+
+def test_computer_continues_overlapping_windows_and_reseeds_after_gap():
+    ts = np.arange(120) * MINUTE_MS
+    closes = _random_walk(120)
+    computer = SimpleCandleFeatureComputer()
+
+    first = computer.compute_batch_features([_batch("BTC", ts[:60], closes[:60])])
+    _assert_matches(_values(first, "BTC"), closes[:60])
+
+    # The candle that was still open has closed at a different price
+    revised = closes.copy()
+    revised[59] += 3.0
+    second = computer.compute_batch_features([_batch("BTC", ts[10:70], revised[10:70])])
+    # The state carries history from before the window start
+    _assert_matches(_values(second, "BTC"), revised[:70])
+
+    # No overlap with the state: indicators restart from the new window
+    third = computer.compute_batch_features([_batch("BTC", ts[90:], closes[90:])])
+    _assert_matches(_values(third, "BTC"), closes[90:])
+    assert third[0].meta["window_start_ts"] == ts[90]
+
+
+def test_computer_reseeds_when_window_goes_back_in_time():
+    ts = np.arange(80) * MINUTE_MS
+    closes = _random_walk(80)
+    computer = SimpleCandleFeatureComputer()
+    computer.compute_batch_features([_batch("BTC", ts[40:], closes[40:])])
+
+    # e.g. after a restart of the upstream feed
+    features = computer.compute_batch_features([_batch("BTC", ts[:30], closes[:30])])
+    _assert_matches(_values(features, "BTC"), closes[:30])
+
+
+def test_computer_seeds_aligned_series_together():
+    ts = np.arange(50) * MINUTE_MS
+    series: List[np.ndarray] = [_random_walk(50, seed=s) for s in range(3)]
+    # A ragged series is seeded on its own
+    batches = [_batch(f"S{i}", ts, closes) for i, closes in enumerate(series)]
+    batches.append(_batch("RAGGED", ts[5:], series[0][5:]))
+
+    features = SimpleCandleFeatureComputer().compute_batch_features(batches)
+
+    for i, closes in enumerate(series):
+        _assert_matches(_values(features, f"S{i}"), closes)
+    _assert_matches(_values(features, "RAGGED"), series[0][5:])
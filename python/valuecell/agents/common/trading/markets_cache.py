@@ -0,0 +1,211 @@
+"""On-disk cache of ccxt market metadata.
+
+``load_markets`` downloads every market definition of an exchange (megabytes
+on Binance or OKX) and is called by each new exchange client: the shared
+market data client and every strategy's execution gateway. This module keeps
+those definitions in versioned JSON files under the application directory,
+so clients are primed with ``set_markets`` instead of a download:
+
+- a file is read at most once per process and change; all clients of the same
+  exchange reuse the parsed markets;
+- entries older than the TTL are still served, and refreshed over the network
+  in the background;
+- entries written by another cache format or ccxt version are ignored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import ccxt
+from loguru import logger
+
+from valuecell.utils.env import get_system_env_dir
+
+# Bump when the layout of cache files changes
+MARKETS_CACHE_VERSION = 1
+# Cached markets older than this are refreshed in the background
+DEFAULT_MARKETS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+def get_markets_cache_dir() -> Path:
+    """Default cache location: ``<system_env_dir>/.cache/markets``."""
+    return get_system_env_dir() / ".cache" / "markets"
+
+
+class _CachedMarkets:
+    def __init__(self, markets: Dict, currencies: Optional[Dict], saved_at: float):
+        self.markets = markets
+        self.currencies = currencies
+        self.saved_at = saved_at
+
+
+class MarketsCache:
+    """Versioned market metadata files, one per exchange (and sandbox)."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        ttl: float = DEFAULT_MARKETS_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._directory = Path(directory) if directory else None
+        self._ttl = ttl
+        # path -> (file mtime, parsed entry)
+        self._memory: Dict[Path, Tuple[float, _CachedMarkets]] = {}
+        self._refreshing: Set[Path] = set()
+        # path -> (download in flight, client it downloads into)
+        self._downloads: Dict[Path, Tuple[asyncio.Task, Any]] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            self._directory = get_markets_cache_dir()
+        return self._directory
+
+    def _path(self, exchange: Any) -> Path:
+        # Keyed by exchange and sandbox only: ccxt downloads the same market
+        # list whatever the client's defaultType, so the market data client
+        # and the execution gateways share one file.
+        name = str(getattr(exchange, "id", None) or type(exchange).__name__)
+        if getattr(exchange, "isSandboxModeEnabled", False):
+            name += "-sandbox"
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}.json"
+
+    # ---- files ----
+
+    def _read(self, path: Path) -> Optional[_CachedMarkets]:
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+        cached = self._memory.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable markets cache {}: {}", path, exc)
+            return None
+        if (
+            payload.get("version") != MARKETS_CACHE_VERSION
+            or payload.get("ccxt_version") != ccxt.__version__
+            or not payload.get("markets")
+        ):
+            return None
+        entry = _CachedMarkets(
+            payload["markets"], payload.get("currencies"), float(payload["saved_at"])
+        )
+        self._memory[path] = (mtime, entry)
+        return entry
+
+    def _write(self, path: Path, markets: Dict, currencies: Optional[Dict]) -> None:
+        payload = {
+            "version": MARKETS_CACHE_VERSION,
+            "ccxt_version": ccxt.__version__,
+            "saved_at": time.time(),
+            "markets": markets,
+            "currencies": currencies,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(payload, f, default=str, separators=(",", ":"))
+            # Atomic, so concurrent readers never see a partial file
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._memory.pop(path, None)
+
+    # ---- exchanges ----
+
+    async def load(self, exchange: Any) -> None:
+        """Prime ``exchange`` with cached markets, downloading them on a miss.
+
+        Concurrent misses for the same file share one download.
+        """
+        path = self._path(exchange)
+        entry = await asyncio.to_thread(self._read, path)
+        if entry is None:
+            await self._download(exchange, path)
+            return
+        exchange.set_markets(entry.markets, entry.currencies)
+        if time.time() - entry.saved_at > self._ttl and path not in self._refreshing:
+            self._refreshing.add(path)
+            task = asyncio.create_task(self._refresh(exchange, path))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _download(self, exchange: Any, path: Path) -> None:
+        inflight = self._downloads.get(path)
+        if inflight is None or inflight[0].get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self.reload(exchange))
+            self._downloads[path] = (task, exchange)
+            self._background.add(task)
+            task.add_done_callback(lambda done: self._download_done(path, done))
+            # Shielded: a cancelled caller must not abort the shared download
+            await asyncio.shield(task)
+            return
+
+        task, source = inflight
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            source = None  # failed for the other client: try our own
+        if source is not None and source.markets:
+            exchange.set_markets(source.markets, source.currencies)
+        else:
+            await self.reload(exchange)
+
+    def _download_done(self, path: Path, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if self._downloads.get(path, (None,))[0] is task:
+            del self._downloads[path]
+
+    async def reload(self, exchange: Any) -> None:
+        """Download markets into ``exchange`` and update the cache file."""
+        await exchange.load_markets(reload=True)
+        await self.store(exchange)
+
+    async def store(self, exchange: Any) -> None:
+        """Persist the markets currently loaded in ``exchange``."""
+        markets = getattr(exchange, "markets", None)
+        if not markets:
+            return
+        path = self._path(exchange)
+        try:
+            await asyncio.to_thread(
+                self._write, path, markets, getattr(exchange, "currencies", None)
+            )
+        except Exception as exc:
+            # The cache is an optimization; trading goes on without it
+            logger.warning("Failed to write markets cache {}: {}", path, exc)
+
+    async def _refresh(self, exchange: Any, path: Path) -> None:
+        try:
+            await self.reload(exchange)
+        except Exception as exc:
+            logger.warning("Background markets refresh for {} failed: {}", path, exc)
+        finally:
+            self._refreshing.discard(path)
+
+
+_MARKETS_CACHE: Optional[MarketsCache] = None
+
+
+def get_markets_cache() -> MarketsCache:
+    """Return the process-wide markets cache."""
+    global _MARKETS_CACHE
+    if _MARKETS_CACHE is None:
+        _MARKETS_CACHE = MarketsCache()
+    return _MARKETS_CACHE
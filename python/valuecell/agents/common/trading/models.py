@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from valuecell.utils.ts import get_current_timestamp_ms
@@ -9,6 +10,7 @@ from valuecell.utils.ts import get_current_timestamp_ms
 from .constants import (
     DEFAULT_AGENT_MODEL,
     DEFAULT_CAP_FACTOR,
+    DEFAULT_FEATURE_KEYFRAME_INTERVAL,
     DEFAULT_INITIAL_CAPITAL,
     DEFAULT_MAX_LEVERAGE,
     DEFAULT_MAX_POSITIONS,
@@ -257,6 +259,15 @@ class TradingConfig(BaseModel):
         description="Notional cap factor used by the composer to limit per-symbol exposure (e.g., 1.5)",
         gt=0,
     )
+    delta_features: bool = Field(
+        default=False,
+        description="Send the LLM only the feature values that changed since a periodically refreshed full keyframe",
+    )
+    feature_keyframe_interval: int = Field(
+        default=DEFAULT_FEATURE_KEYFRAME_INTERVAL,
+        description="Decision cycles a feature keyframe is reused before a full refresh (with delta_features)",
+        gt=0,
+    )
     # Grid parameters are model-decided at runtime; no user-configurable grid_* fields.
 
     @field_validator("symbols")
@@ -359,6 +370,96 @@ class Candle(BaseModel):
     interval: str = Field(..., description='Interval string, e.g., "1m", "5m"')
 
 
+@dataclass(frozen=True)
+class CandleBatch:
+    """Columnar OHLCV window of one instrument and interval.
+
+    Each field is a contiguous NumPy array sorted by ascending ``ts``, so a
+    whole window is a handful of arrays instead of one validated ``Candle``
+    per bar. Use ``from_candles`` / ``to_candles`` to bridge code that still
+    works with ``List[Candle]``.
+    """
+
+    instrument: InstrumentRef
+    interval: str
+    ts: np.ndarray  # int64, candle end timestamps in ms
+    open: np.ndarray  # float64
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
+    close: np.ndarray  # float64
+    volume: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def symbol(self) -> str:
+        return self.instrument.symbol
+
+    @classmethod
+    def from_rows(
+        cls,
+        instrument: InstrumentRef,
+        interval: str,
+        rows: Sequence[Sequence[Any]],
+    ) -> "CandleBatch":
+        """Build a batch from raw ``[ts, open, high, low, close, volume]`` rows."""
+        data = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        ts = data[:, 0].astype(np.int64)
+        if len(ts) > 1 and np.any(ts[1:] < ts[:-1]):
+            order = np.argsort(ts, kind="stable")
+            data, ts = data[order], ts[order]
+        return cls(
+            instrument=instrument,
+            interval=interval,
+            ts=ts,
+            open=np.ascontiguousarray(data[:, 1]),
+            high=np.ascontiguousarray(data[:, 2]),
+            low=np.ascontiguousarray(data[:, 3]),
+            close=np.ascontiguousarray(data[:, 4]),
+            volume=np.ascontiguousarray(data[:, 5]),
+        )
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Candle]) -> List["CandleBatch"]:
+        """Group candles into one batch per (symbol, interval), in first-seen order."""
+        grouped: Dict[tuple, List[Candle]] = {}
+        for candle in candles:
+            key = (candle.instrument.symbol, candle.interval)
+            grouped.setdefault(key, []).append(candle)
+        return [
+            cls.from_rows(
+                series[-1].instrument,
+                interval,
+                [(c.ts, c.open, c.high, c.low, c.close, c.volume) for c in series],
+            )
+            for (_, interval), series in grouped.items()
+        ]
+
+    def to_candles(self) -> List[Candle]:
+        """Expand the batch into per-bar ``Candle`` models."""
+        return [
+            Candle(
+                ts=int(ts),
+                instrument=self.instrument,
+                open=open_v,
+                high=high_v,
+                low=low_v,
+                close=close_v,
+                volume=vol,
+                interval=self.interval,
+            )
+            for ts, open_v, high_v, low_v, close_v, vol in zip(
+                self.ts.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+            )
+        ]
+
+
 class GridParamAdvice(BaseModel):
     """LLM-advised grid parameter set.
 
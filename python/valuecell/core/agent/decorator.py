@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Type
+import time
+from typing import List, Optional, Type
 
 import httpx
 import uvicorn
@@ -25,6 +26,7 @@ from valuecell.core.types import (
     CommonResponseEvent,
     NotifyResponse,
     StreamResponse,
+    StreamResponseEvent,
 )
 from valuecell.utils import parse_host_port
 
@@ -32,6 +34,16 @@ from .responses import EventPredicates
 
 logger = logging.getLogger(__name__)
 
+# Flush buffered chunks once this many bytes of text are pending ...
+DEFAULT_COALESCE_MAX_BYTES = 512
+# ... or once the oldest pending chunk has waited this long
+DEFAULT_COALESCE_MAX_DELAY_SECONDS = 0.03
+
+_COALESCABLE_EVENTS = {
+    StreamResponseEvent.MESSAGE_CHUNK,
+    StreamResponseEvent.REASONING,
+}
+
 
 def _serve(agent_card: AgentCard):
     """Create a decorator that wraps an agent class with server capabilities.
@@ -122,6 +134,77 @@ def _serve(agent_card: AgentCard):
     return decorator
 
 
+class _ChunkCoalescer:
+    """Merge consecutive streamed chunks into fewer A2A status updates.
+
+    Chunks of the same event type are concatenated until ``max_bytes`` are
+    pending or the oldest one has waited ``max_delay`` seconds. A chunk that
+    arrives after the stream was quiet for ``max_delay`` is sent right away,
+    so slow streams keep their latency and only fast ones are batched.
+    """
+
+    def __init__(
+        self,
+        updater: TaskUpdater,
+        max_bytes: int = DEFAULT_COALESCE_MAX_BYTES,
+        max_delay: float = DEFAULT_COALESCE_MAX_DELAY_SECONDS,
+    ):
+        self._updater = updater
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._event: Optional[StreamResponseEvent] = None
+        self._parts: List[str] = []
+        self._size = 0
+        self._last_sent = float("-inf")
+        self._timer: Optional[asyncio.Task] = None
+        # Keeps timer flushes and direct updates in stream order
+        self._lock = asyncio.Lock()
+
+    async def add(self, event: StreamResponseEvent, content: str) -> None:
+        if self._parts and event != self._event:
+            await self.flush()
+        self._event = event
+        self._parts.append(content)
+        self._size += len(content.encode("utf-8"))
+
+        idle = time.monotonic() - self._last_sent >= self._max_delay
+        if (len(self._parts) == 1 and idle) or self._size >= self._max_bytes:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        # Detach first: a flush in progress must not be cancelled
+        self._timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send pending chunks, if any, as one status update."""
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        async with self._lock:
+            if not self._parts:
+                return
+            content = "".join(self._parts)
+            event = self._event
+            self._parts = []
+            self._size = 0
+            await self._updater.update_status(
+                TaskState.working,
+                message=new_agent_text_message(content),
+                metadata={"response_event": event.value},
+            )
+            self._last_sent = time.monotonic()
+
+    async def send(self, **kwargs) -> None:
+        """Flush pending chunks, then send a status update unmerged."""
+        await self.flush()
+        async with self._lock:
+            await self._updater.update_status(TaskState.working, **kwargs)
+
+
 class GenericAgentExecutor(AgentExecutor):
     """Generic executor for BaseAgent implementations.
 
@@ -129,13 +212,22 @@ class GenericAgentExecutor(AgentExecutor):
     and error handling for agents that implement the BaseAgent interface.
     """
 
-    def __init__(self, agent: BaseAgent):
+    def __init__(
+        self,
+        agent: BaseAgent,
+        coalesce_max_bytes: int = DEFAULT_COALESCE_MAX_BYTES,
+        coalesce_max_delay: float = DEFAULT_COALESCE_MAX_DELAY_SECONDS,
+    ):
         """Initialize the executor with an agent instance.
 
         Args:
             agent: The agent instance to execute
+            coalesce_max_bytes: Pending chunk text that forces a status update
+            coalesce_max_delay: Longest time a streamed chunk is held back
         """
         self.agent = agent
+        self.coalesce_max_bytes = coalesce_max_bytes
+        self.coalesce_max_delay = coalesce_max_delay
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Execute the agent with the given context and event queue.
@@ -162,6 +254,10 @@ class GenericAgentExecutor(AgentExecutor):
         task_id = task.id
         context_id = task.context_id
         updater = TaskUpdater(event_queue, task_id, context_id)
+        # Token chunks are merged so each one does not cost a full A2A event
+        coalescer = _ChunkCoalescer(
+            updater, self.coalesce_max_bytes, self.coalesce_max_delay
+        )
 
         # Stream from the user agent and update task incrementally
         await updater.update_status(
@@ -193,20 +289,22 @@ class GenericAgentExecutor(AgentExecutor):
                         f"Agent {agent_name} reported failure: {response.content}"
                     )
 
+                if response_event in _COALESCABLE_EVENTS and response.content:
+                    await coalescer.add(response_event, response.content)
+                    continue
+
                 metadata = {"response_event": response_event.value}
                 if EventPredicates.is_tool_call(response_event):
                     metadata["tool_call_id"] = response.metadata.get("tool_call_id")
                     metadata["tool_name"] = response.metadata.get("tool_name")
                     metadata["tool_result"] = response.metadata.get("tool_result")
-                    await updater.update_status(
-                        TaskState.working,
+                    await coalescer.send(
                         message=new_agent_text_message(response.content or ""),
                         metadata=metadata,
                     )
                     continue
                 if EventPredicates.is_reasoning(response_event):
-                    await updater.update_status(
-                        TaskState.working,
+                    await coalescer.send(
                         message=new_agent_text_message(response.content or ""),
                         metadata=metadata,
                     )
@@ -217,8 +315,7 @@ class GenericAgentExecutor(AgentExecutor):
                 if response_event == CommonResponseEvent.COMPONENT_GENERATOR:
                     metadata["component_type"] = response.metadata.get("component_type")
                     metadata["component_id"] = response.metadata.get("component_id")
-                await updater.update_status(
-                    TaskState.working,
+                await coalescer.send(
                     message=new_agent_text_message(response.content or ""),
                     metadata=metadata,
                 )
@@ -226,11 +323,13 @@ class GenericAgentExecutor(AgentExecutor):
         except Exception as e:
             message = f"Error during {agent_name} agent execution: {e}"
             logger.error(message)
+            await coalescer.flush()
             await updater.update_status(
                 TaskState.failed,
                 message=new_agent_text_message(message, context_id, task_id),
             )
         finally:
+            await coalescer.flush()
             await updater.complete()
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -64,6 +64,24 @@ class MockToolCallAgent(BaseAgent):
         )
 
 
+class MockChunkAgent(BaseAgent):
+    """Mock agent streaming many small chunks followed by a tool call."""
+
+    async def stream(self, query, context_id, task_id, dependencies):
+        for i in range(10):
+            yield StreamResponse(event=StreamResponseEvent.REASONING, content=f"r{i}")
+        for i in range(10):
+            yield StreamResponse(
+                event=StreamResponseEvent.MESSAGE_CHUNK, content=f"m{i}"
+            )
+        yield StreamResponse(
+            event=StreamResponseEvent.TOOL_CALL_STARTED,
+            content="Tool call started",
+            metadata={"tool_call_id": "call-1", "tool_name": "t"},
+        )
+        yield StreamResponse(event=StreamResponseEvent.MESSAGE_CHUNK, content="end")
+
+
 class TestGenericAgentExecutor:
     """Test GenericAgentExecutor class."""
 
@@ -270,6 +288,45 @@ class TestGenericAgentExecutor:
 
             mock_updater.complete.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_coalesces_streamed_chunks(self):
+        """Fast chunks are merged per event type and flushed before tool calls."""
+        executor = GenericAgentExecutor(MockChunkAgent(), coalesce_max_delay=60)
+
+        context = MagicMock()
+        context.get_user_input.return_value = "test query"
+        context.current_task = MagicMock()
+        context.current_task.id = "task-123"
+        context.current_task.context_id = "context-456"
+        context.message = MagicMock()
+        context.message.metadata = {}
+
+        with patch("valuecell.core.agent.decorator.TaskUpdater") as mock_updater_class:
+            mock_updater = MagicMock()
+            mock_updater.update_status = AsyncMock()
+            mock_updater.complete = AsyncMock()
+            mock_updater_class.return_value = mock_updater
+
+            await executor.execute(context, event_queue=MagicMock(spec=EventQueue))
+
+        sent = [
+            (
+                call.kwargs["metadata"]["response_event"],
+                call.kwargs["message"].parts[0].root.text,
+            )
+            for call in mock_updater.update_status.call_args_list
+            if call.kwargs.get("metadata")
+        ]
+        assert sent == [
+            # The first chunk after a quiet period is not held back
+            ("reasoning", "r0"),
+            ("reasoning", "".join(f"r{i}" for i in range(1, 10))),
+            ("message_chunk", "".join(f"m{i}" for i in range(10))),
+            ("tool_call_started", "Tool call started"),
+            ("message_chunk", "end"),
+        ]
+        mock_updater.complete.assert_called_once()
+
 
 class TestCreateAgentExecutor:
     """Test _create_agent_executor function."""
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import aiosqlite
+from valuecell.utils.sqlite_pool import get_sqlite_pool
 
 from .models import Conversation
 
@@ -103,9 +103,9 @@ class InMemoryConversationStore(ConversationStore):
 class SQLiteConversationStore(ConversationStore):
     """SQLite-backed conversation store using aiosqlite for true async I/O.
 
-    Lazily initializes the database schema on first use. Uses aiosqlite to
-    perform non-blocking DB operations and converts rows to Conversation
-    instances.
+    Lazily initializes the database schema on first use. Shares the pooled
+    aiosqlite connections of its database file with the item and task stores
+    and converts rows to Conversation instances.
     """
 
     def __init__(self, db_path: str):
@@ -125,7 +125,7 @@ class SQLiteConversationStore(ConversationStore):
             if self._initialized:
                 return
 
-            async with aiosqlite.connect(self.db_path) as db:
+            async with get_sqlite_pool(self.db_path).writer() as db:
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversations (
@@ -139,7 +139,6 @@ class SQLiteConversationStore(ConversationStore):
                     )
                     """
                 )
-                await db.commit()
 
             self._initialized = True
 
@@ -159,7 +158,7 @@ class SQLiteConversationStore(ConversationStore):
     async def save_conversation(self, conversation: Conversation) -> None:
         """Save conversation to SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).writer() as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO conversations (
@@ -178,13 +177,11 @@ class SQLiteConversationStore(ConversationStore):
                     else str(conversation.status),
                 ),
             )
-            await db.commit()
 
     async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Load conversation from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT * FROM conversations WHERE conversation_id = ?",
                 (conversation_id,),
@@ -195,12 +192,11 @@ class SQLiteConversationStore(ConversationStore):
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).writer() as db:
             cur = await db.execute(
                 "DELETE FROM conversations WHERE conversation_id = ?",
                 (conversation_id,),
             )
-            await db.commit()
             return cur.rowcount > 0
 
     async def list_conversations(
@@ -208,9 +204,7 @@ class SQLiteConversationStore(ConversationStore):
     ) -> List[Conversation]:
         """List conversations from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
-
+        async with get_sqlite_pool(self.db_path).reader() as db:
             if user_id is None:
                 # Return all conversations
                 cur = await db.execute(
@@ -230,7 +224,7 @@ class SQLiteConversationStore(ConversationStore):
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists in SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT 1 FROM conversations WHERE conversation_id = ?",
                 (conversation_id,),
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import sqlite3
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
-import aiosqlite
-
 from valuecell.core.types import ConversationItem, ConversationItemEvent, Role
+from valuecell.utils.sqlite_pool import get_sqlite_pool
+
+
+def _append_payload_content(payload: Optional[str], extra: str) -> str:
+    """Append ``extra`` to the ``content`` field of a serialized payload."""
+    try:
+        obj = json.loads(payload) if payload else {}
+    except (TypeError, ValueError):
+        obj = {}
+    if not isinstance(obj, dict):
+        obj = {}
+    obj["content"] = (obj.get("content") or "") + extra
+    return json.dumps(obj, ensure_ascii=False)
 
 
 class ItemStore(ABC):
@@ -20,6 +32,25 @@ class ItemStore(ABC):
     @abstractmethod
     async def save_item(self, item: ConversationItem) -> None: ...
 
+    async def save_items(self, items: List[ConversationItem]) -> None:
+        """Save several items; stores may override to batch the writes."""
+        for item in items:
+            await self.save_item(item)
+
+    async def append_item_contents(self, contents: Dict[str, str]) -> None:
+        """Append streamed text to the payload content of existing items.
+
+        ``contents`` maps item_id to the text to append. Unknown ids are
+        ignored. The default implementation rewrites each item; stores may
+        override it to record deltas without rewriting the aggregate.
+        """
+        for item_id, text in contents.items():
+            item = await self.get_item(item_id)
+            if item is None or not text:
+                continue
+            item.payload = _append_payload_content(item.payload, text)
+            await self.save_item(item)
+
     @abstractmethod
     async def get_items(
         self,
@@ -59,6 +90,13 @@ class InMemoryItemStore(ItemStore):
         arr = self._items.setdefault(item.conversation_id, [])
         arr.append(item)
 
+    async def append_item_contents(self, contents: Dict[str, str]) -> None:
+        for arr in self._items.values():
+            for m in arr:
+                text = contents.get(m.item_id)
+                if text:
+                    m.payload = _append_payload_content(m.payload, text)
+
     async def get_items(
         self,
         conversation_id: Optional[str] = None,
@@ -103,9 +141,10 @@ class InMemoryItemStore(ItemStore):
 class SQLiteItemStore(ItemStore):
     """SQLite-backed item store using aiosqlite for true async I/O.
 
-    Lazily initializes the database schema on first use. Uses aiosqlite to
-    perform non-blocking DB operations and converts rows to ConversationItem
-    instances.
+    Lazily initializes the database schema on first use. Statements run on
+    the process-wide connection pool (see ``valuecell.utils.sqlite_pool``),
+    so streaming many items does not reconnect per write. Rows are converted
+    to ConversationItem instances.
     """
 
     def __init__(self, db_path: str):
@@ -121,7 +160,7 @@ class SQLiteItemStore(ItemStore):
         async with self._init_lock:
             if self._initialized:
                 return
-            async with aiosqlite.connect(self.db_path) as db:
+            async with get_sqlite_pool(self.db_path).writer() as db:
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversation_items (
@@ -144,7 +183,24 @@ class SQLiteItemStore(ItemStore):
                     ON conversation_items (conversation_id, created_at);
                     """
                 )
-                await db.commit()
+                # Append-only deltas for paragraphs that are still streaming.
+                # They are folded into the item on read and dropped once the
+                # full paragraph is saved.
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS conversation_item_chunks (
+                      chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                      item_id TEXT NOT NULL,
+                      content TEXT NOT NULL
+                    );
+                    """
+                )
+                await db.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_item_chunks_item
+                    ON conversation_item_chunks (item_id, chunk_id);
+                    """
+                )
             self._initialized = True
 
     @staticmethod
@@ -161,30 +217,87 @@ class SQLiteItemStore(ItemStore):
             metadata=row["metadata"],
         )
 
+    @staticmethod
+    def _item_to_row(item: ConversationItem) -> tuple:
+        return (
+            item.item_id,
+            getattr(item.role, "value", str(item.role)),
+            getattr(item.event, "value", str(item.event)),
+            item.conversation_id,
+            item.thread_id,
+            item.task_id,
+            item.payload,
+            item.agent_name,
+            item.metadata,
+        )
+
+    _UPSERT_SQL = """
+        INSERT OR REPLACE INTO conversation_items (
+            item_id, role, event, conversation_id, thread_id, task_id, payload, agent_name, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     async def save_item(self, item: ConversationItem) -> None:
+        await self.save_items([item])
+
+    async def save_items(self, items: List[ConversationItem]) -> None:
+        """Upsert all items in a single transaction.
+
+        A saved item is the full aggregate, so pending chunks for it are
+        discarded in the same transaction.
+        """
+        if not items:
+            return
         await self._ensure_initialized()
-        role_val = getattr(item.role, "value", str(item.role))
-        event_val = getattr(item.event, "value", str(item.event))
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
+        async with get_sqlite_pool(self.db_path).writer() as db:
+            await db.executemany(
+                self._UPSERT_SQL, [self._item_to_row(item) for item in items]
+            )
+            await db.executemany(
+                "DELETE FROM conversation_item_chunks WHERE item_id = ?",
+                [(item.item_id,) for item in items],
+            )
+
+    async def append_item_contents(self, contents: Dict[str, str]) -> None:
+        """Record streamed deltas without rewriting the item row."""
+        rows = [(item_id, text) for item_id, text in contents.items() if text]
+        if not rows:
+            return
+        await self._ensure_initialized()
+        async with get_sqlite_pool(self.db_path).writer() as db:
+            # Deltas for unknown items are dropped, as in the default behavior
+            await db.executemany(
                 """
-                INSERT OR REPLACE INTO conversation_items (
-                    item_id, role, event, conversation_id, thread_id, task_id, payload, agent_name, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO conversation_item_chunks (item_id, content)
+                SELECT item_id, ? FROM conversation_items WHERE item_id = ?
                 """,
-                (
-                    item.item_id,
-                    role_val,
-                    event_val,
-                    item.conversation_id,
-                    item.thread_id,
-                    item.task_id,
-                    item.payload,
-                    item.agent_name,
-                    item.metadata,
-                ),
+                [(text, item_id) for item_id, text in rows],
             )
-            await db.commit()
+
+    async def _rows_to_items(self, db, rows) -> List[ConversationItem]:
+        """Convert rows and fold in any pending chunks for those items."""
+        items = [self._row_to_item(r) for r in rows]
+        if not items:
+            return items
+        cur = await db.execute("SELECT 1 FROM conversation_item_chunks LIMIT 1")
+        if await cur.fetchone() is None:
+            return items
+        cur = await db.execute(
+            """
+            SELECT item_id, content FROM conversation_item_chunks
+            WHERE item_id IN (SELECT value FROM json_each(?))
+            ORDER BY chunk_id
+            """,
+            (json.dumps([item.item_id for item in items]),),
+        )
+        pending: Dict[str, List[str]] = {}
+        for item_id, content in await cur.fetchall():
+            pending.setdefault(item_id, []).append(content)
+        for item in items:
+            parts = pending.get(item.item_id)
+            if parts:
+                item.payload = _append_payload_content(item.payload, "".join(parts))
+        return items
 
     # TODO: consider pagination by agent_name
     async def get_items(
@@ -224,37 +337,34 @@ class SQLiteItemStore(ItemStore):
                 sql += " LIMIT -1"
             sql += " OFFSET ?"
             params.append(int(offset))
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(sql, params)
             rows = await cur.fetchall()
-            return [self._row_to_item(r) for r in rows]
+            return await self._rows_to_items(db, rows)
 
     async def get_latest_item(self, conversation_id: str) -> Optional[ConversationItem]:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT * FROM conversation_items WHERE conversation_id = ? ORDER BY datetime(created_at) DESC LIMIT 1",
                 (conversation_id,),
             )
             row = await cur.fetchone()
-            return self._row_to_item(row) if row else None
+            return (await self._rows_to_items(db, [row]))[0] if row else None
 
     async def get_item(self, item_id: str) -> Optional[ConversationItem]:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT * FROM conversation_items WHERE item_id = ?",
                 (item_id,),
             )
             row = await cur.fetchone()
-            return self._row_to_item(row) if row else None
+            return (await self._rows_to_items(db, [row]))[0] if row else None
 
     async def get_item_count(self, conversation_id: str) -> int:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT COUNT(1) FROM conversation_items WHERE conversation_id = ?",
                 (conversation_id,),
@@ -264,9 +374,16 @@ class SQLiteItemStore(ItemStore):
 
     async def delete_conversation_items(self, conversation_id: str) -> None:
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).writer() as db:
+            await db.execute(
+                """
+                DELETE FROM conversation_item_chunks WHERE item_id IN (
+                    SELECT item_id FROM conversation_items WHERE conversation_id = ?
+                )
+                """,
+                (conversation_id,),
+            )
             await db.execute(
                 "DELETE FROM conversation_items WHERE conversation_id = ?",
                 (conversation_id,),
             )
-            await db.commit()
@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from loguru import logger
 
@@ -79,8 +79,8 @@ class ConversationManager:
         """Check if conversation exists"""
         return await self.conversation_store.conversation_exists(conversation_id)
 
-    async def add_item(
-        self,
+    @staticmethod
+    def build_item(
         role: Role,
         event: ConversationItemEvent,
         conversation_id: str,
@@ -90,26 +90,8 @@ class ConversationManager:
         item_id: Optional[str] = None,
         agent_name: Optional[str] = None,
         metadata: Optional[ResponseMetadata] = None,
-    ) -> Optional[ConversationItem]:
-        """Add item to conversation
-
-        Args:
-            conversation_id: Conversation ID to add item to
-            role: Item role (USER, AGENT, SYSTEM)
-            event: Item event
-            thread_id: Thread ID (optional)
-            task_id: Associated task ID (optional)
-            payload: Item payload
-            item_id: Item ID (optional)
-            agent_name: Agent name (optional)
-            metadata: Additional metadata as dict (optional)
-        """
-        # Verify conversation exists
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            return None
-
-        # Create item
+    ) -> ConversationItem:
+        """Serialize payload and metadata into a storable ConversationItem."""
         # Serialize payload to JSON string if it's a pydantic model
         payload_str = None
         if payload is not None:
@@ -131,7 +113,7 @@ class ConversationManager:
                 metadata_str = "{}"
         metadata_str = metadata_str or "{}"
 
-        item = ConversationItem(
+        return ConversationItem(
             item_id=item_id or generate_item_id(),
             role=role,
             event=event,
@@ -143,6 +125,48 @@ class ConversationManager:
             metadata=metadata_str,
         )
 
+    async def add_item(
+        self,
+        role: Role,
+        event: ConversationItemEvent,
+        conversation_id: str,
+        thread_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        payload: Optional[ResponsePayload] = None,
+        item_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        metadata: Optional[ResponseMetadata] = None,
+    ) -> Optional[ConversationItem]:
+        """Add item to conversation
+
+        Args:
+            conversation_id: Conversation ID to add item to
+            role: Item role (USER, AGENT, SYSTEM)
+            event: Item event
+            thread_id: Thread ID (optional)
+            task_id: Associated task ID (optional)
+            payload: Item payload
+            item_id: Item ID (optional)
+            agent_name: Agent name (optional)
+            metadata: Additional metadata as dict (optional)
+        """
+        # Verify conversation exists
+        conversation = await self.get_conversation(conversation_id)
+        if not conversation:
+            return None
+
+        item = self.build_item(
+            role=role,
+            event=event,
+            conversation_id=conversation_id,
+            thread_id=thread_id,
+            task_id=task_id,
+            payload=payload,
+            item_id=item_id,
+            agent_name=agent_name,
+            metadata=metadata,
+        )
+
         # Save item directly to item store
         await self.item_store.save_item(item)
 
@@ -152,6 +176,38 @@ class ConversationManager:
 
         return item
 
+    async def add_items(self, items: List[ConversationItem]) -> List[ConversationItem]:
+        """Persist several prebuilt items in one store call.
+
+        Items whose conversation does not exist are skipped. Each affected
+        conversation is loaded and touched once regardless of how many items
+        it received.
+
+        Returns:
+            The items that were persisted.
+        """
+        conversations: Dict[str, Optional[Conversation]] = {}
+        for item in items:
+            if item.conversation_id not in conversations:
+                conversations[item.conversation_id] = await self.get_conversation(
+                    item.conversation_id
+                )
+
+        saved = [item for item in items if conversations[item.conversation_id]]
+        if not saved:
+            return []
+        await self.item_store.save_items(saved)
+
+        for conversation in conversations.values():
+            if conversation is not None:
+                conversation.touch()
+                await self.conversation_store.save_conversation(conversation)
+        return saved
+
+    async def append_item_contents(self, contents: Dict[str, str]) -> None:
+        """Append streamed text deltas (item_id -> text) to existing items."""
+        await self.item_store.append_item_contents(contents)
+
     async def get_conversation_items(
         self,
         conversation_id: Optional[str] = None,
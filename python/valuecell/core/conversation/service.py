@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from valuecell.core.conversation.manager import ConversationManager
 from valuecell.core.conversation.models import Conversation, ConversationStatus
@@ -114,6 +114,24 @@ class ConversationService:
             metadata=metadata,
         )
 
+    async def add_items(self, items: List[ConversationItem]) -> List[ConversationItem]:
+        """Persist a batch of prebuilt conversation items.
+
+        Items are typically produced with ``ConversationManager.build_item``.
+        Returns the items that were stored (unknown conversations are skipped).
+        """
+
+        return await self._manager.add_items(items)
+
+    async def append_item_contents(self, contents: Dict[str, str]) -> None:
+        """Append streamed text to already persisted items.
+
+        Args:
+            contents: Mapping of item_id to the text delta to append.
+        """
+
+        await self._manager.append_item_contents(contents)
+
     async def get_conversation_items(
         self,
         conversation_id: Optional[str] = None,
@@ -279,6 +279,43 @@ class TestConversationManager:
             "nonexistent"
         )
 
+    @pytest.mark.asyncio
+    async def test_add_items_batches_and_touches_once(self):
+        """Test adding several items touches each conversation once."""
+        manager = ConversationManager()
+        conversation = Conversation(conversation_id="conv-123", user_id="user-123")
+
+        async def load(conversation_id):
+            return conversation if conversation_id == "conv-123" else None
+
+        manager.conversation_store.load_conversation = AsyncMock(side_effect=load)
+        manager.conversation_store.save_conversation = AsyncMock()
+        manager.item_store.save_items = AsyncMock()
+
+        items = [
+            manager.build_item(
+                role=Role.AGENT,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id=conv_id,
+                payload='{"n": 1}',
+                item_id=item_id,
+            )
+            for conv_id, item_id in [
+                ("conv-123", "i1"),
+                ("conv-123", "i2"),
+                ("missing", "i3"),
+            ]
+        ]
+
+        saved = await manager.add_items(items)
+
+        assert [item.item_id for item in saved] == ["i1", "i2"]
+        manager.item_store.save_items.assert_awaited_once_with(saved)
+        assert manager.conversation_store.load_conversation.await_count == 2
+        manager.conversation_store.save_conversation.assert_awaited_once_with(
+            conversation
+        )
+
     @pytest.mark.asyncio
     async def test_add_item_with_pydantic_payload(self):
         """Test adding item with pydantic model payload."""
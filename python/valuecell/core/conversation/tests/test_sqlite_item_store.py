@@ -1,9 +1,17 @@
+import asyncio
+import json
 import os
 import tempfile
 
 import pytest
 from valuecell.core.conversation.item_store import SQLiteItemStore
-from valuecell.core.types import ConversationItem, Role, SystemResponseEvent
+from valuecell.core.types import (
+    ConversationItem,
+    Role,
+    StreamResponseEvent,
+    SystemResponseEvent,
+)
+from valuecell.utils.sqlite_pool import close_sqlite_pools, get_sqlite_pool
 
 
 @pytest.mark.asyncio
@@ -198,3 +206,87 @@ async def test_sqlite_item_store_filters_and_pagination():
     finally:
         if os.path.exists(path):
             os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_shares_pooled_connections():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+        other = SQLiteItemStore(path)
+        pool = get_sqlite_pool(path)
+        assert get_sqlite_pool(path) is pool
+
+        await asyncio.gather(
+            *[
+                (store if n % 2 else other).save_item(
+                    ConversationItem(
+                        item_id=f"p{n}",
+                        role=Role.AGENT,
+                        event=SystemResponseEvent.DONE,
+                        conversation_id="pooled",
+                        thread_id="t1",
+                        task_id=None,
+                        payload='{"a":1}',
+                        metadata="{}",
+                    )
+                )
+                for n in range(20)
+            ]
+        )
+
+        assert await other.get_item_count("pooled") == 20
+        # Every write above went through the single pooled writer connection
+        assert pool._writer is not None
+        assert len(pool._readers) <= pool.reader_count
+
+        async with pool.reader() as db:
+            cur = await db.execute("PRAGMA journal_mode")
+            assert (await cur.fetchone())[0] == "wal"
+    finally:
+        await close_sqlite_pools()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_appends_streamed_deltas():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+        item = ConversationItem(
+            item_id="para",
+            role=Role.AGENT,
+            event=StreamResponseEvent.MESSAGE_CHUNK,
+            conversation_id="s3",
+            thread_id="t1",
+            task_id="task",
+            payload='{"content":"Hel"}',
+            metadata="{}",
+        )
+        await store.save_item(item)
+        await store.append_item_contents({"para": "lo"})
+        await store.append_item_contents({"para": " world", "unknown": "x"})
+
+        # Reads fold pending deltas into the paragraph
+        loaded = await store.get_item("para")
+        assert json.loads(loaded.payload)["content"] == "Hello world"
+        (listed,) = await store.get_items("s3")
+        assert json.loads(listed.payload)["content"] == "Hello world"
+
+        # Saving the materialized paragraph drops the deltas
+        item.payload = '{"content":"Hello world!"}'
+        await store.save_item(item)
+        loaded = await store.get_item("para")
+        assert json.loads(loaded.payload)["content"] == "Hello world!"
+
+        pool = get_sqlite_pool(path)
+        async with pool.reader() as db:
+            cur = await db.execute("SELECT COUNT(1) FROM conversation_item_chunks")
+            assert (await cur.fetchone())[0] == 0
+    finally:
+        await close_sqlite_pools()
+        if os.path.exists(path):
+            os.remove(path)
@@ -6,6 +6,11 @@ from loguru import logger
 from valuecell.core.constants import ORIGINAL_USER_INPUT, PLANNING_TASK
 from valuecell.core.conversation import ConversationService, ConversationStatus
 from valuecell.core.event import EventResponseService
+from valuecell.core.event.replay import (
+    ReplayHub,
+    ReplayUnavailableError,
+    SequencedResponse,
+)
 from valuecell.core.plan import PlanService
 from valuecell.core.plan.models import ExecutionPlan
 from valuecell.core.super_agent import (
@@ -75,6 +80,7 @@ class AgentOrchestrator:
         plan_service: PlanService | None = None,
         super_agent_service: SuperAgentService | None = None,
         task_executor: TaskExecutor | None = None,
+        replay_hub: ReplayHub | None = None,
     ) -> None:
         services = AgentServiceBundle.compose(
             conversation_service=conversation_service,
@@ -92,6 +98,8 @@ class AgentOrchestrator:
 
         # Execution contexts keep track of paused planner runs.
         self._execution_contexts: Dict[str, ExecutionContext] = {}
+        # Recent responses per conversation so dropped streams can resume.
+        self.replay_hub = replay_hub or ReplayHub()
 
     # ==================== Public API Methods ====================
 
@@ -101,49 +109,76 @@ class AgentOrchestrator:
         """
         Stream responses for a user input, decoupled from the caller's lifetime.
 
-        This function now spawns a background producer task that runs the
-        planning/execution pipeline and emits responses. The async generator
-        here simply consumes from a local queue. If the consumer disconnects,
-        the background task continues, ensuring scheduled tasks and long-running
-        plans proceed independently of the SSE connection.
+        See ``stream_user_input``; this variant drops the event ids.
         """
-        # Per-invocation queue and active flag
-        queue: asyncio.Queue[Optional[BaseResponse]] = asyncio.Queue()
-        active = {"value": True}
+        async for _, response in self.stream_user_input(user_input):
+            yield response
+
+    async def stream_user_input(
+        self, user_input: UserInput
+    ) -> AsyncGenerator[SequencedResponse, None]:
+        """
+        Stream ``(event_id, response)`` pairs for a user input.
+
+        A background producer task runs the planning/execution pipeline and
+        publishes every response to the conversation's replay buffer, which
+        assigns monotonically increasing event ids. This generator follows
+        the producer through that buffer. If the consumer disconnects, the
+        background task continues, ensuring scheduled tasks and long-running
+        plans proceed independently of the SSE connection, and the consumer
+        can pick up again with ``resume_stream``.
+        """
+        conversation_id = user_input.meta.conversation_id
+        replay = self.replay_hub.get_or_create(conversation_id)
+        session_id = replay.start_session()
+        after_seq = replay.last_seq
 
         async def emit(item: Optional[BaseResponse]):
-            # Drop emissions if the consumer has gone away
-            if not active["value"]:
-                return
-            try:
-                await queue.put(item)
-            except Exception:
-                # Never fail producer due to queue issues; just drop
-                pass
+            if item is None:
+                replay.end_session(session_id)
+            else:
+                await replay.publish(session_id, item)
 
         logger.info(
             "process_user_input: starting background session for conversation {}",
-            user_input.meta.conversation_id,
+            conversation_id,
         )
         # Start background producer
         asyncio.create_task(self._run_session(user_input, emit))
 
-        try:
-            while True:
-                item = await queue.get()
-                if item is None:
-                    break
-                yield item
-        except asyncio.CancelledError:
-            # Consumer cancelled; mark inactive so producer stops enqueuing
-            active["value"] = False
-            # Do not cancel producer; it should continue independently
-            raise
-        finally:
-            # Mark inactive to stop further enqueues
-            active["value"] = False
-            # Best-effort: if producer already finished, nothing to do
-            # We deliberately do not cancel the producer to keep execution alive
+        # We deliberately do not cancel the producer when the consumer goes
+        # away to keep execution alive.
+        async for item in replay.subscribe(after_seq=after_seq, session_id=session_id):
+            yield item
+
+    def check_resumable(
+        self, conversation_id: str, last_event_id: Optional[int]
+    ) -> None:
+        """Raise ``ReplayUnavailableError`` unless the stream can be resumed.
+
+        With ``last_event_id`` every response after it must still be buffered;
+        without it any buffered stream of the conversation will do.
+        """
+        replay = self.replay_hub.get(conversation_id)
+        if replay is None:
+            raise ReplayUnavailableError(conversation_id, last_event_id, expired=False)
+        if last_event_id is not None and not replay.can_resume(last_event_id):
+            raise ReplayUnavailableError(conversation_id, last_event_id, expired=True)
+
+    async def resume_stream(
+        self, conversation_id: str, last_event_id: Optional[int] = None
+    ) -> AsyncGenerator[SequencedResponse, None]:
+        """Replay responses after ``last_event_id`` and follow live producers.
+
+        Only the recent responses kept in the replay buffer are available;
+        the stream ends once no producer is running for the conversation.
+        Raises ``ReplayUnavailableError`` when they are not (see
+        ``check_resumable``) rather than silently skipping the gap.
+        """
+        self.check_resumable(conversation_id, last_event_id)
+        replay = self.replay_hub.get(conversation_id)
+        async for item in replay.subscribe(after_seq=last_event_id or 0):
+            yield item
 
     # ==================== Private Helper Methods ====================
 
@@ -222,6 +257,8 @@ class AgentOrchestrator:
             )
             yield await self.event_service.emit(failure)
         finally:
+            # Make the whole session visible in history before signalling done
+            await self.event_service.flush()
             yield self.event_service.factory.done(conversation_id)
 
     async def _handle_conversation_continuation(
@@ -454,7 +491,7 @@ class AgentOrchestrator:
             conversation_id,
         )
         while not planning_task.done():
-            if self.plan_service.has_pending_request(conversation_id):
+            if await self._wait_for_planning_step(planning_task, conversation_id):
                 # Save planning context
                 context = ExecutionContext(
                     "planning", conversation_id, thread_id, user_id
@@ -477,8 +514,6 @@ class AgentOrchestrator:
                 yield await self.event_service.emit(response)
                 return
 
-            await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-
         logger.info(
             "_monitor_planning_task: planning completed for conversation {}; executing plan",
             conversation_id,
@@ -509,6 +544,31 @@ class AgentOrchestrator:
         async for response in self.task_executor.execute_plan(plan, thread_id):
             yield response
 
+    async def _wait_for_planning_step(
+        self, planning_task: asyncio.Future, conversation_id: str
+    ) -> bool:
+        """Wait until the planner finishes or asks the user for input.
+
+        Returns True when a user input request is pending while the planner
+        is still running. Both conditions are signalled, so this wakes up as
+        soon as either happens instead of polling.
+        """
+        if not planning_task.done() and not self.plan_service.has_pending_request(
+            conversation_id
+        ):
+            waiter = asyncio.ensure_future(
+                self.plan_service.wait_for_request(conversation_id)
+            )
+            try:
+                await asyncio.wait(
+                    {planning_task, waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                waiter.cancel()
+        return not planning_task.done() and self.plan_service.has_pending_request(
+            conversation_id
+        )
+
     def _validate_execution_context(
         self, context: ExecutionContext, user_id: str
     ) -> bool:
@@ -553,7 +613,7 @@ class AgentOrchestrator:
 
         # Continue monitoring planning task
         while not planning_task.done():
-            if self.plan_service.has_pending_request(conversation_id):
+            if await self._wait_for_planning_step(planning_task, conversation_id):
                 # Still need more user input, send request
                 prompt = self.plan_service.get_request_prompt(conversation_id) or ""
                 # Ensure conversation is set to require user input again for repeated prompts
@@ -564,8 +624,6 @@ class AgentOrchestrator:
                 yield await self.event_service.emit(response)
                 return
 
-            await asyncio.sleep(ASYNC_SLEEP_INTERVAL)
-
         # Planning completed, execute plan and clean up context
         plan = await planning_task
         del self._execution_contexts[conversation_id]
@@ -13,6 +13,7 @@ from valuecell.core.conversation import (
 )
 from valuecell.core.conversation.service import ConversationService
 from valuecell.core.event.service import EventResponseService
+from valuecell.core.event.writer import ItemWriteBehindQueue
 from valuecell.core.plan.service import PlanService
 from valuecell.core.super_agent import SuperAgentService
 from valuecell.core.task.executor import TaskExecutor
@@ -66,7 +67,8 @@ class AgentServiceBundle:
             conv_service = ConversationService(manager=base_manager)
 
         event_service = event_service or EventResponseService(
-            conversation_service=conv_service
+            conversation_service=conv_service,
+            item_writer=ItemWriteBehindQueue(conv_service),
         )
         # Prefer the process-local singleton for task service
         t_service = get_task_service()
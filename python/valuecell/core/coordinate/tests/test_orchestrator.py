@@ -29,6 +29,8 @@ from valuecell.core.agent.connect import RemoteConnections
 from valuecell.core.conversation import ConversationStatus
 from valuecell.core.conversation.service import ConversationService
 from valuecell.core.coordinate.orchestrator import AgentOrchestrator
+from valuecell.core.event.factory import ResponseFactory
+from valuecell.core.event.replay import ReplayHub, ReplayUnavailableError
 from valuecell.core.event.service import EventResponseService
 from valuecell.core.plan.models import ExecutionPlan
 from valuecell.core.plan.service import PlanService
@@ -456,6 +458,30 @@ async def test_happy_path_non_streaming(
     assert len(out) >= 1
 
 
+@pytest.mark.asyncio
+async def test_resume_stream_reports_unavailable_events(
+    orchestrator: AgentOrchestrator,
+):
+    orchestrator.replay_hub = ReplayHub(capacity=2)
+    with pytest.raises(ReplayUnavailableError) as unknown:
+        [item async for item in orchestrator.resume_stream("unknown", 0)]
+    assert not unknown.value.expired
+
+    replay = orchestrator.replay_hub.get_or_create("conv")
+    session = replay.start_session()
+    for _ in range(4):
+        await replay.publish(session, ResponseFactory().done("conv"))
+    replay.end_session(session)
+
+    # Event 2 is gone, so resuming after 1 would silently skip it
+    with pytest.raises(ReplayUnavailableError) as gap:
+        orchestrator.check_resumable("conv", 1)
+    assert gap.value.expired
+    assert [seq async for seq, _ in orchestrator.resume_stream("conv", 2)] == [3, 4]
+    # Without an id whatever is still buffered is replayed
+    assert [seq async for seq, _ in orchestrator.resume_stream("conv")] == [3, 4]
+
+
 @pytest.mark.asyncio
 async def test_planner_error(
     orchestrator: AgentOrchestrator, sample_user_input: UserInput
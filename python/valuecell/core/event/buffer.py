@@ -1,4 +1,5 @@
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -30,11 +31,17 @@ class SaveItem:
     role: Role = Role.AGENT
     agent_name: Optional[str] = None
     metadata: Optional[ResponseMetadata] = None
+    # When True, payload.content is a delta to append to the already persisted
+    # item instead of the full item content.
+    append: bool = False
 
 
 # conversation_id, thread_id, task_id, event
 BufferKey = Tuple[str, Optional[str], Optional[str], object]
 
+# Paragraphs that receive no chunk for this long are finalized and dropped.
+DEFAULT_IDLE_TIMEOUT_SECONDS = 15 * 60
+
 
 class BufferEntry:
     """Represents an in-memory paragraph buffer for streamed chunks.
@@ -58,6 +65,8 @@ class BufferEntry:
         self.item_id: str = item_id or generate_item_id()
         self.role: Optional[Role] = role
         self.agent_name: Optional[str] = agent_name
+        # Whether the item row has been written once; later chunks are deltas.
+        self.persisted: bool = False
 
     def append(self, text: str):
         """Append a chunk of text to this buffer and update the timestamp."""
@@ -83,14 +92,27 @@ class ResponseBuffer:
     - Some events are "immediate" and should be persisted as-is (tool results,
         component generator events, notify messages, system-level events).
     - Other events (message chunks, reasoning) are buffered and aggregated
-        into paragraph-level items which are upserted as streaming progress
-        is received. This preserves a stable paragraph `item_id` across chunks.
+        into paragraph-level items. The first chunk creates the item and
+        later chunks are emitted as append deltas; the aggregate is written
+        in full once the paragraph ends. This preserves a stable paragraph
+        `item_id` across chunks.
 
     The buffer key is a tuple (conversation_id, thread_id, task_id, event).
+    Keys are also indexed by conversation -> thread -> task so flushing one
+    task does not scan the buffers of other sessions. Entries idle for longer
+    than ``idle_timeout`` seconds are finalized on the next ingest, so
+    abandoned streams do not hold memory forever.
     """
 
-    def __init__(self):
-        self._buffers: Dict[BufferKey, BufferEntry] = {}
+    def __init__(self, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT_SECONDS):
+        # Ordered by last update (oldest first) so eviction stops early
+        self._buffers: "OrderedDict[BufferKey, BufferEntry]" = OrderedDict()
+        # conversation_id -> thread_id -> task_id -> buffer keys (as an
+        # insertion-ordered dict so flushes keep paragraph order)
+        self._index: Dict[
+            str, Dict[Optional[str], Dict[Optional[str], Dict[BufferKey, None]]]
+        ] = {}
+        self._idle_timeout = idle_timeout
 
         self._immediate_events = {
             StreamResponseEvent.TOOL_CALL_COMPLETED,
@@ -134,7 +156,7 @@ class ResponseBuffer:
             if not entry:
                 # Start a new paragraph buffer with a fresh paragraph item_id
                 entry = BufferEntry(role=data.role, agent_name=data.agent_name)
-                self._buffers[key] = entry
+                self._add_entry(key, entry)
             if entry.agent_name is None and data.agent_name:
                 entry.agent_name = data.agent_name
             # Stamp the response with the stable paragraph id
@@ -147,12 +169,19 @@ class ResponseBuffer:
 
         Depending on the event type this will either:
         - Flush and emit an immediate item (for immediate events), or
-        - Accumulate buffered chunks and emit an upsert SaveItem with the
-          current aggregated payload for the paragraph entry.
+        - Accumulate buffered chunks and emit a SaveItem carrying the new
+          chunk (flagged ``append`` after the first chunk of the paragraph).
+
+        Paragraphs of other contexts that went idle are finalized as well.
 
         Returns:
             A list of SaveItem objects that should be persisted by the caller.
         """
+        out = self._ingest(resp)
+        out.extend(self.evict_idle())
+        return out
+
+    def _ingest(self, resp: BaseResponse) -> List[SaveItem]:
         data: UnifiedResponseData = resp.data
         ev = resp.event
 
@@ -180,7 +209,7 @@ class ResponseBuffer:
             if not entry:
                 # If annotate() wasn't called, create an entry now.
                 entry = BufferEntry(role=data.role, agent_name=data.agent_name)
-                self._buffers[key] = entry
+                self._add_entry(key, entry)
             elif entry.agent_name is None and data.agent_name:
                 entry.agent_name = data.agent_name
 
@@ -199,17 +228,19 @@ class ResponseBuffer:
 
             if text:
                 entry.append(text)
-                # Always upsert current aggregate (no size-based rotation)
-                snap = entry.snapshot_payload()
-                if snap is not None:
-                    out.append(
-                        self._make_save_item(
-                            event=ev,
-                            data=data,
-                            payload=snap,
-                            item_id=entry.item_id,
-                        )
-                    )
+                self._buffers.move_to_end(key)
+                # The first chunk creates the item; later chunks are persisted
+                # as deltas so bytes written stay linear in paragraph length.
+                # The full paragraph is only materialized at a boundary.
+                save_item = self._make_save_item(
+                    event=ev,
+                    data=data,
+                    payload=BaseResponseDataPayload(content=text),
+                    item_id=entry.item_id,
+                )
+                save_item.append = entry.persisted
+                entry.persisted = True
+                out.append(save_item)
             return out
 
         # Other events: ignore for storage by default
@@ -217,22 +248,69 @@ class ResponseBuffer:
 
     # No flush API: paragraph boundaries are triggered by immediate events only
 
+    def evict_idle(self, now: Optional[float] = None) -> List[SaveItem]:
+        """Finalize and drop paragraphs that have been idle past the timeout.
+
+        Only the stale prefix of the buffers is visited, so the cost is
+        proportional to the number of evicted entries.
+        """
+        if self._idle_timeout is None:
+            return []
+        deadline = (time.monotonic() if now is None else now) - self._idle_timeout
+        stale: List[BufferKey] = []
+        for key, entry in self._buffers.items():
+            if entry.last_updated > deadline:
+                break
+            stale.append(key)
+        return self._finalize_keys(stale)
+
+    def _add_entry(self, key: BufferKey, entry: BufferEntry) -> None:
+        self._buffers[key] = entry
+        conv_id, thread_id, task_id, _ = key
+        threads = self._index.setdefault(conv_id, {})
+        threads.setdefault(thread_id, {}).setdefault(task_id, {})[key] = None
+
+    def _remove_entry(self, key: BufferKey) -> None:
+        self._buffers.pop(key, None)
+        conv_id, thread_id, task_id, _ = key
+        threads = self._index.get(conv_id)
+        if threads is None:
+            return
+        tasks = threads.get(thread_id)
+        if tasks is None:
+            return
+        keys = tasks.get(task_id)
+        if keys is None:
+            return
+        keys.pop(key, None)
+        # Prune empty levels so finished sessions leave nothing behind
+        if not keys:
+            del tasks[task_id]
+            if not tasks:
+                del threads[thread_id]
+                if not threads:
+                    del self._index[conv_id]
+
     def _collect_task_keys(
         self,
         conversation_id: str,
         thread_id: Optional[str],
         task_id: Optional[str],
     ) -> List[BufferKey]:
+        threads = self._index.get(conversation_id)
+        if not threads:
+            return []
+        if thread_id is None:
+            task_maps = list(threads.values())
+        else:
+            task_maps = [threads[thread_id]] if thread_id in threads else []
         keys: List[BufferKey] = []
-        for key in list(self._buffers.keys()):
-            k_conv, k_thread, k_task, k_event = key
-            if (
-                k_conv == conversation_id
-                and (thread_id is None or k_thread == thread_id)
-                and (task_id is None or k_task == task_id)
-                and k_event in self._buffered_events
-            ):
-                keys.append(key)
+        for tasks in task_maps:
+            if task_id is None:
+                for task_keys in tasks.values():
+                    keys.extend(task_keys)
+            else:
+                keys.extend(tasks.get(task_id, ()))
         return keys
 
     def _finalize_keys(self, keys: List[BufferKey]) -> List[SaveItem]:
@@ -256,8 +334,7 @@ class ResponseBuffer:
                         metadata=None,  # Buffered entries don't have metadata
                     )
                 )
-            if key in self._buffers:
-                del self._buffers[key]
+            self._remove_entry(key)
         return out
 
     def flush_task(
@@ -19,6 +19,7 @@ from valuecell.core.types import (
     ReasoningResponse,
     Role,
     ScheduledTaskComponentContent,
+    StreamLaggedResponse,
     StreamResponseEvent,
     SystemFailedResponse,
     SystemResponseEvent,
@@ -277,6 +278,26 @@ class ResponseFactory:
             )
         )
 
+    def stream_lagged(
+        self, conversation_id: str, last_event_id: int
+    ) -> StreamLaggedResponse:
+        """Return the response ending a lagging consumer's live stream.
+
+        Args:
+            conversation_id: The conversation id.
+            last_event_id: Id of the last response the consumer was sent.
+
+        Returns:
+            A StreamLaggedResponse telling the consumer where to resume.
+        """
+        return StreamLaggedResponse(
+            data=UnifiedResponseData(
+                conversation_id=conversation_id,
+                metadata={"last_event_id": last_event_id},
+                role=Role.SYSTEM,
+            )
+        )
+
     def plan_require_user_input(
         self, conversation_id: str, thread_id: str, content: str
     ) -> PlanRequireUserInputResponse:
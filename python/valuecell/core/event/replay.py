@@ -0,0 +1,418 @@
+"""Per-conversation replay buffers backing resumable SSE streams."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from valuecell.core.event.factory import ResponseFactory
+from valuecell.core.types import (
+    BaseResponse,
+    BaseResponseDataPayload,
+    StreamResponseEvent,
+)
+
+DEFAULT_REPLAY_CAPACITY = 1024
+DEFAULT_MAX_CONVERSATIONS = 256
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+
+# sequence id, response
+SequencedResponse = Tuple[int, BaseResponse]
+
+_COALESCABLE_EVENTS = {
+    StreamResponseEvent.MESSAGE_CHUNK,
+    StreamResponseEvent.REASONING,
+}
+
+
+class ReplayUnavailableError(LookupError):
+    """The events after a Last-Event-ID can no longer be replayed.
+
+    ``expired`` is False when nothing is buffered for the conversation (e.g.
+    after a restart or eviction) and True when the ring has moved past the
+    requested id, so some events in between are gone.
+    """
+
+    def __init__(
+        self, conversation_id: str, last_event_id: Optional[int], expired: bool
+    ):
+        self.conversation_id = conversation_id
+        self.last_event_id = last_event_id
+        self.expired = expired
+        if expired:
+            message = (
+                f"Events after {last_event_id} of conversation {conversation_id} "
+                "are no longer buffered"
+            )
+        else:
+            message = f"No buffered stream for conversation {conversation_id}"
+        super().__init__(message)
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with the next response.
+
+    - BLOCK: the producer waits until the consumer catches up.
+    - COALESCE: merge a streamed chunk into the queued chunk of the same
+      paragraph; any other response ends the lagging consumer's stream after
+      what is already queued with a ``stream_lagged`` response, so it resumes
+      from the replay ring with Last-Event-ID instead of holding up the
+      producer.
+    - DROP_REASONING: like COALESCE, but reasoning chunks that cannot be
+      merged are dropped instead.
+    """
+
+    BLOCK = "block"
+    COALESCE = "coalesce"
+    DROP_REASONING = "drop_reasoning"
+
+
+def _coalesce(
+    tail: SequencedResponse, seq: int, response: BaseResponse
+) -> Optional[SequencedResponse]:
+    """Merge ``response`` into ``tail`` when both are chunks of one paragraph."""
+    _, queued = tail
+    if response.event not in _COALESCABLE_EVENTS or queued.event != response.event:
+        return None
+    q_data, r_data = queued.data, response.data
+    if (
+        q_data.item_id is None
+        or q_data.item_id != r_data.item_id
+        or q_data.task_id != r_data.task_id
+        or q_data.thread_id != r_data.thread_id
+    ):
+        return None
+    q_payload, r_payload = q_data.payload, r_data.payload
+    if not isinstance(q_payload, BaseResponseDataPayload) or not isinstance(
+        r_payload, BaseResponseDataPayload
+    ):
+        return None
+    # Copy: the queued response is shared with the replay ring.
+    merged = queued.model_copy(
+        update={
+            "data": q_data.model_copy(
+                update={
+                    "payload": BaseResponseDataPayload(
+                        content=(q_payload.content or "") + (r_payload.content or "")
+                    )
+                }
+            )
+        }
+    )
+    # The merged entry carries the newest id so Last-Event-ID stays exact.
+    return seq, merged
+
+
+class _Subscriber:
+    """Bounded live queue of one consumer, optionally bound to one session."""
+
+    def __init__(
+        self,
+        session_id: Optional[int],
+        maxsize: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ):
+        self.session_id = session_id
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self._items: Deque[Optional[SequencedResponse]] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self.closed = False
+        # Ended because it fell behind (non-blocking policies only)
+        self.lagged = False
+        # Metrics
+        self.max_depth = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.blocked = 0
+
+    def wants(self, session_id: int) -> bool:
+        return self.session_id is None or self.session_id == session_id
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def _push(self, item: Optional[SequencedResponse]) -> None:
+        self._items.append(item)
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._readable.set()
+
+    async def put(self, seq: int, response: BaseResponse) -> None:
+        while not self.closed:
+            if len(self._items) < self.maxsize:
+                self._push((seq, response))
+                return
+            if self.policy != OverflowPolicy.BLOCK:
+                tail = self._items[-1]
+                merged = _coalesce(tail, seq, response) if tail else None
+                if merged is not None:
+                    self._items[-1] = merged
+                    self.coalesced += 1
+                    return
+                if (
+                    self.policy == OverflowPolicy.DROP_REASONING
+                    and response.event == StreamResponseEvent.REASONING
+                ):
+                    self.dropped += 1
+                    return
+                # Never wait on a slow consumer: end its stream after what
+                # is queued and tell it where to resume from the replay ring.
+                if tail is not None:
+                    last_seq = tail[0]
+                    conversation_id = response.data.conversation_id
+                    self._items.append(
+                        (
+                            last_seq,
+                            ResponseFactory().stream_lagged(conversation_id, last_seq),
+                        )
+                    )
+                    logger.info(
+                        "Replay subscriber of conversation {} lagged; ended its"
+                        " stream at event {}",
+                        conversation_id,
+                        last_seq,
+                    )
+                self.finish()
+                self.lagged = True
+                self.closed = True
+                return
+            self.blocked += 1
+            self._writable.clear()
+            await self._writable.wait()
+
+    def finish(self) -> None:
+        """Signal end of stream; never blocks, the marker is not counted."""
+        if self.closed:
+            return
+        self._items.append(None)
+        self._readable.set()
+
+    async def get(self) -> Optional[SequencedResponse]:
+        while not self._items:
+            self._readable.clear()
+            await self._readable.wait()
+        item = self._items.popleft()
+        self._writable.set()
+        return item
+
+    def close(self) -> None:
+        """Detach the consumer and release a producer blocked on it."""
+        self.closed = True
+        self._items.clear()
+        self._writable.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "policy": self.policy.value,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "lagged": self.lagged,
+        }
+
+
+class ConversationReplayBuffer:
+    """Bounded history of recent responses for one conversation.
+
+    Every published response gets the next sequence id, which only ever
+    increases for the lifetime of the buffer. The last ``capacity`` responses
+    are kept in a ring so a consumer reconnecting with the last id it saw can
+    replay just the gap and then follow the live producer.
+
+    Every live consumer (e.g. one per browser tab) gets its own queue of at
+    most ``queue_size`` entries. When it lags, ``overflow_policy`` decides
+    whether chunks are coalesced, reasoning is dropped, the consumer's
+    stream is ended (to be resumed by id), or the producer waits, so memory
+    stays flat however slow the client is.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_REPLAY_CAPACITY,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ):
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+        self._ring: Deque[Tuple[int, int, BaseResponse]] = deque(
+            maxlen=max(1, capacity)
+        )
+        self._last_seq = 0
+        self._next_session = 0
+        self._active_sessions: Set[int] = set()
+        self._subscribers: List[_Subscriber] = []
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Oldest sequence id still in the ring; ``last_seq + 1`` when empty."""
+        return self._ring[0][0] if self._ring else self._last_seq + 1
+
+    def can_resume(self, after_seq: int) -> bool:
+        """Whether every response after ``after_seq`` is still in the ring."""
+        return self.first_seq - 1 <= after_seq <= self._last_seq
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a producer session is still running."""
+        return bool(self._active_sessions)
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._active_sessions and not self._subscribers
+
+    def start_session(self) -> int:
+        """Register a producer and return its session id."""
+        self._next_session += 1
+        self._active_sessions.add(self._next_session)
+        return self._next_session
+
+    async def publish(self, session_id: int, response: BaseResponse) -> int:
+        """Record a response and fan it out to live subscribers.
+
+        Only waits for a lagging subscriber under ``OverflowPolicy.BLOCK``.
+        """
+        self._last_seq += 1
+        seq = self._last_seq
+        self._ring.append((seq, session_id, response))
+        for sub in list(self._subscribers):
+            if sub.wants(session_id):
+                await sub.put(seq, response)
+        return seq
+
+    def end_session(self, session_id: int) -> None:
+        """Mark a producer finished and release the consumers waiting on it."""
+        self._active_sessions.discard(session_id)
+        for sub in self._subscribers:
+            if sub.session_id == session_id or (
+                sub.session_id is None and not self._active_sessions
+            ):
+                sub.finish()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Queue depth metrics of every live subscriber."""
+        return [sub.stats() for sub in self._subscribers]
+
+    def _replay(
+        self, after_seq: int, session_id: Optional[int]
+    ) -> List[SequencedResponse]:
+        # An id from the future (e.g. issued before a restart) replays all.
+        if after_seq > self._last_seq:
+            after_seq = 0
+        return [
+            (seq, resp)
+            for seq, sid, resp in self._ring
+            if seq > after_seq and (session_id is None or sid == session_id)
+        ]
+
+    async def subscribe(
+        self, after_seq: int = 0, session_id: Optional[int] = None
+    ) -> AsyncGenerator[SequencedResponse, None]:
+        """Yield buffered responses newer than ``after_seq``, then live ones.
+
+        With ``session_id`` the stream follows that producer only and ends
+        with it. Without it the stream follows every producer of the
+        conversation and ends once none is running.
+        """
+        # Snapshot and registration happen without awaiting, so no publish
+        # can fall between the replayed and the live part.
+        backlog = self._replay(after_seq, session_id)
+        if session_id is None:
+            finished = not self._active_sessions
+        else:
+            finished = session_id not in self._active_sessions
+        if finished:
+            for item in backlog:
+                yield item
+            return
+
+        sub = _Subscriber(session_id, self._queue_size, self._overflow_policy)
+        self._subscribers.append(sub)
+        try:
+            for item in backlog:
+                yield item
+            while True:
+                item = await sub.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            self._subscribers.remove(sub)
+            sub.close()
+
+
+class ReplayHub:
+    """Registry of replay buffers keyed by conversation id.
+
+    At most ``max_conversations`` buffers are kept; the least recently used
+    ones without a running producer or consumer are dropped first.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_REPLAY_CAPACITY,
+        max_conversations: int = DEFAULT_MAX_CONVERSATIONS,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ):
+        self._capacity = capacity
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+        self._max_conversations = max(1, max_conversations)
+        self._buffers: "OrderedDict[str, ConversationReplayBuffer]" = OrderedDict()
+
+    def get(self, conversation_id: str) -> Optional[ConversationReplayBuffer]:
+        return self._buffers.get(conversation_id)
+
+    def get_or_create(self, conversation_id: str) -> ConversationReplayBuffer:
+        buffer = self._buffers.get(conversation_id)
+        if buffer is None:
+            buffer = ConversationReplayBuffer(
+                self._capacity, self._queue_size, self._overflow_policy
+            )
+            self._buffers[conversation_id] = buffer
+            self._evict()
+        else:
+            self._buffers.move_to_end(conversation_id)
+        return buffer
+
+    def _evict(self) -> None:
+        excess = len(self._buffers) - self._max_conversations
+        if excess <= 0:
+            return
+        for conversation_id in [
+            cid for cid, buf in self._buffers.items() if buf.is_idle
+        ][:excess]:
+            del self._buffers[conversation_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Settings and queue metrics of every busy conversation."""
+        return {
+            "capacity": self._capacity,
+            "queue_size": self._queue_size,
+            "overflow_policy": self._overflow_policy.value,
+            "conversations": {
+                conversation_id: {
+                    "first_seq": buffer.first_seq,
+                    "last_seq": buffer.last_seq,
+                    "active": buffer.is_active,
+                    "subscribers": buffer.stats(),
+                }
+                for conversation_id, buffer in self._buffers.items()
+                if not buffer.is_idle
+            },
+        }
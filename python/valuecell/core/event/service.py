@@ -8,22 +8,30 @@ from valuecell.core.conversation.service import ConversationService
 from valuecell.core.event.buffer import ResponseBuffer, SaveItem
 from valuecell.core.event.factory import ResponseFactory
 from valuecell.core.event.router import RouteResult, handle_status_update
+from valuecell.core.event.writer import ItemWriteBehindQueue
 from valuecell.core.task.models import Task
 from valuecell.core.types import BaseResponse
 
 
 class EventResponseService:
-    """Provide a single entry point for response creation and persistence."""
+    """Provide a single entry point for response creation and persistence.
+
+    When an ``item_writer`` is supplied, buffered items are handed to it and
+    written behind the stream instead of being awaited one by one; task
+    flushes and ``flush()`` still wait until everything is on disk.
+    """
 
     def __init__(
         self,
         conversation_service: ConversationService,
         response_factory: ResponseFactory | None = None,
         response_buffer: ResponseBuffer | None = None,
+        item_writer: ItemWriteBehindQueue | None = None,
     ) -> None:
         self._conversation_service = conversation_service
         self._factory = response_factory or ResponseFactory()
         self._buffer = response_buffer or ResponseBuffer()
+        self._item_writer = item_writer
 
     @property
     def factory(self) -> ResponseFactory:
@@ -55,6 +63,13 @@ class EventResponseService:
 
         items = self._buffer.flush_task(conversation_id, thread_id, task_id)
         await self._persist_items(items)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Wait until write-behind items (if any) are persisted."""
+
+        if self._item_writer is not None:
+            await self._item_writer.flush()
 
     async def route_task_status(self, task: Task, thread_id: str, event) -> RouteResult:
         """Route a task status update without side-effects."""
@@ -66,7 +81,15 @@ class EventResponseService:
         await self._persist_items(items)
 
     async def _persist_items(self, items: list[SaveItem]) -> None:
+        if self._item_writer is not None:
+            self._item_writer.submit(items)
+            return
         for item in items:
+            if item.append:
+                await self._conversation_service.append_item_contents(
+                    {item.item_id: getattr(item.payload, "content", None) or ""}
+                )
+                continue
             await self._conversation_service.add_item(
                 role=item.role,
                 event=item.event,
@@ -0,0 +1,184 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from valuecell.core.event.buffer import SaveItem
+from valuecell.core.event.service import EventResponseService
+from valuecell.core.event.writer import ItemWriteBehindQueue
+from valuecell.core.types import (
+    BaseResponseDataPayload,
+    NotifyResponseEvent,
+    StreamResponseEvent,
+)
+
+
+def _save_item(item_id: str, content: str, event=StreamResponseEvent.MESSAGE_CHUNK):
+    return SaveItem(
+        item_id=item_id,
+        event=event,
+        conversation_id="conv",
+        thread_id="thread",
+        task_id="task",
+        payload=BaseResponseDataPayload(content=content),
+    )
+
+
+@pytest.fixture()
+def conversation_service() -> AsyncMock:
+    service = AsyncMock()
+    service.add_items = AsyncMock(side_effect=lambda items: items)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_submit_coalesces_upserts_by_item_id(conversation_service):
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=60)
+
+    writer.submit([_save_item("p1", "a")])
+    writer.submit([_save_item("p1", "ab")])
+    writer.submit([_save_item("t1", "tool", NotifyResponseEvent.MESSAGE)])
+    writer.submit([_save_item("p1", "abc")])
+
+    assert writer.pending_count == 2
+    conversation_service.add_items.assert_not_awaited()
+
+    await writer.flush()
+
+    conversation_service.add_items.assert_awaited_once()
+    batch = conversation_service.add_items.call_args.args[0]
+    # Coalesced paragraph keeps its first position but carries the last payload
+    assert [item.item_id for item in batch] == ["p1", "t1"]
+    assert '"abc"' in batch[0].payload
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_timer_flushes_pending_items(conversation_service):
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=0.01)
+
+    writer.submit([_save_item("p1", "hello")])
+    await asyncio.sleep(0.05)
+
+    conversation_service.add_items.assert_awaited_once()
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting(conversation_service):
+    writer = ItemWriteBehindQueue(
+        conversation_service, flush_interval=60, max_batch_size=3
+    )
+
+    writer.submit([_save_item(f"i{n}", "x") for n in range(3)])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    conversation_service.add_items.assert_awaited_once()
+    assert len(conversation_service.add_items.call_args.args[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_requeued_with_its_deltas(conversation_service):
+    conversation_service.add_items = AsyncMock(
+        side_effect=[RuntimeError("database is locked"), None]
+    )
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=60)
+
+    writer.submit([_save_item("p1", "a")])
+    delta = _save_item("p1", "b")
+    delta.append = True
+    writer.submit([delta])
+
+    with pytest.raises(RuntimeError):
+        await writer.flush()
+
+    # Nothing was lost and no delta was appended to a missing row
+    conversation_service.append_item_contents.assert_not_awaited()
+    assert writer.pending_count == 2
+
+    await writer.flush()
+
+    assert conversation_service.add_items.await_count == 2
+    (item,) = conversation_service.add_items.call_args.args[0]
+    assert item.item_id == "p1"
+    conversation_service.append_item_contents.assert_awaited_once_with({"p1": "b"})
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_timer_retries_failed_batch(conversation_service):
+    conversation_service.add_items = AsyncMock(
+        side_effect=[RuntimeError("database is locked"), None]
+    )
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=0.01)
+
+    writer.submit([_save_item("p1", "x")])
+    await asyncio.sleep(0.1)
+
+    assert conversation_service.add_items.await_count == 2
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_close_drops_batch_after_max_attempts(conversation_service):
+    conversation_service.add_items = AsyncMock(side_effect=RuntimeError("disk"))
+    writer = ItemWriteBehindQueue(
+        conversation_service, flush_interval=0, max_attempts=3
+    )
+
+    writer.submit([_save_item("p1", "x")])
+    with pytest.raises(RuntimeError):
+        await writer.close()
+
+    assert conversation_service.add_items.await_count == 3
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_event_service_writes_behind_until_task_flush(conversation_service):
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=60)
+    service = EventResponseService(
+        conversation_service=conversation_service, item_writer=writer
+    )
+
+    for chunk in ["Hel", "lo"]:
+        await service.emit(
+            service.factory.message_response_general(
+                event=StreamResponseEvent.MESSAGE_CHUNK,
+                conversation_id="conv",
+                thread_id="thread",
+                task_id="task",
+                content=chunk,
+            )
+        )
+
+    conversation_service.add_item.assert_not_awaited()
+    conversation_service.add_items.assert_not_awaited()
+    # The paragraph item plus one pending delta
+    assert writer.pending_count == 2
+
+    await service.flush_task_response("conv", "thread", "task")
+
+    # The materialized paragraph supersedes the pending delta
+    conversation_service.add_items.assert_awaited_once()
+    conversation_service.append_item_contents.assert_not_awaited()
+    (item,) = conversation_service.add_items.call_args.args[0]
+    assert '"Hello"' in item.payload
+
+
+@pytest.mark.asyncio
+async def test_deltas_are_concatenated_after_base_item(conversation_service):
+    writer = ItemWriteBehindQueue(conversation_service, flush_interval=60)
+
+    first = _save_item("p1", "a")
+    writer.submit([first])
+    for text in ["b", "c"]:
+        delta = _save_item("p1", text)
+        delta.append = True
+        writer.submit([delta])
+
+    await writer.flush()
+
+    conversation_service.add_items.assert_awaited_once()
+    conversation_service.append_item_contents.assert_awaited_once_with({"p1": "bc"})
@@ -0,0 +1,233 @@
+"""
+Unit tests for valuecell.core.event.replay module
+"""
+
+import asyncio
+
+import pytest
+
+from valuecell.core.event.factory import ResponseFactory
+from valuecell.core.event.replay import (
+    ConversationReplayBuffer,
+    OverflowPolicy,
+    ReplayHub,
+)
+from valuecell.core.types import StreamResponseEvent, SystemResponseEvent
+
+
+def _response(conversation_id: str = "conv"):
+    return ResponseFactory().done(conversation_id)
+
+
+def _chunk(content: str, item_id: str = "para"):
+    return ResponseFactory().message_response_general(
+        StreamResponseEvent.MESSAGE_CHUNK, "conv", "thread", "task", content, item_id
+    )
+
+
+def _reasoning(content: str):
+    return ResponseFactory().reasoning(
+        "conv", "thread", "task", StreamResponseEvent.REASONING, content
+    )
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+@pytest.mark.asyncio
+async def test_live_subscriber_receives_ids_in_order():
+    buffer = ConversationReplayBuffer(capacity=8)
+    session = buffer.start_session()
+    results = asyncio.create_task(
+        _collect(buffer.subscribe(after_seq=buffer.last_seq, session_id=session))
+    )
+    await asyncio.sleep(0)
+
+    for _ in range(3):
+        await buffer.publish(session, _response())
+    buffer.end_session(session)
+
+    assert [seq for seq, _ in await results] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_gap_then_follows_live_producer():
+    buffer = ConversationReplayBuffer(capacity=8)
+    session = buffer.start_session()
+    for _ in range(3):
+        await buffer.publish(session, _response())
+
+    results = asyncio.create_task(_collect(buffer.subscribe(after_seq=1)))
+    await asyncio.sleep(0)
+    await buffer.publish(session, _response())
+    buffer.end_session(session)
+
+    assert [seq for seq, _ in await results] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_resume_after_session_end_returns_backlog_only():
+    buffer = ConversationReplayBuffer(capacity=2)
+    session = buffer.start_session()
+    for _ in range(5):
+        await buffer.publish(session, _response())
+    buffer.end_session(session)
+
+    # Older events fell out of the ring
+    assert [seq for seq, _ in await _collect(buffer.subscribe(after_seq=1))] == [4, 5]
+    # Unknown future ids (e.g. from before a restart) replay everything kept
+    assert [seq for seq, _ in await _collect(buffer.subscribe(after_seq=99))] == [
+        4,
+        5,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_can_resume_only_without_gap():
+    buffer = ConversationReplayBuffer(capacity=2)
+    assert buffer.can_resume(0)
+    session = buffer.start_session()
+    for _ in range(5):
+        await buffer.publish(session, _response())
+
+    assert buffer.first_seq == 4
+    # Event 3 already fell out of the ring
+    assert not buffer.can_resume(2)
+    assert buffer.can_resume(3)
+    assert buffer.can_resume(5)
+    # Ids this buffer never issued cannot be resumed either
+    assert not buffer.can_resume(99)
+
+
+def test_hub_evicts_only_idle_buffers():
+    hub = ReplayHub(capacity=4, max_conversations=2)
+    busy = hub.get_or_create("busy")
+    busy.start_session()
+    hub.get_or_create("idle")
+    hub.get_or_create("new")
+
+    assert hub.get("busy") is busy
+    assert hub.get("idle") is None
+    assert hub.get("new") is not None
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_coalesces_chunks():
+    buffer = ConversationReplayBuffer(queue_size=2)
+    session = buffer.start_session()
+    stream = buffer.subscribe(after_seq=0, session_id=session)
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    await buffer.publish(session, _chunk("a"))
+    first = await pending
+
+    # Nobody reads while these arrive
+    for text in ["b", "c", "d"]:
+        await buffer.publish(session, _chunk(text))
+
+    ((stats,),) = [buffer.stats()]
+    assert stats["depth"] == 2
+    assert stats["coalesced"] == 1
+
+    buffer.end_session(session)
+    received = [first] + [item async for item in stream]
+    assert [seq for seq, _ in received] == [1, 2, 4]
+    assert [r.data.payload.content for _, r in received] == ["a", "b", "cd"]
+    # The replay ring keeps the original, unmerged responses
+    assert [r.data.payload.content for _, r in await _collect(buffer.subscribe())] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_reasoning_policy_drops_when_full():
+    buffer = ConversationReplayBuffer(
+        queue_size=1, overflow_policy=OverflowPolicy.DROP_REASONING
+    )
+    session = buffer.start_session()
+    stream = buffer.subscribe(after_seq=0, session_id=session)
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    await buffer.publish(session, _reasoning("first"))
+    await buffer.publish(session, _reasoning("second"))
+
+    assert buffer.stats()[0]["dropped"] == 1
+    buffer.end_session(session)
+    received = [await pending] + [item async for item in stream]
+    assert [r.data.payload.content for _, r in received] == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_consumer():
+    buffer = ConversationReplayBuffer(
+        queue_size=1, overflow_policy=OverflowPolicy.BLOCK
+    )
+    session = buffer.start_session()
+    stream = buffer.subscribe(after_seq=0, session_id=session)
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    await buffer.publish(session, _chunk("a"))
+    assert (await first)[0] == 1
+
+    await buffer.publish(session, _chunk("b"))
+    blocked = asyncio.create_task(buffer.publish(session, _chunk("c")))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert buffer.stats()[0]["blocked"] == 1
+
+    assert (await stream.__anext__())[0] == 2
+    assert await blocked == 3
+    assert (await stream.__anext__())[0] == 3
+    await stream.aclose()
+    assert buffer.stats() == []
+
+
+@pytest.mark.asyncio
+async def test_stalled_subscriber_does_not_hold_up_producer_or_others():
+    buffer = ConversationReplayBuffer(queue_size=2)
+    session = buffer.start_session()
+    fast = asyncio.create_task(_collect(buffer.subscribe(after_seq=0)))
+    stalled = buffer.subscribe(after_seq=0)
+    first = asyncio.ensure_future(stalled.__anext__())
+    await asyncio.sleep(0)
+
+    # Responses that cannot be coalesced overflow the stalled queue
+    for _ in range(6):
+        await asyncio.wait_for(buffer.publish(session, _response()), timeout=1)
+        await asyncio.sleep(0)
+    buffer.end_session(session)
+
+    assert [seq for seq, _ in await fast] == [1, 2, 3, 4, 5, 6]
+
+    # The stalled stream ends after what it had queued, with a marker that
+    # names the id to resume from ...
+    received = [await first] + [item async for item in stalled]
+    assert [seq for seq, _ in received] == [1, 2, 3, 3]
+    lagged = received[-1][1]
+    assert lagged.event == SystemResponseEvent.STREAM_LAGGED
+    assert lagged.data.metadata == {"last_event_id": 3}
+    # ... and resumes from the replay ring with that id
+    resumed = await _collect(buffer.subscribe(after_seq=received[-1][0]))
+    assert [seq for seq, _ in resumed] == [4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_hub_stats_report_settings_and_busy_conversations():
+    hub = ReplayHub(queue_size=4, overflow_policy=OverflowPolicy.BLOCK)
+    busy = hub.get_or_create("busy")
+    session = busy.start_session()
+    await busy.publish(session, _response())
+    hub.get_or_create("idle")
+
+    stats = hub.stats()
+    assert stats["queue_size"] == 4
+    assert stats["overflow_policy"] == "block"
+    assert stats["conversations"] == {
+        "busy": {"first_seq": 1, "last_seq": 1, "active": True, "subscribers": []}
+    }
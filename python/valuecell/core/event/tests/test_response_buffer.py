@@ -295,7 +295,17 @@ class TestResponseBuffer:
         assert len(result1) == 1
         assert len(result2) == 1
         assert result1[0].payload.content == "Hello"
-        assert result2[0].payload.content == "Hello World"
+        assert result1[0].append is False
+        # Later chunks are deltas against the persisted item
+        assert result2[0].payload.content == " World"
+        assert result2[0].append is True
+        assert result2[0].item_id == result1[0].item_id
+
+        # The boundary materializes the whole paragraph once
+        flushed = buffer.flush_task("conv-123", None, None)
+        assert len(flushed) == 1
+        assert flushed[0].payload.content == "Hello World"
+        assert flushed[0].append is False
 
     @pytest.mark.asyncio
     async def test_ingest_unknown_event(self):
@@ -416,6 +426,62 @@ class TestResponseBuffer:
         assert key1 not in buffer._buffers
         assert key2 in buffer._buffers
 
+    def test_flush_conversation_prunes_index(self):
+        """Test flushing a whole conversation leaves no index entries behind."""
+        buffer = ResponseBuffer()
+        for conv_id, task_id in [("conv-a", "t1"), ("conv-a", "t2"), ("conv-b", "t1")]:
+            buffer.ingest(
+                BaseResponse(
+                    event=StreamResponseEvent.MESSAGE_CHUNK,
+                    data=UnifiedResponseData(
+                        conversation_id=conv_id,
+                        thread_id="thread",
+                        task_id=task_id,
+                        role=Role.AGENT,
+                        payload=BaseResponseDataPayload(content=task_id),
+                    ),
+                )
+            )
+
+        result = buffer.flush_task("conv-a", None, None)
+
+        assert [item.task_id for item in result] == ["t1", "t2"]
+        assert "conv-a" not in buffer._index
+        assert list(buffer._buffers) == [
+            ("conv-b", "thread", "t1", StreamResponseEvent.MESSAGE_CHUNK)
+        ]
+
+    def test_evict_idle_finalizes_stale_paragraphs(self):
+        """Test idle paragraphs are finalized while active ones are kept."""
+        buffer = ResponseBuffer(idle_timeout=60)
+
+        def chunk(task_id: str, text: str) -> BaseResponse:
+            return BaseResponse(
+                event=StreamResponseEvent.MESSAGE_CHUNK,
+                data=UnifiedResponseData(
+                    conversation_id="conv",
+                    thread_id="thread",
+                    task_id=task_id,
+                    role=Role.AGENT,
+                    payload=BaseResponseDataPayload(content=text),
+                ),
+            )
+
+        buffer.ingest(chunk("stale", "old"))
+        buffer.ingest(chunk("active", "new"))
+        stale_key = ("conv", "thread", "stale", StreamResponseEvent.MESSAGE_CHUNK)
+        buffer._buffers[stale_key].last_updated -= 120
+
+        result = buffer.evict_idle()
+
+        assert len(result) == 1
+        assert result[0].task_id == "stale"
+        assert result[0].payload.content == "old"
+        assert not result[0].append
+        assert stale_key not in buffer._buffers
+        assert buffer.flush_task("conv", "thread", "stale") == []
+        assert len(buffer._buffers) == 1
+
     def test_make_save_item_from_response_with_base_payload(self):
         """Test _make_save_item_from_response with BaseResponseDataPayload."""
         buffer = ResponseBuffer()
@@ -0,0 +1,232 @@
+"""Write-behind persistence for buffered conversation items."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from valuecell.core.conversation.manager import ConversationManager
+from valuecell.core.conversation.service import ConversationService
+from valuecell.core.event.buffer import SaveItem
+from valuecell.core.types import ConversationItem
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+DEFAULT_MAX_BATCH_SIZE = 256
+# Consecutive failed writes after which a batch is dropped
+DEFAULT_MAX_WRITE_ATTEMPTS = 5
+
+_WRITERS: "weakref.WeakSet[ItemWriteBehindQueue]" = weakref.WeakSet()
+
+
+class ItemWriteBehindQueue:
+    """Coalesce and batch conversation item writes off the streaming path.
+
+    ``submit`` only records items in memory. Upserts to the same ``item_id``
+    replace the pending value while keeping their original position, and
+    append deltas for one item are concatenated, so each flush touches every
+    item at most once. Pending items are written through
+    ``ConversationService.add_items`` / ``append_item_contents`` when
+    ``flush_interval`` elapses, when ``max_batch_size`` items are pending, or
+    when ``flush``/``close`` is awaited. Failed writes are requeued and
+    retried a bounded number of times.
+    """
+
+    def __init__(
+        self,
+        conversation_service: ConversationService,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_WRITE_ATTEMPTS,
+    ) -> None:
+        self._conversation_service = conversation_service
+        self._flush_interval = flush_interval
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_attempts = max(1, max_attempts)
+        self._failed_attempts = 0
+        self._dropped_count = 0
+        # item_id -> latest version of the item, in first-submitted order
+        self._pending: Dict[str, ConversationItem] = {}
+        # item_id -> text deltas to append after the item exists
+        self._deltas: Dict[str, List[str]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None  # lazy to avoid loop-binding
+        self._closed = False
+        _WRITERS.add(self)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._deltas)
+
+    def submit(self, items: Iterable[SaveItem]) -> None:
+        """Queue items for persistence without waiting on storage."""
+        for save_item in items:
+            if save_item.append:
+                text = getattr(save_item.payload, "content", None)
+                if text:
+                    self._deltas.setdefault(save_item.item_id, []).append(text)
+                continue
+            # A full item supersedes deltas recorded before it
+            self._deltas.pop(save_item.item_id, None)
+            item = ConversationManager.build_item(
+                role=save_item.role,
+                event=save_item.event,
+                conversation_id=save_item.conversation_id,
+                thread_id=save_item.thread_id,
+                task_id=save_item.task_id,
+                payload=save_item.payload,
+                item_id=save_item.item_id,
+                agent_name=save_item.agent_name,
+                metadata=save_item.metadata,
+            )
+            self._pending[item.item_id] = item
+
+        if not self.pending_count or self._closed:
+            return
+        if self.pending_count >= self._max_batch_size:
+            self._schedule_flush(delay=0)
+        else:
+            self._schedule_flush(delay=self._flush_interval)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            if delay > 0:
+                return
+            # Batch is full: skip the remaining wait of the timer.
+            self._flush_task.cancel()
+        self._flush_task = asyncio.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Shield the write itself so a superseding schedule cannot abort it.
+        await asyncio.shield(self._background_flush())
+
+    async def _background_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to persist buffered conversation items")
+            # Failed batches were requeued; try again after the next interval
+            if self.pending_count and not self._closed:
+                self._flush_task = asyncio.create_task(
+                    self._flush_after(self._flush_interval)
+                )
+
+    async def flush(self) -> None:
+        """Write every pending item, in submission order.
+
+        A batch that fails to write is put back at the front of the queue,
+        together with its deltas, and the error is raised. After
+        ``max_attempts`` consecutive failures the batch is dropped instead.
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            while self.pending_count:
+                batch: List[ConversationItem] = list(self._pending.values())[
+                    : self._max_batch_size
+                ]
+                for item in batch:
+                    self._pending.pop(item.item_id, None)
+                if batch:
+                    try:
+                        await self._conversation_service.add_items(batch)
+                    except Exception:
+                        self._requeue_items(batch)
+                        raise
+                    self._failed_attempts = 0
+
+                # Deltas wait until their base item has been written
+                contents = {
+                    item_id: "".join(parts)
+                    for item_id, parts in self._deltas.items()
+                    if item_id not in self._pending
+                }
+                for item_id in contents:
+                    self._deltas.pop(item_id, None)
+                if contents:
+                    try:
+                        await self._conversation_service.append_item_contents(contents)
+                    except Exception:
+                        self._requeue_deltas(contents)
+                        raise
+                    self._failed_attempts = 0
+
+    def _record_failure(self) -> bool:
+        """Count a failed write; True when the failed rows should be retried."""
+        self._failed_attempts += 1
+        if self._failed_attempts < self._max_attempts:
+            return True
+        self._failed_attempts = 0
+        self._dropped_count += 1
+        return False
+
+    def _requeue_items(self, batch: List[ConversationItem]) -> None:
+        if not self._record_failure():
+            for item in batch:
+                self._deltas.pop(item.item_id, None)
+            logger.error(
+                "Dropping {} conversation items after {} failed writes",
+                len(batch),
+                self._max_attempts,
+            )
+            return
+        # Back to the front, keeping versions submitted during the write
+        requeued = {
+            item.item_id: self._pending.get(item.item_id, item) for item in batch
+        }
+        requeued.update(self._pending)
+        self._pending = requeued
+
+    def _requeue_deltas(self, contents: Dict[str, str]) -> None:
+        if not self._record_failure():
+            logger.error(
+                "Dropping {} streamed item deltas after {} failed writes",
+                len(contents),
+                self._max_attempts,
+            )
+            return
+        for item_id, text in contents.items():
+            if item_id in self._pending:
+                # A full item submitted meanwhile supersedes the deltas
+                continue
+            self._deltas[item_id] = [text] + self._deltas.get(item_id, [])
+
+    async def close(self) -> None:
+        """Flush outstanding items and stop accepting timed flushes.
+
+        Failed batches are retried until written or dropped; raises the last
+        write error if any rows were dropped.
+        """
+        self._closed = True
+        task = self._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+        dropped_before = self._dropped_count
+        error: Optional[Exception] = None
+        try:
+            while True:
+                try:
+                    await self.flush()
+                    break
+                except Exception as exc:
+                    error = exc
+                    if not self.pending_count:
+                        break
+                    await asyncio.sleep(self._flush_interval)
+        finally:
+            _WRITERS.discard(self)
+        if error is not None and self._dropped_count > dropped_before:
+            raise error
+
+
+async def close_item_writers() -> None:
+    """Flush and close every live write-behind queue (used at shutdown)."""
+    for writer in list(_WRITERS):
+        try:
+            await writer.close()
+        except Exception:
+            logger.exception("Failed to flush conversation items at shutdown")
@@ -48,6 +48,10 @@ class _TaskBrief(BaseModel):
     schedule_config: Optional[ScheduleConfig] = Field(
         None, description="Schedule configuration for recurring tasks"
     )
+    depends_on: Optional[List[int]] = Field(
+        None,
+        description="0-based positions of earlier tasks in the list that must finish first; empty for independent tasks, omitted to run after the previous task",
+    )
 
 
 class PlannerInput(BaseModel):
@@ -307,6 +307,18 @@ class ExecutionPlanner:
                     handoff_from_super_agent=(not user_input.target_agent_name),
                 )
             )
+        # Resolve positional dependencies to task ids; only earlier tasks count.
+        # Tasks the planner did not mark run after the previous one, so only
+        # tasks explicitly marked independent run concurrently.
+        for index, (brief, task) in enumerate(zip(plan_raw.tasks, tasks)):
+            positions = getattr(brief, "depends_on", None)
+            if positions is None:
+                positions = [index - 1] if index else []
+            task.depends_on = [
+                tasks[dep].task_id
+                for dep in dict.fromkeys(positions)
+                if 0 <= dep < index
+            ]
 
         return tasks, guidance_message  # Return tasks with no guidance message
 
@@ -66,6 +66,11 @@ Act as a transparent proxy for the user: if they specify a target agent, forward
 6) Title and language
 - Titles must be concise: English ≤ 10 words; CJK (Chinese/Japanese/Korean) ≤ 20 characters.
 - Always respond in the user's language. Both `guidance_message` and `query` must use the user's language.
+
+7) Task dependencies
+- When a plan has more than one task, set `depends_on` on every task: the 0-based positions of earlier tasks whose results it needs.
+- Use `[]` only when the task can run at the same time as the others without needing any of their results.
+- A task without `depends_on` runs after the previous task.
 </core_rules>
 
 <tools>
@@ -113,7 +118,8 @@ Output valid JSON only (no markdown, backticks, or comments):
       "schedule_config": {
         "interval_minutes": <integer or null>,
         "daily_time": "<HH:MM or null>"
-      }
+      },
+      "depends_on": [<0-based positions of earlier tasks it needs>]
     }
   ],
   "adequate": true/false,
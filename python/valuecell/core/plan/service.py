@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, Optional, Set
 
 from valuecell.core.agent.connect import RemoteConnections
 from valuecell.core.plan.models import ExecutionPlan
@@ -24,13 +24,35 @@ from valuecell.utils import generate_uuid
 
 
 class UserInputRegistry:
-    """In-memory store for pending planner-driven user input requests."""
+    """In-memory store for pending planner-driven user input requests.
+
+    Coroutines can ``wait_for_request`` instead of polling ``has_request``;
+    they are woken as soon as a request is registered.
+    """
 
     def __init__(self) -> None:
         self._pending: Dict[str, UserInputRequest] = {}
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
 
     def add_request(self, conversation_id: str, request: UserInputRequest) -> None:
         self._pending[conversation_id] = request
+        for event in self._waiters.pop(conversation_id, ()):
+            event.set()
+
+    async def wait_for_request(self, conversation_id: str) -> None:
+        """Return once a request is pending for the conversation."""
+        if conversation_id in self._pending:
+            return
+        event = asyncio.Event()
+        self._waiters.setdefault(conversation_id, set()).add(event)
+        try:
+            await event.wait()
+        finally:
+            waiters = self._waiters.get(conversation_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[conversation_id]
 
     def has_request(self, conversation_id: str) -> bool:
         return conversation_id in self._pending
@@ -75,6 +97,9 @@ class PlanService:
     def has_pending_request(self, conversation_id: str) -> bool:
         return self._input_registry.has_request(conversation_id)
 
+    async def wait_for_request(self, conversation_id: str) -> None:
+        await self._input_registry.wait_for_request(conversation_id)
+
     def get_request_prompt(self, conversation_id: str) -> Optional[str]:
         return self._input_registry.get_prompt(conversation_id)
 
@@ -389,3 +389,59 @@ async def test_malformed_response_unknown_model_description(
     plan = await planner.create_plan(user_input, callback, "thread-x")
     assert plan.guidance_message
     assert "unknown model/provider" in plan.guidance_message
+
+
+@pytest.mark.asyncio
+async def test_create_plan_resolves_task_dependencies(monkeypatch: pytest.MonkeyPatch):
+    brief = {"query": "q", "agent_name": "ResearchAgent", "pattern": "once"}
+    final_plan = PlannerResponse.model_validate(
+        {
+            "adequate": True,
+            "reason": "ok",
+            "tasks": [
+                {**brief, "title": "A"},
+                {**brief, "title": "B", "depends_on": [0, 0, 2, 5]},
+                {**brief, "title": "C", "depends_on": [0, 1]},
+                {**brief, "title": "D"},
+                {**brief, "title": "E", "depends_on": []},
+            ],
+        }
+    )
+    response = SimpleNamespace(
+        is_paused=False, tools=[], tools_requiring_user_input=[], content=final_plan
+    )
+
+    class FakeAgent:
+        def __init__(self, *args, **kwargs):
+            self.model = SimpleNamespace(id="fake-model", provider="fake-provider")
+
+        def run(self, *args, **kwargs):
+            return response
+
+    monkeypatch.setattr(planner_mod, "Agent", FakeAgent)
+    monkeypatch.setattr(
+        model_utils_mod, "get_model_for_agent", lambda *args, **kwargs: "stub-model"
+    )
+    monkeypatch.setattr(planner_mod, "agent_debug_mode_enabled", lambda: False)
+
+    research_card = SimpleNamespace(name="ResearchAgent", description="Research")
+    planner = ExecutionPlanner(StubConnections({"ResearchAgent": research_card}))
+    user_input = UserInput(
+        query="research",
+        target_agent_name="ResearchAgent",
+        meta=UserInputMetadata(conversation_id="conv-1", user_id="user-1"),
+    )
+
+    async def callback(request):  # pragma: no cover - not paused
+        request.provide_response("")
+
+    plan = await planner.create_plan(user_input, callback, "thread-1")
+
+    a, b, c, d, e = plan.tasks
+    assert a.depends_on == []
+    # Duplicates, forward and out-of-range references are dropped
+    assert b.depends_on == [a.task_id]
+    assert c.depends_on == [a.task_id, b.task_id]
+    # Unmarked tasks run after the previous one; only `[]` means independent
+    assert d.depends_on == [c.task_id]
+    assert e.depends_on == []
@@ -92,3 +92,16 @@ async def test_start_planning_task_uses_asyncio_create_task(
     assert scheduled_tasks, "expected create_task to be invoked"
     await asyncio.sleep(0)
     task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_request_wakes_on_register(plan_service: PlanService):
+    waiter = asyncio.create_task(plan_service.wait_for_request("conv"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    plan_service.register_user_input("conv", UserInputRequest(prompt="fill this"))
+
+    await asyncio.wait_for(waiter, 1)
+    # Returns immediately while a request is already pending
+    await asyncio.wait_for(plan_service.wait_for_request("conv"), 1)
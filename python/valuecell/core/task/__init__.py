@@ -3,6 +3,7 @@
 from .executor import TaskExecutor
 from .manager import TaskManager
 from .models import Task, TaskPattern, TaskStatus
+from .scheduler import MissedRunPolicy, TaskScheduler
 from .task_store import InMemoryTaskStore, SQLiteTaskStore, TaskStore
 
 __all__ = [
@@ -11,6 +12,8 @@ __all__ = [
     "TaskPattern",
     "TaskManager",
     "TaskExecutor",
+    "TaskScheduler",
+    "MissedRunPolicy",
     "TaskStore",
     "InMemoryTaskStore",
     "SQLiteTaskStore",
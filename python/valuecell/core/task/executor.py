@@ -1,7 +1,9 @@
 import asyncio
 import json
+from collections import deque
 from datetime import datetime, timezone
-from typing import AsyncGenerator, Awaitable, Callable, Iterable, Optional
+from functools import partial
+from typing import AsyncGenerator, Awaitable, Callable, Deque, Dict, Iterable, Optional
 
 from a2a.types import TaskArtifactUpdateEvent, TaskState, TaskStatusUpdateEvent
 from loguru import logger
@@ -22,7 +24,8 @@ from valuecell.core.event.router import RouteResult, SideEffectKind
 from valuecell.core.event.service import EventResponseService
 from valuecell.core.plan.models import ExecutionPlan
 from valuecell.core.task.models import Task, TaskStatus
-from valuecell.core.task.service import DEFAULT_EXECUTION_POLL_INTERVAL, TaskService
+from valuecell.core.task.scheduler import TaskScheduler
+from valuecell.core.task.service import TaskService
 from valuecell.core.task.temporal import calculate_next_execution_delay
 from valuecell.core.types import (
     BaseResponse,
@@ -30,11 +33,26 @@ from valuecell.core.types import (
     ScheduledTaskComponentContent,
     StreamResponseEvent,
     SubagentConversationPhase,
+    TaskStatusEvent,
 )
 from valuecell.utils.i18n_utils import get_current_language, get_current_timezone
 from valuecell.utils.user_profile_utils import get_user_profile_metadata
 from valuecell.utils.uuid import generate_item_id, generate_task_id, generate_uuid
 
+# Maximum number of tasks of one plan executing at the same time
+DEFAULT_PLAN_CONCURRENCY = 4
+
+
+class _PlanTaskRun:
+    """Responses of one plan task, collected while it runs in the background."""
+
+    def __init__(self, task: Task) -> None:
+        self.task = task
+        self.responses: Deque[BaseResponse] = deque()
+        self.done = False
+        self.failed = False
+        self.runner: Optional[asyncio.Task] = None
+
 
 class ScheduledTaskResultAccumulator:
     """Collect streaming output for a scheduled task run."""
@@ -101,13 +119,15 @@ class TaskExecutor:
         task_service: TaskService,
         event_service: EventResponseService,
         conversation_service: ConversationService,
-        poll_interval: float = DEFAULT_EXECUTION_POLL_INTERVAL,
+        plan_concurrency: int = DEFAULT_PLAN_CONCURRENCY,
+        scheduler: Optional[TaskScheduler] = None,
     ) -> None:
         self._agent_connections = agent_connections
         self._task_service = task_service
         self._event_service = event_service
         self._conversation_service = conversation_service
-        self._poll_interval = poll_interval
+        self._plan_concurrency = max(1, plan_concurrency)
+        self._scheduler = scheduler  # created on first scheduled task
 
     async def execute_plan(
         self,
@@ -126,80 +146,233 @@ class TaskExecutor:
             )
             yield await self._event_service.emit(response)
 
-        for task in plan.tasks:
-            subagent_component_id = generate_item_id()
-            # Define a one-time emitter for subagent END component (used in two places)
-            end_component_emitted = False
-
-            async def emit_subagent_end_once() -> Optional[BaseResponse]:
-                nonlocal end_component_emitted
-                if not task.handoff_from_super_agent:
-                    return None
-                if end_component_emitted:
-                    return None
-                end_component_emitted = True
-                return await self._emit_subagent_conversation_component(
-                    plan.conversation_id,
-                    thread_id,
-                    task,
-                    subagent_component_id,
-                    SubagentConversationPhase.END,
-                )
-
-            if task.handoff_from_super_agent:
-                await self._conversation_service.ensure_conversation(
-                    user_id=plan.user_id,
-                    conversation_id=task.conversation_id,
-                    agent_name=task.agent_name,
-                    title=task.title,
-                )
-
-                # Emit subagent conversation start component
-                yield await self._emit_subagent_conversation_component(
-                    plan.conversation_id,
-                    thread_id,
-                    task,
-                    subagent_component_id,
-                    SubagentConversationPhase.START,
-                )
+        # The planner chains tasks it has not marked independent, so only
+        # those explicitly marked run concurrently
+        if len(plan.tasks) <= 1 or self._plan_concurrency == 1:
+            for task in plan.tasks:
+                async for response in self._execute_plan_task(
+                    plan, task, thread_id, metadata
+                ):
+                    yield response
+            return
 
-                thread_started = self._event_service.factory.thread_started(
-                    conversation_id=task.conversation_id,
-                    thread_id=thread_id,
-                    user_query=task.query,
-                )
-                yield await self._event_service.emit(thread_started)
+        async for response in self._execute_plan_concurrently(
+            plan, thread_id, metadata
+        ):
+            yield response
 
+    async def _execute_plan_concurrently(
+        self,
+        plan: ExecutionPlan,
+        thread_id: str,
+        metadata: Optional[dict] = None,
+    ) -> AsyncGenerator[BaseResponse, None]:
+        """Run plan tasks as a dependency graph, up to the concurrency cap.
+
+        A task starts once every task in its ``depends_on`` has finished, and
+        is skipped if one of them failed. Responses are yielded one task at a
+        time in start order: a task that runs ahead of the one currently
+        streaming is buffered, so paragraphs from different tasks never
+        interleave.
+        """
+        known_ids = {task.task_id for task in plan.tasks}
+        dependencies: Dict[str, list[str]] = {
+            task.task_id: [
+                dep
+                for dep in task.depends_on
+                if dep in known_ids and dep != task.task_id
+            ]
+            for task in plan.tasks
+        }
+        pending = list(plan.tasks)
+        # task_id -> True when the task succeeded
+        finished: Dict[str, bool] = {}
+        runs: Deque[_PlanTaskRun] = deque()
+        running = 0
+        wakeup = asyncio.Event()
+
+        async def run_task(run: _PlanTaskRun) -> None:
+            nonlocal running
             try:
-                await self._task_service.update_task(task)
-                async for response in self.execute_task(
-                    task,
-                    thread_id,
-                    metadata,
-                    on_before_done=(
-                        emit_subagent_end_once
-                        if task.handoff_from_super_agent
-                        else None
-                    ),
+                async for response in self._execute_plan_task(
+                    plan, run.task, thread_id, metadata
                 ):
-                    yield response
-            except Exception as exc:  # pragma: no cover - defensive logging
-                error_msg = f"(Error) Error executing {task.task_id}: {exc}"
-                logger.exception(error_msg)
-                failure = self._event_service.factory.task_failed(
-                    conversation_id=plan.conversation_id,
-                    thread_id=thread_id,
-                    task_id=task.task_id,
-                    content=error_msg,
-                    agent_name=task.agent_name,
-                )
-                yield await self._event_service.emit(failure)
+                    if (
+                        response.event == TaskStatusEvent.TASK_FAILED
+                        and response.data.task_id == run.task.task_id
+                    ):
+                        run.failed = True
+                    run.responses.append(response)
+                    wakeup.set()
+            except Exception:
+                logger.exception(f"Plan task {run.task.task_id} crashed")
+                run.failed = True
             finally:
-                if task.handoff_from_super_agent:
-                    # Emit subagent conversation end component (only if not already emitted)
-                    end_resp = await emit_subagent_end_once()
-                    if end_resp is not None:
-                        yield end_resp
+                run.done = True
+                running -= 1
+                finished[run.task.task_id] = not run.failed
+                wakeup.set()
+
+        async def start_ready_tasks() -> None:
+            nonlocal running
+            while pending and running < self._plan_concurrency:
+                ready = next(
+                    (
+                        task
+                        for task in pending
+                        if all(dep in finished for dep in dependencies[task.task_id])
+                    ),
+                    None,
+                )
+                if ready is None:
+                    if running:
+                        return
+                    # Nothing runs and nothing is ready: the rest depend on
+                    # each other. Break the cycle by falling back to plan order.
+                    ready = pending[0]
+                    logger.warning(
+                        f"Plan {plan.plan_id} has cyclic task dependencies; "
+                        f"starting {ready.task_id} without waiting"
+                    )
+                    dependencies[ready.task_id] = []
+                pending.remove(ready)
+                run = _PlanTaskRun(ready)
+                runs.append(run)
+
+                failed_deps = [
+                    dep for dep in dependencies[ready.task_id] if not finished[dep]
+                ]
+                if failed_deps:
+                    run.responses.append(
+                        await self._skip_plan_task(plan, ready, thread_id, failed_deps)
+                    )
+                    run.failed = run.done = True
+                    finished[ready.task_id] = False
+                    continue
+
+                running += 1
+                run.runner = asyncio.create_task(run_task(run))
+
+        try:
+            while True:
+                # Anything that happens from here on sets the event again
+                wakeup.clear()
+                await start_ready_tasks()
+                # Drain the task at the head of the output order
+                while runs and (runs[0].responses or runs[0].done):
+                    head = runs[0]
+                    while head.responses:
+                        yield head.responses.popleft()
+                    if not head.done:
+                        break
+                    runs.popleft()
+                if not runs and not pending:
+                    return
+                await wakeup.wait()
+        finally:
+            for run in runs:
+                if run.runner is not None and not run.runner.done():
+                    run.runner.cancel()
+
+    async def _skip_plan_task(
+        self,
+        plan: ExecutionPlan,
+        task: Task,
+        thread_id: str,
+        failed_dependencies: list[str],
+    ) -> BaseResponse:
+        reason = "(Error) Skipped because dependencies failed: " + ", ".join(
+            failed_dependencies
+        )
+        await self._task_service.update_task(task)
+        await self._task_service.fail_task(task.task_id, reason)
+        failure = self._event_service.factory.task_failed(
+            conversation_id=plan.conversation_id,
+            thread_id=thread_id,
+            task_id=task.task_id,
+            content=reason,
+            agent_name=task.agent_name,
+        )
+        return await self._event_service.emit(failure)
+
+    async def _execute_plan_task(
+        self,
+        plan: ExecutionPlan,
+        task: Task,
+        thread_id: str,
+        metadata: Optional[dict] = None,
+    ) -> AsyncGenerator[BaseResponse, None]:
+        subagent_component_id = generate_item_id()
+        # Define a one-time emitter for subagent END component (used in two places)
+        end_component_emitted = False
+
+        async def emit_subagent_end_once() -> Optional[BaseResponse]:
+            nonlocal end_component_emitted
+            if not task.handoff_from_super_agent:
+                return None
+            if end_component_emitted:
+                return None
+            end_component_emitted = True
+            return await self._emit_subagent_conversation_component(
+                plan.conversation_id,
+                thread_id,
+                task,
+                subagent_component_id,
+                SubagentConversationPhase.END,
+            )
+
+        if task.handoff_from_super_agent:
+            await self._conversation_service.ensure_conversation(
+                user_id=plan.user_id,
+                conversation_id=task.conversation_id,
+                agent_name=task.agent_name,
+                title=task.title,
+            )
+
+            # Emit subagent conversation start component
+            yield await self._emit_subagent_conversation_component(
+                plan.conversation_id,
+                thread_id,
+                task,
+                subagent_component_id,
+                SubagentConversationPhase.START,
+            )
+
+            thread_started = self._event_service.factory.thread_started(
+                conversation_id=task.conversation_id,
+                thread_id=thread_id,
+                user_query=task.query,
+            )
+            yield await self._event_service.emit(thread_started)
+
+        try:
+            await self._task_service.update_task(task)
+            async for response in self.execute_task(
+                task,
+                thread_id,
+                metadata,
+                on_before_done=(
+                    emit_subagent_end_once if task.handoff_from_super_agent else None
+                ),
+            ):
+                yield response
+        except Exception as exc:  # pragma: no cover - defensive logging
+            error_msg = f"(Error) Error executing {task.task_id}: {exc}"
+            logger.exception(error_msg)
+            failure = self._event_service.factory.task_failed(
+                conversation_id=plan.conversation_id,
+                thread_id=thread_id,
+                task_id=task.task_id,
+                content=error_msg,
+                agent_name=task.agent_name,
+            )
+            yield await self._event_service.emit(failure)
+        finally:
+            if task.handoff_from_super_agent:
+                # Emit subagent conversation end component (only if not already emitted)
+                end_resp = await emit_subagent_end_once()
+                if end_resp is not None:
+                    yield end_resp
 
     async def _emit_subagent_conversation_component(
         self,
@@ -277,7 +450,8 @@ class TaskExecutor:
             )
 
         try:
-            while True:
+            # A resumed schedule only re-registers; its next run time is persisted
+            if not (resumed and task.is_scheduled()):
                 async for response in self._execute_single_task_run(
                     task,
                     thread_id,
@@ -285,22 +459,30 @@ class TaskExecutor:
                 ):
                     yield response
 
-                if not task.is_scheduled():
-                    break
-
-                delay = calculate_next_execution_delay(task.schedule_config)
-                if not delay:
-                    break
-                logger.info(
-                    f"Scheduled task `{task.title}` ({task_id}) will re-execute in {delay} seconds."
+            if task.is_scheduled():
+                delay = (
+                    None
+                    if resumed
+                    else calculate_next_execution_delay(task.schedule_config)
                 )
-
-                await self._sleep_with_cancellation(task, delay)
-
-                task = await self._task_service.get_task(task.task_id)
-                if task.is_finished():
-                    logger.info(f"Task `{task.title}` ({task_id}) is finished.")
-                    break
+                if resumed or delay:
+                    # Later runs are fired by the scheduler, not by this generator
+                    if self._scheduler is None:
+                        self._scheduler = TaskScheduler(self._task_service)
+                    await self._scheduler.schedule(
+                        task,
+                        run=partial(
+                            self._run_scheduled_occurrence,
+                            thread_id=thread_id,
+                            metadata=exec_metadata,
+                        ),
+                        finish=partial(self._finish_scheduled_task, task, thread_id),
+                        delay=delay,
+                    )
+                    logger.info(
+                        f"Scheduled task `{task.title}` ({task_id}) handed to the scheduler."
+                    )
+                    return
 
             await self._task_service.complete_task(task_id)
             completed = self._event_service.factory.task_completed(
@@ -320,6 +502,37 @@ class TaskExecutor:
                 task_id=task_id,
             )
 
+    async def _run_scheduled_occurrence(
+        self, task: Task, thread_id: str, metadata: dict
+    ) -> None:
+        """Run one occurrence fired by the scheduler; output is only persisted."""
+        try:
+            async for _ in self._execute_single_task_run(task, thread_id, metadata):
+                pass
+        finally:
+            await self._event_service.flush_task_response(
+                conversation_id=task.conversation_id,
+                thread_id=thread_id,
+                task_id=task.task_id,
+            )
+
+    async def _finish_scheduled_task(self, task: Task, thread_id: str) -> None:
+        """Complete a task whose schedule ended (e.g. cancelled or exhausted)."""
+        await self._task_service.complete_task(task.task_id)
+        await self._event_service.emit(
+            self._event_service.factory.task_completed(
+                conversation_id=task.conversation_id,
+                thread_id=thread_id,
+                task_id=task.task_id,
+                agent_name=task.agent_name,
+            )
+        )
+        await self._event_service.flush_task_response(
+            conversation_id=task.conversation_id,
+            thread_id=thread_id,
+            task_id=task.task_id,
+        )
+
     async def _execute_single_task_run(
         self,
         task: Task,
@@ -441,13 +654,3 @@ class TaskExecutor:
             yield await self._event_service.emit(final_component)
 
         return
-
-    async def _sleep_with_cancellation(self, task: Task, delay: float) -> None:
-        remaining = delay
-        while remaining > 0:
-            task = await self._task_service.get_task(task.task_id)
-            if task.is_finished():
-                return
-            sleep_for = min(self._poll_interval, remaining)
-            await asyncio.sleep(sleep_for)
-            remaining -= sleep_for
@@ -1,6 +1,8 @@
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set
+
+from loguru import logger
 
 from .models import Task, TaskStatus
 from .task_store import InMemoryTaskStore, TaskStore
@@ -18,6 +20,62 @@ class TaskManager:
         self._store = store or InMemoryTaskStore()
         # Process-local concurrency guard; protects in-memory state
         self._lock = asyncio.Lock()
+        # Callbacks invoked with every task that reaches a final state
+        self._finish_listeners: List[Callable[[Task], None]] = []
+        # task_id -> events of coroutines waiting for the task to finish
+        self._finish_waiters: Dict[str, Set[asyncio.Event]] = {}
+
+    # ---- finish notifications ----
+
+    async def wait_for_finish(self, task_id: str, timeout: Optional[float]) -> bool:
+        """Wait up to ``timeout`` seconds (forever if None) for a final state.
+
+        Returns True if the task is finished (or gone) when the wait ends.
+        Finishing transitions made through this manager wake waiters
+        immediately; the store is read once rather than polled.
+        """
+        event = asyncio.Event()
+        # Register before reading so a finish racing the read is not missed
+        self._finish_waiters.setdefault(task_id, set()).add(event)
+        try:
+            task = await self._get_task(task_id)
+            if task is None or task.is_finished():
+                return True
+            if timeout is None:
+                await event.wait()
+                return True
+            try:
+                await asyncio.wait_for(event.wait(), timeout=max(0.0, timeout))
+            except asyncio.TimeoutError:
+                return False
+            return True
+        finally:
+            waiters = self._finish_waiters.get(task_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._finish_waiters[task_id]
+
+    def add_finish_listener(self, listener: Callable[[Task], None]) -> None:
+        """Call ``listener`` whenever a task reaches a final state.
+
+        Listeners run synchronously while the manager lock is held, so they
+        must not await manager methods; schedule follow-up work instead.
+        """
+        self._finish_listeners.append(listener)
+
+    def remove_finish_listener(self, listener: Callable[[Task], None]) -> None:
+        if listener in self._finish_listeners:
+            self._finish_listeners.remove(listener)
+
+    def _notify_finished(self, task: Task) -> None:
+        for event in self._finish_waiters.pop(task.task_id, ()):
+            event.set()
+        for listener in list(self._finish_listeners):
+            try:
+                listener(task)
+            except Exception:
+                logger.exception("Task finish listener failed for {}", task.task_id)
 
     # ---- basic registration ----
 
@@ -27,11 +85,24 @@ class TaskManager:
             # Explicit updates should refresh updated_at
             task.updated_at = datetime.now()
             await self._store.save_task(task)
+            if task.is_finished():
+                self._notify_finished(task)
 
     # ---- internal helpers ----
     async def _get_task(self, task_id: str) -> Task | None:
         return await self._store.load_task(task_id)
 
+    async def set_next_run(self, task_id: str, next_run_at: Optional[datetime]) -> bool:
+        """Persist the next fire time of an unfinished task."""
+        async with self._lock:
+            task = await self._get_task(task_id)
+            if not task or task.is_finished():
+                return False
+
+            task.next_run_at = next_run_at
+            await self._store.save_task(task)
+            return True
+
     # Task status management
     async def start_task(self, task_id: str) -> bool:
         """Start task execution"""
@@ -53,6 +124,7 @@ class TaskManager:
 
             task.complete()
             await self._store.save_task(task)
+            self._notify_finished(task)
             return True
 
     async def fail_task(self, task_id: str, error_message: str) -> bool:
@@ -64,6 +136,7 @@ class TaskManager:
 
             task.fail(error_message)
             await self._store.save_task(task)
+            self._notify_finished(task)
             return True
 
     async def cancel_task(self, task_id: str) -> bool:
@@ -77,6 +150,7 @@ class TaskManager:
 
             task.cancel()
             await self._store.save_task(task)
+            self._notify_finished(task)
             return True
 
     # Batch operations
@@ -90,6 +164,7 @@ class TaskManager:
                 if not task.is_finished():
                     task.cancel()
                     await self._store.save_task(task)
+                    self._notify_finished(task)
                     cancelled_count += 1
 
             return cancelled_count
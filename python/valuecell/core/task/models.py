@@ -78,6 +78,10 @@ class Task(BaseModel):
         False,
         description="Indicates if the task was handed over from a super agent",
     )
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="IDs of tasks in the same plan that must finish before this one starts",
+    )
 
     # Time-related fields
     created_at: datetime = Field(
@@ -88,6 +92,9 @@ class Task(BaseModel):
     updated_at: datetime = Field(
         default_factory=datetime.now, description="Last update time"
     )
+    next_run_at: Optional[datetime] = Field(
+        None, description="Next fire time of a scheduled task"
+    )
 
     # Result and error information
     error_message: Optional[str] = Field(
@@ -0,0 +1,294 @@
+"""Central scheduler firing recurring tasks from a single timer loop."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from datetime import datetime
+from enum import Enum
+from typing import Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from valuecell.core.task.models import Task
+from valuecell.core.task.service import TaskService
+from valuecell.core.task.temporal import calculate_next_execution_delay
+
+# Maximum number of scheduled runs executing at the same time
+DEFAULT_MAX_CONCURRENT_RUNS = 8
+
+# Runs one occurrence of the (freshly loaded) task
+RunCallback = Callable[[Task], Awaitable[None]]
+# Called once when the schedule of a task ends
+FinishCallback = Callable[[], Awaitable[None]]
+
+# Live schedulers, closed together at shutdown
+_SCHEDULERS: "weakref.WeakSet[TaskScheduler]" = weakref.WeakSet()
+
+
+class MissedRunPolicy(str, Enum):
+    """What to do with a fire time that passed while nothing was running.
+
+    - RUN_ONCE: fire right away, once, however many occurrences were missed.
+    - SKIP: drop the missed occurrences and wait for the next regular one.
+    """
+
+    RUN_ONCE = "run_once"
+    SKIP = "skip"
+
+
+class _ScheduleEntry:
+    """Registration of one task with the scheduler."""
+
+    def __init__(self, task_id: str, run: RunCallback, finish: FinishCallback):
+        self.task_id = task_id
+        self.run = run
+        self.finish = finish
+        self.fire_at = 0.0
+        self.running = False
+        self.stopped = False
+
+
+class TaskScheduler:
+    """Fire every registered recurring task from one timer loop.
+
+    Entries sit in a heap keyed by their next fire time, so a single
+    coroutine sleeps until the earliest one is due no matter how many tasks
+    are scheduled. At most ``max_concurrent_runs`` occurrences execute at the
+    same time; due entries beyond that wait in the heap for a free slot.
+
+    Every fire time is persisted as ``Task.next_run_at`` before it is
+    awaited, so a restarted process resumes the schedule instead of firing
+    again immediately. Fire times that passed while the process was down are
+    handled according to ``missed_run_policy``. Tasks finished through the
+    task service (e.g. cancelled by the user) leave the schedule right away,
+    and an occurrence still running for them is interrupted.
+    """
+
+    def __init__(
+        self,
+        task_service: TaskService,
+        max_concurrent_runs: int = DEFAULT_MAX_CONCURRENT_RUNS,
+        missed_run_policy: MissedRunPolicy = MissedRunPolicy.RUN_ONCE,
+    ) -> None:
+        self._task_service = task_service
+        self._max_concurrent_runs = max(1, max_concurrent_runs)
+        self._missed_run_policy = missed_run_policy
+        self._entries: Dict[str, _ScheduleEntry] = {}
+        # (fire_at, tie breaker, task_id); stale items are skipped on pop
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._active_runs = 0
+        self._wakeup: Optional[asyncio.Event] = None  # lazy to avoid loop-binding
+        self._loop_task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        task_service.add_finish_listener(self._on_task_finished)
+        _SCHEDULERS.add(self)
+
+    @property
+    def scheduled_count(self) -> int:
+        return len(self._entries)
+
+    def is_scheduled(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    async def schedule(
+        self,
+        task: Task,
+        run: RunCallback,
+        finish: FinishCallback,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Register ``task`` to call ``run`` at each of its occurrences.
+
+        With ``delay`` the next occurrence is that many seconds from now.
+        Otherwise the persisted ``next_run_at`` is honoured: a future time is
+        kept, a missed one is handled per the missed-run policy, and a task
+        without one fires right away. ``finish`` is awaited once the schedule
+        ends, unless the task failed or was unscheduled.
+        """
+        now = time.time()
+        if delay is not None:
+            fire_at = now + max(0.0, delay)
+        elif task.next_run_at is None:
+            fire_at = now
+        else:
+            fire_at = task.next_run_at.timestamp()
+            if fire_at < now:
+                fire_at = now
+                if self._missed_run_policy == MissedRunPolicy.SKIP:
+                    fire_at += calculate_next_execution_delay(task.schedule_config) or 0
+
+        self.unschedule(task.task_id)
+        entry = _ScheduleEntry(task.task_id, run, finish)
+        self._entries[task.task_id] = entry
+        if not await self._task_service.set_next_run(
+            task.task_id, datetime.fromtimestamp(fire_at)
+        ):
+            # Finished (or gone) before its schedule even started
+            await self._finish(entry)
+            return
+        if not entry.stopped:
+            self._push(entry, fire_at)
+
+    def unschedule(self, task_id: str) -> bool:
+        """Remove a task without calling its finish callback."""
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return False
+        entry.stopped = True
+        return True
+
+    async def close(self) -> None:
+        """Stop the timer loop and cancel runs in progress."""
+        tasks = list(self._background)
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+        self._entries.clear()
+        self._heap.clear()
+        self._active_runs = 0
+        _SCHEDULERS.discard(self)
+
+    # ---- internals ----
+
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _push(self, entry: _ScheduleEntry, fire_at: float) -> None:
+        entry.fire_at = fire_at
+        heapq.heappush(self._heap, (fire_at, next(self._counter), entry.task_id))
+        self._ensure_loop()
+        self._wakeup.set()
+
+    def _ensure_loop(self) -> None:
+        running = self._loop_task is not None and not self._loop_task.done()
+        if running and self._loop_task.get_loop() is asyncio.get_running_loop():
+            return
+        self._wakeup = asyncio.Event()
+        self._active_runs = 0
+        self._loop_task = asyncio.create_task(self._run_loop())
+
+    def _drop(self, entry: _ScheduleEntry) -> None:
+        if self._entries.get(entry.task_id) is entry:
+            del self._entries[entry.task_id]
+        entry.stopped = True
+
+    async def _finish(self, entry: _ScheduleEntry) -> None:
+        # Unscheduled (or already finished) entries owe no callback
+        if self._entries.get(entry.task_id) is not entry:
+            return
+        self._drop(entry)
+        try:
+            await entry.finish()
+        except Exception:
+            logger.exception("Failed to finish schedule of task {}", entry.task_id)
+
+    def _on_task_finished(self, task: Task) -> None:
+        entry = self._entries.get(task.task_id)
+        if entry is None:
+            return
+        entry.stopped = True
+        # A run in progress finishes the schedule itself when it returns
+        if not entry.running:
+            self._spawn(self._finish(entry))
+
+    async def _run_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            while self._heap and self._active_runs < self._max_concurrent_runs:
+                fire_at, _, task_id = self._heap[0]
+                entry = self._entries.get(task_id)
+                if entry is None or entry.stopped or entry.fire_at != fire_at:
+                    heapq.heappop(self._heap)
+                    continue
+                if fire_at > now:
+                    break
+                heapq.heappop(self._heap)
+                entry.running = True
+                self._active_runs += 1
+                self._spawn(self._fire(entry))
+
+            timeout = None
+            if self._heap and self._active_runs < self._max_concurrent_runs:
+                timeout = max(0.0, self._heap[0][0] - now)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, entry: _ScheduleEntry) -> None:
+        try:
+            await self._fire_once(entry)
+        finally:
+            self._active_runs -= 1
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def _run_until_finished(self, entry: _ScheduleEntry, task: Task) -> None:
+        """Run one occurrence, cancelling it as soon as the task finishes."""
+        run = asyncio.ensure_future(entry.run(task))
+        finished = asyncio.ensure_future(
+            self._task_service.wait_until_finished(entry.task_id)
+        )
+        try:
+            await asyncio.wait({run, finished}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            finished.cancel()
+            if not run.done():
+                run.cancel()
+                await asyncio.gather(run, return_exceptions=True)
+        if not run.cancelled():
+            run.result()
+
+    async def _fire_once(self, entry: _ScheduleEntry) -> None:
+        task_id = entry.task_id
+        task = await self._task_service.get_task(task_id)
+        if task is None or task.is_finished() or entry.stopped:
+            await self._finish(entry)
+            return
+
+        try:
+            await self._run_until_finished(entry, task)
+        except Exception as exc:
+            logger.exception("Scheduled run of task {} failed", task_id)
+            self._drop(entry)
+            await self._task_service.fail_task(task_id, str(exc))
+            return
+
+        delay = calculate_next_execution_delay(task.schedule_config)
+        if entry.stopped or not delay:
+            await self._finish(entry)
+            return
+        fire_at = time.time() + delay
+        if not await self._task_service.set_next_run(
+            task_id, datetime.fromtimestamp(fire_at)
+        ):
+            await self._finish(entry)
+            return
+        logger.info(
+            f"Scheduled task `{task.title}` ({task_id}) will re-execute in {delay} seconds."
+        )
+        entry.running = False
+        if entry.stopped:
+            await self._finish(entry)
+        else:
+            self._push(entry, fire_at)
+
+
+async def close_task_schedulers() -> None:
+    """Stop every live scheduler and cancel its runs (used at shutdown)."""
+    for scheduler in list(_SCHEDULERS):
+        try:
+            await scheduler.close()
+        except Exception:
+            logger.exception("Failed to close task scheduler at shutdown")
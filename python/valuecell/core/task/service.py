@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Callable, List, Optional
 
 from valuecell.core.task.manager import TaskManager
 from valuecell.core.task.models import Task, TaskStatus
 from valuecell.core.task.task_store import TaskStore
 
-DEFAULT_EXECUTION_POLL_INTERVAL = 0.1
-
 
 class TaskService:
     """Expose task management independent of the orchestrator."""
@@ -45,6 +44,21 @@ class TaskService:
     async def cancel_conversation_tasks(self, conversation_id: str) -> int:
         return await self._manager.cancel_conversation_tasks(conversation_id)
 
+    async def set_next_run(self, task_id: str, next_run_at: Optional[datetime]) -> bool:
+        return await self._manager.set_next_run(task_id, next_run_at)
+
+    async def wait_until_finished(
+        self, task_id: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Wait up to ``timeout`` seconds, waking as soon as the task finishes."""
+        return await self._manager.wait_for_finish(task_id, timeout)
+
+    def add_finish_listener(self, listener: Callable[[Task], None]) -> None:
+        self._manager.add_finish_listener(listener)
+
+    def remove_finish_listener(self, listener: Callable[[Task], None]) -> None:
+        self._manager.remove_finish_listener(listener)
+
     async def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         return await self._manager._get_task(task_id)
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import aiosqlite
+from valuecell.utils.sqlite_pool import get_sqlite_pool
 
 from .models import Task, TaskStatus
 
@@ -111,8 +111,8 @@ class InMemoryTaskStore(TaskStore):
 class SQLiteTaskStore(TaskStore):
     """SQLite-backed task store using aiosqlite for true async I/O.
 
-    Lazily initializes the database schema on first use. Uses aiosqlite to
-    perform non-blocking DB operations and converts rows to Task instances.
+    Lazily initializes the database schema on first use. Uses the shared
+    aiosqlite pool for its database file and converts rows to Task instances.
     """
 
     def __init__(self, db_path: str):
@@ -132,7 +132,7 @@ class SQLiteTaskStore(TaskStore):
             if self._initialized:
                 return
 
-            async with aiosqlite.connect(self.db_path) as db:
+            async with get_sqlite_pool(self.db_path).writer() as db:
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS tasks (
@@ -151,10 +151,16 @@ class SQLiteTaskStore(TaskStore):
                         started_at TEXT,
                         completed_at TEXT,
                         updated_at TEXT NOT NULL,
-                        error_message TEXT
+                        error_message TEXT,
+                        next_run_at TEXT
                     )
                     """
                 )
+                # Databases created before next_run_at existed
+                cur = await db.execute("PRAGMA table_info(tasks)")
+                columns = {row["name"] for row in await cur.fetchall()}
+                if "next_run_at" not in columns:
+                    await db.execute("ALTER TABLE tasks ADD COLUMN next_run_at TEXT")
                 # Create indexes for common queries
                 await db.execute(
                     "CREATE INDEX IF NOT EXISTS idx_tasks_conversation ON tasks(conversation_id)"
@@ -165,7 +171,6 @@ class SQLiteTaskStore(TaskStore):
                 await db.execute(
                     "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)"
                 )
-                await db.commit()
 
             self._initialized = True
 
@@ -203,6 +208,9 @@ class SQLiteTaskStore(TaskStore):
             else None,
             updated_at=datetime.fromisoformat(row["updated_at"]),
             error_message=row["error_message"],
+            next_run_at=datetime.fromisoformat(row["next_run_at"])
+            if row["next_run_at"]
+            else None,
         )
 
     async def save_task(self, task: Task) -> None:
@@ -216,14 +224,15 @@ class SQLiteTaskStore(TaskStore):
         if task.schedule_config:
             schedule_config_json = json.dumps(task.schedule_config.model_dump())
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).writer() as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO tasks (
                     task_id, title, query, conversation_id, thread_id, user_id, agent_name,
                     status, pattern, schedule_config, handoff_from_super_agent,
-                    created_at, started_at, completed_at, updated_at, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    created_at, started_at, completed_at, updated_at, error_message,
+                    next_run_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     task.task_id,
@@ -246,15 +255,14 @@ class SQLiteTaskStore(TaskStore):
                     task.completed_at.isoformat() if task.completed_at else None,
                     task.updated_at.isoformat(),
                     task.error_message,
+                    task.next_run_at.isoformat() if task.next_run_at else None,
                 ),
             )
-            await db.commit()
 
     async def load_task(self, task_id: str) -> Optional[Task]:
         """Load task from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT * FROM tasks WHERE task_id = ?",
                 (task_id,),
@@ -265,12 +273,11 @@ class SQLiteTaskStore(TaskStore):
     async def delete_task(self, task_id: str) -> bool:
         """Delete task from SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).writer() as db:
             cur = await db.execute(
                 "DELETE FROM tasks WHERE task_id = ?",
                 (task_id,),
             )
-            await db.commit()
             return cur.rowcount > 0
 
     async def list_tasks(
@@ -303,8 +310,7 @@ class SQLiteTaskStore(TaskStore):
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(query, params)
             rows = await cur.fetchall()
             return [self._row_to_task(row) for row in rows]
@@ -312,7 +318,7 @@ class SQLiteTaskStore(TaskStore):
     async def task_exists(self, task_id: str) -> bool:
         """Check if task exists in SQLite database."""
         await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with get_sqlite_pool(self.db_path).reader() as db:
             cur = await db.execute(
                 "SELECT 1 FROM tasks WHERE task_id = ?",
                 (task_id,),
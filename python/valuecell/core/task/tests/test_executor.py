@@ -1,3 +1,4 @@
+import asyncio
 import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -14,6 +15,7 @@ from valuecell.core.types import (
     NotifyResponseEvent,
     StreamResponseEvent,
     SubagentConversationPhase,
+    TaskStatusEvent,
 )
 
 
@@ -190,43 +192,55 @@ async def test_emit_subagent_conversation_component(task_service: TaskService):
 
 
 @pytest.mark.asyncio
-async def test_sleep_with_cancellation(
-    monkeypatch: pytest.MonkeyPatch, task_service: TaskService
+async def test_execute_task_hands_recurring_task_to_scheduler(
+    monkeypatch: pytest.MonkeyPatch,
 ):
+    """After the first run, later occurrences are fired by the shared scheduler."""
+    task_service = TaskService()
     event_service = StubEventService()
     executor = TaskExecutor(
         agent_connections=SimpleNamespace(),
         task_service=task_service,
         event_service=event_service,
         conversation_service=StubConversationService(),
-        poll_interval=0.05,
     )
+    runs: list[str] = []
 
-    class DummyTask:
-        def __init__(self):
-            self.calls = 0
-            self.task_id = "task-1"
-
-        def is_finished(self):
-            self.calls += 1
-            return self.calls >= 3
-
-    sleeps: list[float] = []
+    async def fake_single_run(task, thread_id, metadata):
+        runs.append(task.task_id)
+        if False:
+            yield  # pragma: no cover
 
-    async def fake_sleep(duration):
-        sleeps.append(duration)
-        return None
+    monkeypatch.setattr(executor, "_execute_single_task_run", fake_single_run)
+    task = _make_task(
+        schedule=ScheduleConfig(interval_minutes=60), pattern=TaskPattern.RECURRING
+    )
+    await task_service.update_task(task)
 
-    monkeypatch.setattr("valuecell.core.task.executor.asyncio.sleep", fake_sleep)
+    emitted = [resp async for resp in executor.execute_task(task, thread_id="thread")]
 
-    # Ensure the TaskService.get_task returns the dummy so the executor can
-    # refresh the task state during the cancellable sleep loop.
-    dummy = DummyTask()
-    task_service.get_task = AsyncMock(return_value=dummy)
+    # The generator returns after the first run instead of sleeping
+    assert runs == ["task-1"]
+    assert not any(r.__class__.__name__ == "TaskCompletedResponse" for r in emitted)
+    assert executor._scheduler.is_scheduled(task.task_id)
+    assert (await task_service.get_task(task.task_id)).next_run_at is not None
 
-    await executor._sleep_with_cancellation(dummy, delay=0.2)
+    # A resumed task only re-registers: its persisted next run is in the future
+    resumed = [
+        resp
+        async for resp in executor.execute_task(task, thread_id="thread", resumed=True)
+    ]
+    assert resumed == []
+    assert runs == ["task-1"]
 
-    assert sleeps
+    # Cancelling ends the schedule and completes the task stream
+    await task_service.cancel_task(task.task_id)
+    await asyncio.sleep(0.01)
+    assert not executor._scheduler.is_scheduled(task.task_id)
+    assert any(
+        r.__class__.__name__ == "TaskCompletedResponse" for r in event_service.emitted
+    )
+    await executor._scheduler.close()
 
 
 @pytest.mark.asyncio
@@ -277,6 +291,110 @@ async def test_execute_plan_emits_end_once_when_on_before_done_used(
     assert len(end_components) == 1
 
 
+def _plan(tasks: list[Task]) -> SimpleNamespace:
+    return SimpleNamespace(
+        plan_id="plan",
+        conversation_id="conv",
+        user_id="user",
+        guidance_message=None,
+        tasks=tasks,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_runs_independent_tasks_concurrently(
+    monkeypatch: pytest.MonkeyPatch, task_service: TaskService
+):
+    event_service = StubEventService()
+    executor = TaskExecutor(
+        agent_connections=SimpleNamespace(),
+        task_service=task_service,
+        event_service=event_service,
+        conversation_service=StubConversationService(),
+    )
+    first = _make_task(task_id="a")
+    second = _make_task(task_id="b")
+    third = _make_task(task_id="c", depends_on=["a"])
+
+    active: set[str] = set()
+    overlaps: list[set[str]] = []
+    finished: list[str] = []
+
+    async def fake_execute_task(task, thread_id, metadata, on_before_done=None):
+        assert all(dep in finished for dep in task.depends_on)
+        active.add(task.task_id)
+        overlaps.append(set(active))
+        # "a" is the slow branch; "b" finishes first but streams after "a"
+        delay = {"a": 0.05, "b": 0.01, "c": 0.0}[task.task_id]
+        for part in range(2):
+            await asyncio.sleep(delay)
+            yield event_service.factory.message_response_general(
+                StreamResponseEvent.MESSAGE_CHUNK,
+                task.conversation_id,
+                thread_id,
+                task.task_id,
+                f"{task.task_id}{part}",
+            )
+        active.discard(task.task_id)
+        finished.append(task.task_id)
+
+    monkeypatch.setattr(executor, "execute_task", fake_execute_task)
+
+    responses = [
+        resp
+        async for resp in executor.execute_plan(
+            _plan([first, second, third]), thread_id="thread"
+        )
+    ]
+
+    assert [r.data.payload.content for r in responses] == [
+        "a0",
+        "a1",
+        "b0",
+        "b1",
+        "c0",
+        "c1",
+    ]
+    assert {"a", "b"} in overlaps
+    assert finished.index("c") > finished.index("a")
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_skips_tasks_with_failed_dependencies(
+    monkeypatch: pytest.MonkeyPatch, task_service: TaskService
+):
+    event_service = StubEventService()
+    executor = TaskExecutor(
+        agent_connections=SimpleNamespace(),
+        task_service=task_service,
+        event_service=event_service,
+        conversation_service=StubConversationService(),
+    )
+    started: list[str] = []
+
+    async def fake_execute_task(task, thread_id, metadata, on_before_done=None):
+        started.append(task.task_id)
+        if task.task_id == "a":
+            raise RuntimeError("boom")
+        yield event_service.factory.done(task.conversation_id)
+
+    monkeypatch.setattr(executor, "execute_task", fake_execute_task)
+    tasks = [
+        _make_task(task_id="a"),
+        _make_task(task_id="b", depends_on=["a"]),
+        _make_task(task_id="c"),
+    ]
+
+    responses = [
+        resp async for resp in executor.execute_plan(_plan(tasks), thread_id="thread")
+    ]
+
+    assert sorted(started) == ["a", "c"]
+    failed = [r for r in responses if r.event == TaskStatusEvent.TASK_FAILED]
+    assert [r.data.task_id for r in failed] == ["a", "b"]
+    task_service.manager.fail_task.assert_any_await("b", failed[1].data.payload.content)
+
+
 @pytest.mark.asyncio
 async def test_execute_task_scheduled_emits_controller_and_done(
     monkeypatch: pytest.MonkeyPatch, task_service: TaskService
@@ -2,6 +2,7 @@
 Unit tests for valuecell.core.task.manager module
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import patch
 
@@ -372,3 +373,31 @@ class TestTaskManager:
 
         result = await manager.cancel_conversation_tasks("conv-123")
         assert result == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_finish(self):
+        """Test wait_for_finish times out, then wakes on cancellation."""
+        manager = TaskManager()
+        task = Task(
+            task_id="task-1",
+            query="Query 1",
+            conversation_id="conv-123",
+            user_id="user-123",
+            agent_name="test-agent",
+        )
+        await manager.update_task(task)
+
+        # Not finished: the timeout elapses
+        assert await manager.wait_for_finish("task-1", timeout=0.01) is False
+
+        # Cancellation wakes a long wait immediately
+        waiter = asyncio.create_task(manager.wait_for_finish("task-1", timeout=None))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await manager.cancel_task("task-1")
+        assert await asyncio.wait_for(waiter, 1) is True
+        assert manager._finish_waiters == {}
+
+        # Finished or unknown tasks return at once
+        assert await manager.wait_for_finish("task-1", timeout=60) is True
+        assert await manager.wait_for_finish("missing", timeout=60) is True
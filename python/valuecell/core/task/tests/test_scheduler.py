@@ -0,0 +1,213 @@
+"""
+Unit tests for valuecell.core.task.scheduler module
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from valuecell.core.task.models import ScheduleConfig, Task, TaskPattern, TaskStatus
+from valuecell.core.task.scheduler import (
+    MissedRunPolicy,
+    TaskScheduler,
+    close_task_schedulers,
+)
+from valuecell.core.task.service import TaskService
+
+
+async def _recurring_task(service: TaskService, task_id: str, **overrides) -> Task:
+    task = Task(
+        task_id=task_id,
+        query="check prices",
+        conversation_id="conv",
+        user_id="user",
+        agent_name="agent",
+        pattern=TaskPattern.RECURRING,
+        schedule_config=ScheduleConfig(interval_minutes=1),
+        **overrides,
+    )
+    await service.update_task(task)
+    await service.start_task(task_id)
+    return task
+
+
+@pytest.fixture()
+def short_interval(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        "valuecell.core.task.scheduler.calculate_next_execution_delay",
+        lambda *_args, **_kwargs: 0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_runs_share_one_loop_and_respect_concurrency(short_interval):
+    service = TaskService()
+    scheduler = TaskScheduler(service, max_concurrent_runs=2)
+    active = 0
+    max_active = 0
+    runs: dict[str, int] = {}
+    finished: list[str] = []
+
+    async def run(task: Task) -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.005)
+        runs[task.task_id] = runs.get(task.task_id, 0) + 1
+        active -= 1
+
+    for i in range(5):
+        task = await _recurring_task(service, f"task-{i}")
+
+        async def finish(task_id: str = task.task_id) -> None:
+            finished.append(task_id)
+
+        await scheduler.schedule(task, run, finish, delay=0)
+
+    await asyncio.sleep(0.15)
+    assert scheduler.scheduled_count == 5
+    assert max_active == 2
+    assert all(runs.get(f"task-{i}", 0) >= 2 for i in range(5))
+
+    # Persisted fire times let a restarted process resume the schedule
+    stored = await service.get_task("task-0")
+    assert stored.next_run_at is not None
+
+    await service.cancel_conversation_tasks("conv")
+    await asyncio.sleep(0.05)
+    assert sorted(finished) == [f"task-{i}" for i in range(5)]
+    assert scheduler.scheduled_count == 0
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_cancel_wakes_long_wait_immediately():
+    service = TaskService()
+    scheduler = TaskScheduler(service)
+    task = await _recurring_task(service, "task-1")
+    finished = asyncio.Event()
+
+    async def run(_task: Task) -> None:
+        raise AssertionError("should not run")
+
+    async def finish() -> None:
+        finished.set()
+
+    await scheduler.schedule(task, run, finish, delay=3600)
+    await service.cancel_task(task.task_id)
+    await asyncio.wait_for(finished.wait(), 1)
+    assert not scheduler.is_scheduled(task.task_id)
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_cancel_interrupts_running_occurrence():
+    service = TaskService()
+    scheduler = TaskScheduler(service)
+    task = await _recurring_task(service, "task-1")
+    started = asyncio.Event()
+    interrupted = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def run(_task: Task) -> None:
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            interrupted.set()
+            raise
+
+    async def finish() -> None:
+        finished.set()
+
+    await scheduler.schedule(task, run, finish, delay=0)
+    await asyncio.wait_for(started.wait(), 1)
+    await service.cancel_task(task.task_id)
+
+    await asyncio.wait_for(finished.wait(), 1)
+    assert interrupted.is_set()
+    assert not scheduler.is_scheduled(task.task_id)
+    assert (await service.get_task(task.task_id)).status == TaskStatus.CANCELLED
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, offset, expect_run",
+    [
+        # Future fire time survives a restart: no double fire
+        (MissedRunPolicy.RUN_ONCE, timedelta(hours=1), False),
+        # Missed while down: catch up once right away
+        (MissedRunPolicy.RUN_ONCE, timedelta(hours=-1), True),
+        # Missed while down: wait for the next regular slot
+        (MissedRunPolicy.SKIP, timedelta(hours=-1), False),
+    ],
+)
+async def test_resume_honours_persisted_next_run(policy, offset, expect_run):
+    service = TaskService()
+    scheduler = TaskScheduler(service, missed_run_policy=policy)
+    task = await _recurring_task(service, "task-1", next_run_at=datetime.now() + offset)
+    ran = asyncio.Event()
+
+    async def run(_task: Task) -> None:
+        ran.set()
+
+    async def finish() -> None:
+        pass
+
+    await scheduler.schedule(task, run, finish)
+    await asyncio.sleep(0.05)
+    assert ran.is_set() is expect_run
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_run_fails_task_and_leaves_schedule():
+    service = TaskService()
+    scheduler = TaskScheduler(service)
+    task = await _recurring_task(service, "task-1")
+    finished: list[str] = []
+
+    async def run(_task: Task) -> None:
+        raise RuntimeError("agent unreachable")
+
+    async def finish() -> None:
+        finished.append("finish")
+
+    await scheduler.schedule(task, run, finish, delay=0)
+    await asyncio.sleep(0.05)
+
+    stored = await service.get_task(task.task_id)
+    assert stored.status == TaskStatus.FAILED
+    assert stored.error_message == "agent unreachable"
+    assert finished == []
+    assert scheduler.scheduled_count == 0
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_close_task_schedulers_stops_live_schedulers():
+    service = TaskService()
+    scheduler = TaskScheduler(service)
+    task = await _recurring_task(service, "task-1")
+    started = asyncio.Event()
+    interrupted = asyncio.Event()
+
+    async def run(_task: Task) -> None:
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            interrupted.set()
+            raise
+
+    async def finish() -> None:
+        pass
+
+    await scheduler.schedule(task, run, finish, delay=0)
+    await asyncio.wait_for(started.wait(), 1)
+
+    await close_task_schedulers()
+    assert interrupted.is_set()
+    assert scheduler.scheduled_count == 0
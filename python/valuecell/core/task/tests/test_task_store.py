@@ -2,7 +2,9 @@
 Unit tests for valuecell.core.task.task_store module
 """
 
+import sqlite3
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -331,3 +333,39 @@ class TestSQLiteTaskStore:
 
             assert loaded_task is not None
             assert loaded_task.task_id == task.task_id
+
+    @pytest.mark.asyncio
+    async def test_next_run_at_migrated_and_round_tripped(self):
+        """Old databases gain the next_run_at column on first use."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "test.db")
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE tasks (
+                        task_id TEXT PRIMARY KEY, title TEXT, query TEXT NOT NULL,
+                        conversation_id TEXT NOT NULL, thread_id TEXT NOT NULL,
+                        user_id TEXT NOT NULL, agent_name TEXT NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        pattern TEXT NOT NULL DEFAULT 'once', schedule_config TEXT,
+                        handoff_from_super_agent INTEGER DEFAULT 0,
+                        created_at TEXT NOT NULL, started_at TEXT, completed_at TEXT,
+                        updated_at TEXT NOT NULL, error_message TEXT
+                    )
+                    """
+                )
+
+            store = SQLiteTaskStore(db_path)
+            next_run_at = datetime(2030, 1, 1, 9, 30)
+            task = Task(
+                task_id="test-task-123",
+                query="Test query",
+                conversation_id="conv-123",
+                user_id="user-123",
+                agent_name="test-agent",
+                next_run_at=next_run_at,
+            )
+            await store.save_task(task)
+
+            loaded_task = await store.load_task("test-task-123")
+            assert loaded_task.next_run_at == next_run_at
@@ -44,6 +44,7 @@ class SystemResponseEvent(str, Enum):
     PLAN_FAILED = "plan_failed"
     SYSTEM_FAILED = "system_failed"
     DONE = "done"
+    STREAM_LAGGED = "stream_lagged"
 
 
 class TaskStatusEvent(str, Enum):
@@ -401,6 +402,20 @@ class DoneResponse(BaseResponse):
     data: UnifiedResponseData = Field(..., description="The thread data payload")
 
 
+class StreamLaggedResponse(BaseResponse):
+    """Response ending a live stream whose consumer fell too far behind.
+
+    ``data.metadata["last_event_id"]`` is the id to resume from with
+    Last-Event-ID. It is sent to the lagging consumer only, never persisted.
+    """
+
+    event: Literal[SystemResponseEvent.STREAM_LAGGED] = Field(
+        SystemResponseEvent.STREAM_LAGGED,
+        description="The event type of the response",
+    )
+    data: UnifiedResponseData = Field(..., description="The resume data payload")
+
+
 class PlanFailedResponse(BaseResponse):
     """Response indicating a plan execution failure."""
 
@@ -1,5 +1,6 @@
 """FastAPI application factory for ValueCell Server."""
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -10,9 +11,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from ...adapters.assets import get_adapter_manager
+from ...core.event.writer import close_item_writers
+from ...core.task.scheduler import close_task_schedulers
 from ...utils.env import ensure_system_env_dir, get_system_env_path
+from ...utils.sqlite_pool import close_sqlite_pools
 from ..config.settings import get_settings
-from ..db import init_database
+from ..db import get_database_manager, init_database
+from ..services.strategy_cycle_writer import (
+    DEFAULT_CLOSE_TIMEOUT_SECONDS,
+    get_strategy_cycle_writer,
+)
 from .exceptions import (
     APIException,
     api_exception_handler,
@@ -142,6 +150,13 @@ def create_app() -> FastAPI:
         yield
         # Shutdown
         logger.info("ValueCell Server shutting down...")
+        await close_task_schedulers()
+        await close_item_writers()
+        await asyncio.to_thread(
+            get_strategy_cycle_writer().close, DEFAULT_CLOSE_TIMEOUT_SECONDS
+        )
+        await close_sqlite_pools()
+        await get_database_manager().dispose_async()
 
     app = FastAPI(
         title="ValueCell Server API",
@@ -3,18 +3,63 @@ Agent stream router for handling streaming agent queries.
 """
 
 import json
+from typing import Any, AsyncIterator, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from valuecell.core.event.replay import ReplayUnavailableError
 from valuecell.server.api.schemas.agent_stream import AgentStreamRequest
+from valuecell.server.api.schemas.base import SuccessResponse
 from valuecell.server.services.agent_stream_service import (
     AgentStreamService,
     _auto_resume_recurring_tasks,
 )
 
 
+def _parse_last_event_id(last_event_id: Optional[str]) -> Optional[int]:
+    if last_event_id is None or not last_event_id.strip():
+        return None
+    try:
+        return int(last_event_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Last-Event-ID header")
+
+
+def _check_resumable(
+    agent_service: AgentStreamService,
+    conversation_id: str,
+    last_event_id: Optional[int],
+) -> None:
+    # 404: nothing buffered (e.g. after a restart); 410: the ring moved past
+    # the id. Either way the client has to reload the conversation history.
+    try:
+        agent_service.check_resumable(conversation_id, last_event_id)
+    except ReplayUnavailableError as e:
+        raise HTTPException(status_code=410 if e.expired else 404, detail=str(e))
+
+
+def _sse_response(
+    events: AsyncIterator[Tuple[Optional[int], Any]],
+) -> StreamingResponse:
+    async def generate_stream():
+        """Generate SSE formatted stream chunks."""
+        async for event_id, chunk in events:
+            # Format as SSE (Server-Sent Events); ids let clients resume
+            prefix = f"id: {event_id}\n" if event_id is not None else ""
+            yield f"{prefix}data: {json.dumps(chunk)}\n\n"
+
+    return StreamingResponse(
+        generate_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 def create_agent_stream_router() -> APIRouter:
     """Create and configure the agent stream router."""
 
@@ -29,35 +74,66 @@ def create_agent_stream_router() -> APIRouter:
             logger.exception("Failed to schedule recurring task auto-resume")
 
     @router.post("/stream")
-    async def stream_query_agent(request: AgentStreamRequest):
+    async def stream_query_agent(
+        request: AgentStreamRequest,
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    ):
         """
         Stream agent query responses in real-time.
 
         This endpoint accepts a user query and returns a streaming response
         with agent-generated content in Server-Sent Events (SSE) format.
+        Every event carries an ``id``. Re-sending the request with a
+        ``Last-Event-ID`` header and the same ``conversation_id`` does not
+        re-run the query; it replays the missed events and attaches to the
+        still running session instead. The resume fails with 404 when nothing
+        is buffered for the conversation and with 410 when some of the missed
+        events are no longer buffered.
         """
+        resume_from = _parse_last_event_id(last_event_id)
+        if resume_from is not None and request.conversation_id:
+            _check_resumable(agent_service, request.conversation_id, resume_from)
+            return _sse_response(
+                agent_service.resume_stream(request.conversation_id, resume_from)
+            )
         try:
-
-            async def generate_stream():
-                """Generate SSE formatted stream chunks."""
-                async for chunk in agent_service.stream_query_agent(
+            return _sse_response(
+                agent_service.stream_query_agent_events(
                     query=request.query,
                     agent_name=request.agent_name,
                     conversation_id=request.conversation_id,
-                ):
-                    # Format as SSE (Server-Sent Events)
-                    yield f"data: {json.dumps(chunk)}\n\n"
-
-            return StreamingResponse(
-                generate_stream(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
+                )
             )
-
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Agent query failed: {str(e)}")
 
+    @router.get(
+        "/stream-stats",
+        response_model=SuccessResponse[dict],
+        summary="Agent stream queue metrics",
+        description="Replay settings and live subscriber queue depths per conversation",
+    )
+    async def get_stream_stats():
+        """Expose replay buffer and subscriber queue metrics for diagnostics."""
+        return SuccessResponse.create(
+            data=agent_service.stream_stats(), msg="Stream stats retrieved"
+        )
+
+    @router.get("/stream/{conversation_id}")
+    async def resume_agent_stream(
+        conversation_id: str,
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    ):
+        """
+        Resume the event stream of a conversation (EventSource friendly).
+
+        Replays buffered events after ``Last-Event-ID`` (all buffered events
+        when absent) and then follows the live session until it finishes.
+        Fails with 404 when nothing is buffered for the conversation and with
+        410 when some events after ``Last-Event-ID`` are no longer buffered.
+        """
+        resume_from = _parse_last_event_id(last_event_id)
+        _check_resumable(agent_service, conversation_id, resume_from)
+        return _sse_response(agent_service.resume_stream(conversation_id, resume_from))
+
     return router
@@ -2,11 +2,13 @@
 Strategy API router for handling strategy-related endpoints.
 """
 
+import base64
+import binascii
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from valuecell.server.api.schemas.base import StatusCode, SuccessResponse
@@ -24,12 +26,32 @@ from valuecell.server.api.schemas.strategy import (
     StrategySummaryData,
     StrategyType,
 )
-from valuecell.server.db import get_db
+from valuecell.server.db import get_db, run_read
 from valuecell.server.db.models.strategy import Strategy
 from valuecell.server.db.repositories import get_strategy_repository
+from valuecell.server.services import equity_curve
+from valuecell.server.services.equity_curve import DEFAULT_CURVE_MAX_POINTS
 from valuecell.server.services.strategy_service import StrategyService
 
 
+def _encode_cursor(strategy: Strategy) -> str:
+    """Opaque list cursor holding the sort key of the last strategy of a page."""
+    raw = f"{strategy.created_at.isoformat()}|{strategy.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of ``_encode_cursor``; raises ValueError for malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    created_at, sep, strategy_id = raw.rpartition("|")
+    if not sep:
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(created_at), int(strategy_id)
+
+
 def create_strategy_router() -> APIRouter:
     """Create and configure the strategy router."""
 
@@ -51,7 +73,12 @@ def create_strategy_router() -> APIRouter:
         name_filter: Optional[str] = Query(
             None, description="Filter by strategy name or ID (supports fuzzy matching)"
         ),
-        db: Session = Depends(get_db),
+        limit: Optional[int] = Query(
+            None, ge=1, le=500, description="Page size; all strategies when omitted"
+        ),
+        cursor: Optional[str] = Query(
+            None, description="Cursor returned as next_cursor by the previous page"
+        ),
     ) -> StrategyListResponse:
         """
         Get all strategies list.
@@ -59,29 +86,36 @@ def create_strategy_router() -> APIRouter:
         - **user_id**: Filter by owner user ID
         - **status**: Filter by strategy status (running, stopped)
         - **name_filter**: Filter by strategy name or ID with fuzzy matching
+        - **limit** / **cursor**: Optional cursor pagination
 
         Returns a response containing the strategy list and statistics.
         """
-        try:
-            query = db.query(Strategy)
-
-            filters = []
-            if user_id:
-                filters.append(Strategy.user_id == user_id)
-            if status:
-                filters.append(Strategy.status == status)
-            if name_filter:
-                filters.append(
-                    or_(
-                        Strategy.name.ilike(f"%{name_filter}%"),
-                        Strategy.strategy_id.ilike(f"%{name_filter}%"),
-                    )
+        after: Optional[Tuple[datetime, int]] = None
+        if cursor:
+            try:
+                after = _decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=StatusCode.BAD_REQUEST, detail="Invalid cursor"
                 )
 
-            if filters:
-                query = query.filter(and_(*filters))
+        def load(session: Session):
+            repo = get_strategy_repository(db_session=session)
+            # Strategies joined with their maintained portfolio summaries
+            rows, has_more = repo.list_strategies_with_portfolio(
+                user_id=user_id,
+                status=status,
+                name_filter=name_filter,
+                limit=limit,
+                after=after,
+            )
+            total, running_count = repo.count_strategies(
+                user_id=user_id, status=status, name_filter=name_filter
+            )
+            return rows, has_more, total, running_count
 
-            strategies = query.order_by(Strategy.created_at.desc()).all()
+        try:
+            rows, has_more, total, running_count = await run_read(load)
 
             def map_status(raw: Optional[str]) -> str:
                 return "running" if (raw or "").lower() == "running" else "stopped"
@@ -147,7 +181,7 @@ def create_strategy_router() -> APIRouter:
                 return None
 
             strategy_data_list = []
-            for s in strategies:
+            for s, summary in rows:
                 meta = s.strategy_metadata or {}
                 cfg = s.config or {}
                 status = map_status(s.status)
@@ -161,10 +195,9 @@ def create_strategy_router() -> APIRouter:
                     ) or "..."
 
                 total_pnl, total_pnl_pct = 0.0, 0.0
-                if (
-                    portfolio_summary
-                    := await StrategyService.get_strategy_portfolio_summary(
-                        s.strategy_id
+                if summary and (
+                    portfolio_summary := StrategyService.summarize_portfolio(
+                        s.strategy_id, summary, summary.first_total_value
                     )
                 ):
                     total_pnl = to_optional_float(portfolio_summary.total_pnl) or 0.0
@@ -192,12 +225,11 @@ def create_strategy_router() -> APIRouter:
                 )
                 strategy_data_list.append(item)
 
-            running_count = sum(1 for s in strategy_data_list if s.status == "running")
-
             list_data = StrategyListData(
                 strategies=strategy_data_list,
-                total=len(strategy_data_list),
+                total=total,
                 running_count=running_count,
+                next_cursor=_encode_cursor(rows[-1][0]) if has_more else None,
             )
 
             return SuccessResponse.create(
@@ -369,109 +401,97 @@ def create_strategy_router() -> APIRouter:
             ge=1,
             le=200,
         ),
-        db: Session = Depends(get_db),
+        max_points: int = Query(
+            DEFAULT_CURVE_MAX_POINTS,
+            description=(
+                "Maximum number of points per curve; longer histories are "
+                "downsampled (LTTB for one strategy, time buckets when combined)"
+            ),
+            ge=10,
+            le=10000,
+        ),
     ) -> StrategyCurveResponse:
-        try:
-            repo = get_strategy_repository(db_session=db)
+        def load_single(session: Session):
+            repo = get_strategy_repository(db_session=session)
+            strategy = repo.get_strategy_by_strategy_id(id)
+            if not strategy:
+                return None, None
+            # Series from aggregated portfolio snapshots (StrategyPortfolioView)
+            return strategy, repo.get_portfolio_curves([id]).get(id)
 
+        def load_all(session: Session):
+            query = session.query(Strategy).order_by(Strategy.created_at.desc())
+            if limit:
+                query = query.limit(limit)
+            strategies = query.all()
+            repo = get_strategy_repository(db_session=session)
+            curves = repo.get_portfolio_curves([s.strategy_id for s in strategies])
+            return strategies, curves
+
+        try:
             # Case 1: Single strategy
             if id:
-                strategy = repo.get_strategy_by_strategy_id(id)
+                strategy, curve = await run_read(load_single)
                 if not strategy:
                     raise HTTPException(status_code=404, detail="Strategy not found")
 
                 strategy_name = strategy.name or f"Strategy-{id.split('-')[-1][:8]}"
-                created_at = strategy.created_at or datetime.utcnow()
 
-                data = [["Time", strategy_name]]
-
-                # Build series from aggregated portfolio snapshots (StrategyPortfolioView).
-                snapshots = repo.get_portfolio_snapshots(id)
-                if snapshots:
-                    # repository returns desc order; present oldest->newest
-                    for s in reversed(snapshots):
-                        t = s.snapshot_ts or created_at
-                        time_str = t.strftime("%Y-%m-%d %H:%M:%S")
-                        try:
-                            v = (
-                                float(s.total_value)
-                                if s.total_value is not None
-                                else None
-                            )
-                        except Exception:
-                            v = None
-                        data.append([time_str, v])
-                else:
+                if not curve:
                     return SuccessResponse.create(
                         data=[],
                         msg="No holding price curve found for strategy",
                     )
 
+                times, values = equity_curve.downsample(
+                    (equity_curve.to_epoch_ms(curve[0]), np.asarray(curve[1])),
+                    max_points,
+                )
+                data = [["Time", strategy_name]]
+                data.extend(
+                    [equity_curve.format_epoch_ms(t), v]
+                    for t, v in zip(times.tolist(), values.tolist())
+                )
                 return SuccessResponse.create(
                     data=data,
                     msg="Fetched holding price curve successfully",
                 )
 
             # Case 2: Combined curves for all strategies
-            query = db.query(Strategy).order_by(Strategy.created_at.desc())
-            if limit:
-                query = query.limit(limit)
-            strategies = query.all()
-
-            # Build series per strategy: {strategy_id: {time_str: value}}
-            series_map = {}
-            strategy_order = []  # Keep consistent header order
-            name_map = {}
-            created_times = []
-
-            for s in strategies:
-                sid = s.strategy_id
-                sname = s.name or f"Strategy-{sid.split('-')[-1][:8]}"
-                strategy_order.append(sid)
-                name_map[sid] = sname
-                created_at = s.created_at or datetime.utcnow()
-                created_times.append(created_at)
-
-                # Build per-strategy entries from aggregated portfolio snapshots
-                entries = {}
-                snapshots = repo.get_portfolio_snapshots(sid)
-                if snapshots:
-                    for s in reversed(snapshots):
-                        t = s.snapshot_ts or created_at
-                        time_str = t.strftime("%Y-%m-%d %H:%M:%S")
-                        try:
-                            v = (
-                                float(s.total_value)
-                                if s.total_value is not None
-                                else None
-                            )
-                        except Exception:
-                            v = None
-                        entries[time_str] = v
-                series_map[sid] = entries
-
-            # Union of all timestamps
-            all_times = set()
-            for entries in series_map.values():
-                for ts in entries.keys():
-                    all_times.add(ts)
-
-            data = [["Time"] + [name_map[sid] for sid in strategy_order]]
-
-            if all_times:
-                for time_str in sorted(all_times):
-                    row = [time_str]
-                    for sid in strategy_order:
-                        v = series_map.get(sid, {}).get(time_str)
-                        row.append(v if v is not None else None)
-                    data.append(row)
-            else:
+            strategies, curves = await run_read(load_all)
+
+            strategy_order = [s.strategy_id for s in strategies]  # header order
+            name_map = {
+                s.strategy_id: s.name or f"Strategy-{s.strategy_id.split('-')[-1][:8]}"
+                for s in strategies
+            }
+            if not curves:
                 # No data across all strategies: return empty array
                 return SuccessResponse.create(
                     data=[],
                     msg="No holding price curves found",
                 )
 
+            # Align on a shared time grid instead of exact timestamps
+            grid, columns = equity_curve.align(
+                {
+                    sid: (
+                        equity_curve.to_epoch_ms(curves[sid][0]),
+                        np.asarray(curves[sid][1]),
+                    )
+                    for sid in strategy_order
+                    if sid in curves
+                },
+                max_points,
+            )
+            data = [["Time"] + [name_map[sid] for sid in strategy_order]]
+            for pos, ts in enumerate(grid.tolist()):
+                row = [equity_curve.format_epoch_ms(ts)]
+                for sid in strategy_order:
+                    column = columns.get(sid)
+                    row.append(column[pos] if column else None)
+                data.append(row)
+
             return SuccessResponse.create(
                 data=data,
                 msg="Fetched merged holding price curves successfully",
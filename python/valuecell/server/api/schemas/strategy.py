@@ -47,6 +47,9 @@ class StrategyListData(BaseModel):
     strategies: List[StrategySummaryData] = Field(..., description="List of strategies")
     total: int = Field(..., description="Total number of strategies")
     running_count: int = Field(..., description="Number of running strategies")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page; null on the last page"
+    )
 
 
 StrategyListResponse = SuccessResponse[StrategyListData]
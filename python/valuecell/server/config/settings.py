@@ -57,6 +57,24 @@ class Settings:
             self.DATABASE_URL = env_db
         else:
             self.DATABASE_URL = _default_db_path()
+        # Connection pool sizing for file-backed databases
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        # Read-only connections kept for dashboard queries (SQLite only)
+        self.DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+        # How long SQLite waits on a locked database before failing
+        self.DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "20000"))
+        self.DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+        # Serve dashboard reads through the async (aiosqlite) engine; when off
+        # they run on the read-only pool in worker threads
+        self.DB_ASYNC_READS = os.getenv("DB_ASYNC_READS", "true").lower() == "true"
+
+        # Agent stream replay: events kept per conversation for Last-Event-ID
+        # resumes, live queue size per subscriber and what a full queue does
+        # (block, coalesce or drop_reasoning)
+        self.STREAM_REPLAY_CAPACITY = int(os.getenv("STREAM_REPLAY_CAPACITY", "1024"))
+        self.STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "256"))
+        self.STREAM_OVERFLOW_POLICY = os.getenv("STREAM_OVERFLOW_POLICY", "coalesce")
 
         # File Paths
         self.BASE_DIR = Path(__file__).parent.parent.parent
@@ -68,7 +86,15 @@ class Settings:
 
     def get_database_config(self) -> dict:
         """Get database configuration."""
-        return {"url": self.DATABASE_URL}
+        return {
+            "url": self.DATABASE_URL,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "read_pool_size": self.DB_READ_POOL_SIZE,
+            "busy_timeout_ms": self.DB_BUSY_TIMEOUT_MS,
+            "echo": self.DB_ECHO,
+            "async_reads": self.DB_ASYNC_READS,
+        }
 
     def update_language(self, language: str) -> None:
         """Update current language setting.
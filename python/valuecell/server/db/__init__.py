@@ -2,8 +2,10 @@
 
 from .connection import (
     DatabaseManager,
+    get_async_db,
     get_database_manager,
     get_db,
+    run_read,
 )
 from .init_db import DatabaseInitializer, init_database
 from .models import Agent, Asset, Base
@@ -13,6 +15,8 @@ __all__ = [
     "DatabaseManager",
     "get_database_manager",
     "get_db",
+    "get_async_db",
+    "run_read",
     # Database initialization
     "DatabaseInitializer",
     "init_database",
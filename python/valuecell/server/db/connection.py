@@ -1,14 +1,90 @@
-"""Database connection and session management for ValueCell Server."""
+"""Database connection and session management for ValueCell Server.
 
-from typing import Generator
+File-backed SQLite databases are opened in WAL mode with a pool of
+connections, so API requests, repositories and strategy persistence no longer
+share (and serialize on) a single connection:
 
-from sqlalchemy import Engine, create_engine
+- the main engine pools read/write connections (``synchronous=NORMAL`` and a
+  busy timeout, so concurrent writers wait instead of failing);
+- a read-only engine serves dashboard queries, which WAL lets run alongside
+  writers without blocking them;
+- an async engine (``aiosqlite``) is created on demand, so handlers can read
+  without doing blocking database work on the event loop. ``run_read`` uses
+  it when ``DB_ASYNC_READS`` is on and falls back to the read-only pool on a
+  worker thread otherwise.
+
+In-memory SQLite keeps a single static connection, since separate
+connections would see separate databases.
+"""
+
+import asyncio
+from typing import AsyncGenerator, Callable, Generator, Optional, TypeVar
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from ..config.settings import get_settings
 from .models.base import Base
 
+# Async drivers used when the async engine is derived from the sync URL
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+}
+
+T = TypeVar("T")
+
+
+def _is_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite"
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    database = url.database or ""
+    return (
+        database in ("", ":memory:")
+        or database.startswith("file::memory:")
+        or url.query.get("mode") == "memory"
+    )
+
+
+def _to_async_url(url: URL) -> URL:
+    """Swap the sync driver of ``url`` for its async counterpart."""
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver known for database backend {backend!r}")
+    if url.get_driver_name() == driver:
+        return url
+    return url.set(drivername=f"{backend}+{driver}")
+
+
+def _install_sqlite_pragmas(
+    engine: Engine, busy_timeout_ms: int, readonly: bool, wal: bool
+) -> None:
+    """Configure every new DBAPI connection of a SQLite ``engine``."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+            if readonly:
+                cursor.execute("PRAGMA query_only = ON")
+            else:
+                if wal:
+                    cursor.execute("PRAGMA journal_mode = WAL")
+                cursor.execute("PRAGMA synchronous = NORMAL")
+        finally:
+            cursor.close()
+
 
 class DatabaseManager:
     """Database connection and session manager."""
@@ -17,37 +93,117 @@ class DatabaseManager:
         """Initialize database manager."""
         self.settings = get_settings()
         self.engine: Engine = None
+        self.read_engine: Engine = None
         self.SessionLocal = None
+        self.ReadSessionLocal = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_session_factory: Optional[async_sessionmaker] = None
         self._initialize_engine()
 
     def _initialize_engine(self) -> None:
-        """Initialize database engine."""
+        """Initialize the read/write and read-only engines."""
         database_config = self.settings.get_database_config()
+        url = make_url(database_config["url"])
+        busy_timeout_ms = database_config.get("busy_timeout_ms", 20000)
+        echo = database_config.get("echo", False)
 
-        # SQLite specific configuration
-        connect_args = {}
-        if database_config["url"].startswith("sqlite"):
+        if not _is_sqlite(url):
+            self.engine = create_engine(
+                url,
+                echo=echo,
+                pool_size=database_config.get("pool_size", 5),
+                max_overflow=database_config.get("max_overflow", 10),
+                pool_pre_ping=True,
+            )
+            self.read_engine = self.engine
+        elif _is_sqlite_memory(url):
+            self.engine = create_engine(
+                url,
+                echo=echo,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+            _install_sqlite_pragmas(
+                self.engine, busy_timeout_ms, readonly=False, wal=False
+            )
+            self.read_engine = self.engine
+        else:
             connect_args = {
                 "check_same_thread": False,
-                "timeout": 20,
+                "timeout": busy_timeout_ms / 1000.0,
             }
-
-        self.engine = create_engine(
-            database_config["url"],
-            connect_args=connect_args,
-            poolclass=StaticPool
-            if database_config["url"].startswith("sqlite")
-            else None,
-        )
+            self.engine = create_engine(
+                url,
+                echo=echo,
+                connect_args=connect_args,
+                pool_size=database_config.get("pool_size", 5),
+                max_overflow=database_config.get("max_overflow", 10),
+            )
+            _install_sqlite_pragmas(
+                self.engine, busy_timeout_ms, readonly=False, wal=True
+            )
+            self.read_engine = create_engine(
+                url,
+                echo=echo,
+                connect_args=connect_args,
+                pool_size=max(1, database_config.get("read_pool_size", 4)),
+                max_overflow=0,
+            )
+            _install_sqlite_pragmas(
+                self.read_engine, busy_timeout_ms, readonly=True, wal=False
+            )
 
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
+        self.ReadSessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.read_engine
+        )
 
     def get_engine(self) -> Engine:
         """Get database engine."""
         return self.engine
 
+    def get_read_engine(self) -> Engine:
+        """Get the engine used for read-only queries."""
+        return self.read_engine
+
+    @property
+    def async_reads_enabled(self) -> bool:
+        """Whether ``run_read`` goes through the async engine."""
+        database_config = self.settings.get_database_config()
+        if not database_config.get("async_reads", False):
+            return False
+        url = make_url(database_config["url"])
+        # An in-memory database is private to the sync engine's connection
+        return url.get_backend_name() in ASYNC_DRIVERS and not (
+            _is_sqlite(url) and _is_sqlite_memory(url)
+        )
+
+    def get_async_engine(self) -> AsyncEngine:
+        """Get the async engine, creating it on first use."""
+        if self._async_engine is None:
+            database_config = self.settings.get_database_config()
+            url = make_url(database_config["url"])
+            busy_timeout_ms = database_config.get("busy_timeout_ms", 20000)
+            kwargs = {"echo": database_config.get("echo", False)}
+            if _is_sqlite(url) and _is_sqlite_memory(url):
+                # An async engine on its own in-memory database would not
+                # see the tables of the sync engine
+                raise ValueError("Async engine is not supported for in-memory SQLite")
+            if _is_sqlite(url):
+                kwargs["connect_args"] = {"timeout": busy_timeout_ms / 1000.0}
+            engine = create_async_engine(_to_async_url(url), **kwargs)
+            if _is_sqlite(url):
+                _install_sqlite_pragmas(
+                    engine.sync_engine, busy_timeout_ms, readonly=False, wal=True
+                )
+            self._async_engine = engine
+            self._async_session_factory = async_sessionmaker(
+                engine, expire_on_commit=False, autoflush=False
+            )
+        return self._async_engine
+
     def create_tables(self) -> None:
         """Create all tables defined in models."""
         Base.metadata.create_all(bind=self.engine)
@@ -60,6 +216,36 @@ class DatabaseManager:
         """Get a new database session."""
         return self.SessionLocal()
 
+    def get_read_session(self) -> Session:
+        """Get a new session on the read-only engine."""
+        return self.ReadSessionLocal()
+
+    def get_async_session(self) -> AsyncSession:
+        """Get a new async database session."""
+        self.get_async_engine()
+        return self._async_session_factory()
+
+    async def run_read(self, fn: Callable[[Session], T]) -> T:
+        """Run read-only ORM work ``fn(session)`` off the event loop.
+
+        ``fn`` receives a regular ``Session`` (so repositories work as-is):
+        on the async engine through ``AsyncSession.run_sync`` when async
+        reads are enabled, otherwise a read-only pool session on a worker
+        thread. Returned ORM objects are detached; only their loaded
+        attributes are available.
+        """
+        if self.async_reads_enabled:
+            async with self.get_async_session() as session:
+                return await session.run_sync(fn)
+        return await asyncio.to_thread(self._run_read_sync, fn)
+
+    def _run_read_sync(self, fn: Callable[[Session], T]) -> T:
+        session = self.get_read_session()
+        try:
+            return fn(session)
+        finally:
+            session.close()
+
     def get_db_session(self) -> Generator[Session, None, None]:
         """Get database session for dependency injection."""
         db = self.SessionLocal()
@@ -68,6 +254,16 @@ class DatabaseManager:
         finally:
             db.close()
 
+    async def get_async_db_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get async database session for dependency injection."""
+        async with self.get_async_session() as db:
+            yield db
+
+    async def dispose_async(self) -> None:
+        """Close all pooled connections of the async engine, if created."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+
 
 # Global database manager instance
 _db_manager: DatabaseManager = None
@@ -87,6 +283,17 @@ def get_db() -> Generator[Session, None, None]:
     yield from db_manager.get_db_session()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session for FastAPI dependency injection."""
+    async for db in get_database_manager().get_async_db_session():
+        yield db
+
+
+async def run_read(fn: Callable[[Session], T]) -> T:
+    """Run read-only ORM work off the event loop (see ``DatabaseManager.run_read``)."""
+    return await get_database_manager().run_read(fn)
+
+
 def get_engine() -> Engine:
     """Get database engine."""
     return get_database_manager().get_engine()
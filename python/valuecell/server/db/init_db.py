@@ -29,6 +29,9 @@ from valuecell.server.db.models.agent import Agent
 from valuecell.server.db.models.base import Base
 from valuecell.server.db.models.strategy_prompt import StrategyPrompt
 from valuecell.server.db.repositories.asset_repository import get_asset_repository
+from valuecell.server.db.repositories.strategy_repository import (
+    get_strategy_repository,
+)
 from valuecell.server.services.assets import get_asset_service
 from valuecell.utils.path import get_agent_card_path
 
@@ -598,6 +601,17 @@ class DatabaseInitializer:
             logger.error(f"Error getting database session: {e}")
             return False
 
+    def backfill_strategy_summaries(self) -> bool:
+        """Build portfolio summary rows for snapshots that predate them."""
+        try:
+            built = get_strategy_repository().backfill_portfolio_summaries()
+            if built:
+                logger.info(f"Backfilled portfolio summaries of {built} strategies")
+            return True
+        except Exception as e:
+            logger.error(f"Error backfilling strategy portfolio summaries: {e}")
+            return False
+
     def verify_initialization(self) -> bool:
         """Verify database initialization."""
         try:
@@ -625,6 +639,8 @@ class DatabaseInitializer:
         # Check if database already exists and is properly initialized
         if not force and self.check_database_exists() and self.check_tables_exist():
             logger.info("Database already exists and is properly initialized")
+            # Not fatal: dashboards show no PnL for strategies left without one
+            self.backfill_strategy_summaries()
             return True
 
         # Step 1: Create database file (for SQLite)
@@ -647,7 +663,10 @@ class DatabaseInitializer:
             logger.error("Failed to initialize assets")
             return False
 
-        # Step 5: Verify initialization
+        # Step 5: Backfill strategy portfolio summaries
+        self.backfill_strategy_summaries()
+
+        # Step 6: Verify initialization
         if not self.verify_initialization():
             logger.error("Database initialization verification failed")
             return False
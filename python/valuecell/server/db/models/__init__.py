@@ -17,6 +17,7 @@ from .strategy_detail import StrategyDetail
 from .strategy_holding import StrategyHolding
 from .strategy_instruction import StrategyInstruction
 from .strategy_portfolio import StrategyPortfolioView
+from .strategy_summary_cache import StrategySummaryCache
 from .user_profile import ProfileCategory, UserProfile
 from .watchlist import Watchlist, WatchlistItem
 
@@ -33,6 +34,7 @@ __all__ = [
     "StrategyHolding",
     "StrategyDetail",
     "StrategyPortfolioView",
+    "StrategySummaryCache",
     "StrategyComposeCycle",
     "StrategyInstruction",
 ]
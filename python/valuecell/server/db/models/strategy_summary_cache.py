@@ -0,0 +1,106 @@
+"""
+ValueCell Server - Strategy Summary Cache Model
+
+One row per strategy holding its first and latest portfolio snapshot figures,
+maintained in the same transaction as every StrategyPortfolioView insert, so
+dashboards read a strategy's PnL without scanning its snapshot history.
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class StrategySummaryCache(Base):
+    """Materialized first/latest portfolio figures of a strategy.
+
+    The latest-snapshot columns mirror StrategyPortfolioView, so a row can be
+    used wherever a latest snapshot is expected.
+    """
+
+    __tablename__ = "strategy_summary_cache"
+
+    strategy_id = Column(
+        String(100),
+        ForeignKey("strategies.strategy_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Runtime strategy identifier",
+    )
+
+    # First snapshot (baseline)
+    first_snapshot_ts = Column(
+        DateTime(timezone=True), nullable=True, comment="First snapshot timestamp"
+    )
+    first_total_value = Column(
+        Numeric(20, 8), nullable=True, comment="Equity at the first snapshot"
+    )
+    first_total_unrealized_pnl = Column(
+        Numeric(20, 8), nullable=True, comment="Unrealized PnL at the first snapshot"
+    )
+
+    # Latest snapshot
+    snapshot_ts = Column(
+        DateTime(timezone=True), nullable=True, comment="Latest snapshot timestamp"
+    )
+    cash = Column(Numeric(20, 8), nullable=True, comment="Latest cash balance")
+    total_value = Column(Numeric(20, 8), nullable=True, comment="Latest equity")
+    total_unrealized_pnl = Column(
+        Numeric(20, 8), nullable=True, comment="Latest total unrealized PnL"
+    )
+    total_realized_pnl = Column(
+        Numeric(20, 8), nullable=True, comment="Latest total realized PnL"
+    )
+    gross_exposure = Column(
+        Numeric(20, 8), nullable=True, comment="Latest aggregate gross exposure"
+    )
+    net_exposure = Column(
+        Numeric(20, 8), nullable=True, comment="Latest aggregate net exposure"
+    )
+
+    snapshot_count = Column(
+        Integer, nullable=False, default=0, comment="Number of portfolio snapshots"
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            "<StrategySummaryCache(strategy_id='{}', first_total_value={}, "
+            "total_value={}, snapshot_ts={}, snapshot_count={})>"
+        ).format(
+            self.strategy_id,
+            self.first_total_value,
+            self.total_value,
+            self.snapshot_ts,
+            self.snapshot_count,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _f(value):
+            return float(value) if value is not None else None
+
+        return {
+            "strategy_id": self.strategy_id,
+            "first_snapshot_ts": self.first_snapshot_ts.isoformat()
+            if self.first_snapshot_ts
+            else None,
+            "first_total_value": _f(self.first_total_value),
+            "first_total_unrealized_pnl": _f(self.first_total_unrealized_pnl),
+            "snapshot_ts": self.snapshot_ts.isoformat() if self.snapshot_ts else None,
+            "cash": _f(self.cash),
+            "total_value": _f(self.total_value),
+            "total_unrealized_pnl": _f(self.total_unrealized_pnl),
+            "total_realized_pnl": _f(self.total_realized_pnl),
+            "gross_exposure": _f(self.gross_exposure),
+            "net_exposure": _f(self.net_exposure),
+            "snapshot_count": self.snapshot_count,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
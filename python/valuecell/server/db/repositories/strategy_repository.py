@@ -5,11 +5,12 @@ This repository provides unified database access to strategies, strategy holding
 and strategy details.
 """
 
-from datetime import datetime
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import asc, desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, asc, case, desc, func, literal, or_, select
+from sqlalchemy.orm import Session, aliased
 
 from ..connection import get_database_manager
 from ..models.strategy import Strategy
@@ -19,6 +20,82 @@ from ..models.strategy_holding import StrategyHolding
 from ..models.strategy_instruction import StrategyInstruction
 from ..models.strategy_portfolio import StrategyPortfolioView
 from ..models.strategy_prompt import StrategyPrompt
+from ..models.strategy_summary_cache import StrategySummaryCache
+
+
+@dataclass
+class CycleRows:
+    """Rows produced by one decision cycle of a strategy.
+
+    Each dict holds the column values of one row (without ``strategy_id``);
+    ``metadata`` is merged into the strategy's ``strategy_metadata``.
+    """
+
+    strategy_id: str
+    compose_cycle: Optional[Dict[str, Any]] = None
+    instructions: List[Dict[str, Any]] = field(default_factory=list)
+    details: List[Dict[str, Any]] = field(default_factory=list)
+    portfolio: Optional[Dict[str, Any]] = None
+    holdings: List[Dict[str, Any]] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+
+
+# (strategy, its portfolio summary)
+StrategyPortfolioRow = Tuple[Strategy, Optional[StrategySummaryCache]]
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands datetimes back naive; compare everything as naive UTC
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _created_at_key(session: Session, value: Optional[datetime] = None):
+    """Expression ordering strategies by creation time, for ``value`` if given.
+
+    SQLite stores server-default timestamps without fractional seconds while
+    bound datetimes always carry them, so there both sides are compared as
+    julianday() numbers rather than as text.
+    """
+    expr = (
+        Strategy.created_at
+        if value is None
+        else literal(value, Strategy.created_at.type)
+    )
+    if session.get_bind().dialect.name == "sqlite":
+        return func.julianday(expr)
+    return expr
+
+
+def _set_first_snapshot(
+    summary: StrategySummaryCache, item: StrategyPortfolioView
+) -> None:
+    summary.first_snapshot_ts = item.snapshot_ts
+    summary.first_total_value = item.total_value
+    summary.first_total_unrealized_pnl = item.total_unrealized_pnl
+
+
+def _set_latest_snapshot(
+    summary: StrategySummaryCache, item: StrategyPortfolioView
+) -> None:
+    summary.snapshot_ts = item.snapshot_ts
+    summary.cash = item.cash
+    summary.total_value = item.total_value
+    summary.total_unrealized_pnl = item.total_unrealized_pnl
+    summary.total_realized_pnl = item.total_realized_pnl
+    summary.gross_exposure = item.gross_exposure
+    summary.net_exposure = item.net_exposure
+
+
+def _apply_snapshot(summary: StrategySummaryCache, item: StrategyPortfolioView) -> None:
+    """Fold one new portfolio snapshot into a strategy's summary row."""
+    ts = _naive_utc(item.snapshot_ts)
+    summary.snapshot_count = (summary.snapshot_count or 0) + 1
+    if summary.first_snapshot_ts is None or ts < _naive_utc(summary.first_snapshot_ts):
+        _set_first_snapshot(summary, item)
+    if summary.snapshot_ts is None or ts >= _naive_utc(summary.snapshot_ts):
+        _set_latest_snapshot(summary, item)
 
 
 class StrategyRepository:
@@ -32,9 +109,16 @@ class StrategyRepository:
             return self.db_session
         return get_database_manager().get_session()
 
+    def _get_read_session(self) -> Session:
+        # Read-only queries use the read-only pool so dashboards do not
+        # contend with strategy writes for connections
+        if self.db_session:
+            return self.db_session
+        return get_database_manager().get_read_session()
+
     # Strategy access
     def get_strategy_by_strategy_id(self, strategy_id: str) -> Optional[Strategy]:
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             strategy = (
                 session.query(Strategy)
@@ -58,7 +142,7 @@ class StrategyRepository:
         """
         if not statuses:
             return []
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             q = session.query(Strategy).filter(Strategy.status.in_(statuses))
             if limit:
@@ -73,6 +157,279 @@ class StrategyRepository:
             if not self.db_session:
                 session.close()
 
+    @staticmethod
+    def _strategy_filters(
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        name_filter: Optional[str] = None,
+    ) -> list:
+        filters = []
+        if user_id:
+            filters.append(Strategy.user_id == user_id)
+        if status:
+            filters.append(Strategy.status == status)
+        if name_filter:
+            filters.append(
+                or_(
+                    Strategy.name.ilike(f"%{name_filter}%"),
+                    Strategy.strategy_id.ilike(f"%{name_filter}%"),
+                )
+            )
+        return filters
+
+    def list_strategies_with_portfolio(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        name_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[StrategyPortfolioRow], bool]:
+        """Return strategies, newest first, joined with their portfolio
+        summary rows.
+
+        Pagination is keyset-based: pass the ``(created_at, id)`` of the last
+        strategy of a page as ``after`` to get the next one; the strategy
+        itself need not exist anymore. Returns the rows and whether
+        more strategies follow. The summary is None for strategies without
+        portfolio snapshots.
+        """
+        session = self._get_read_session()
+        try:
+            filters = self._strategy_filters(user_id, status, name_filter)
+            created_at = _created_at_key(session)
+            if after is not None:
+                after_created_at, after_id = after
+                cursor_created_at = _created_at_key(session, after_created_at)
+                filters.append(
+                    or_(
+                        created_at < cursor_created_at,
+                        and_(
+                            created_at == cursor_created_at,
+                            Strategy.id < after_id,
+                        ),
+                    )
+                )
+            stmt = (
+                select(Strategy, StrategySummaryCache)
+                .outerjoin(
+                    StrategySummaryCache,
+                    StrategySummaryCache.strategy_id == Strategy.strategy_id,
+                )
+                .where(*filters)
+                .order_by(desc(created_at), desc(Strategy.id))
+            )
+            if limit is not None:
+                # One extra row tells whether another page follows
+                stmt = stmt.limit(limit + 1)
+            rows = [tuple(row) for row in session.execute(stmt).all()]
+            has_more = limit is not None and len(rows) > limit
+            if has_more:
+                rows = rows[:limit]
+            for row in rows:
+                for item in row:
+                    if item is not None:
+                        session.expunge(item)
+        finally:
+            if not self.db_session:
+                session.close()
+        return rows, has_more
+
+    def get_portfolio_summary(self, strategy_id: str) -> Optional[StrategySummaryCache]:
+        """Return the maintained portfolio summary of a strategy.
+
+        Returns None if the strategy does not exist or has no portfolio
+        snapshots yet.
+        """
+        session = self._get_read_session()
+        try:
+            summary = session.get(StrategySummaryCache, strategy_id)
+            if summary is not None:
+                session.expunge(summary)
+            return summary
+        finally:
+            if not self.db_session:
+                session.close()
+
+    def backfill_portfolio_summaries(self, batch_size: int = 500) -> int:
+        """Build the missing summary rows of strategies that have snapshots.
+
+        Run once at database initialization, before strategies write, for
+        snapshots that predate the summary table. Returns the number of
+        rows built.
+        """
+        session = self._get_read_session()
+        try:
+            missing = [
+                strategy_id
+                for (strategy_id,) in session.execute(
+                    select(StrategyPortfolioView.strategy_id)
+                    .outerjoin(
+                        StrategySummaryCache,
+                        StrategySummaryCache.strategy_id
+                        == StrategyPortfolioView.strategy_id,
+                    )
+                    .where(StrategySummaryCache.strategy_id.is_(None))
+                    .distinct()
+                )
+            ]
+        finally:
+            if not self.db_session:
+                session.close()
+
+        built = 0
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            built += len(self.rebuild_portfolio_summaries(batch))
+        return built
+
+    def rebuild_portfolio_summaries(
+        self, strategy_ids: List[str]
+    ) -> Dict[str, StrategySummaryCache]:
+        """(Re)compute summary rows from the snapshot history.
+
+        Used to backfill strategies whose snapshots predate the summary
+        table; the first and latest snapshots are found with one windowed
+        query. Returns the rows by strategy_id (existing strategies only)
+        and raises if the rows cannot be written.
+        """
+        if not strategy_ids:
+            return {}
+        session = self._get_session()
+        try:
+            existing = {
+                strategy_id
+                for (strategy_id,) in session.query(Strategy.strategy_id).filter(
+                    Strategy.strategy_id.in_(strategy_ids)
+                )
+            }
+            if not existing:
+                return {}
+
+            # Rank each strategy's snapshots from both ends
+            ranked = (
+                select(
+                    StrategyPortfolioView,
+                    func.row_number()
+                    .over(
+                        partition_by=StrategyPortfolioView.strategy_id,
+                        order_by=(
+                            asc(StrategyPortfolioView.snapshot_ts),
+                            asc(StrategyPortfolioView.id),
+                        ),
+                    )
+                    .label("first_rank"),
+                    func.row_number()
+                    .over(
+                        partition_by=StrategyPortfolioView.strategy_id,
+                        order_by=(
+                            desc(StrategyPortfolioView.snapshot_ts),
+                            desc(StrategyPortfolioView.id),
+                        ),
+                    )
+                    .label("latest_rank"),
+                    func.count()
+                    .over(partition_by=StrategyPortfolioView.strategy_id)
+                    .label("snapshot_count"),
+                )
+                .where(StrategyPortfolioView.strategy_id.in_(existing))
+                .subquery("ranked")
+            )
+            view = aliased(StrategyPortfolioView, ranked)
+            stmt = select(
+                view, ranked.c.first_rank, ranked.c.latest_rank, ranked.c.snapshot_count
+            ).where(or_(ranked.c.first_rank == 1, ranked.c.latest_rank == 1))
+
+            summaries = {
+                strategy_id: StrategySummaryCache(
+                    strategy_id=strategy_id, snapshot_count=0
+                )
+                for strategy_id in existing
+            }
+            for item, first_rank, latest_rank, count in session.execute(stmt):
+                summary = summaries[item.strategy_id]
+                summary.snapshot_count = count
+                if first_rank == 1:
+                    _set_first_snapshot(summary, item)
+                if latest_rank == 1:
+                    _set_latest_snapshot(summary, item)
+            session.expunge_all()
+
+            for summary in summaries.values():
+                session.merge(summary)
+            session.commit()
+            return summaries
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if not self.db_session:
+                session.close()
+
+    def _update_portfolio_summary(
+        self, session: Session, item: StrategyPortfolioView
+    ) -> None:
+        """Fold a snapshot being inserted into its strategy's summary row.
+
+        Called inside the transaction that inserts ``item``. A strategy
+        without a summary row yet is rebuilt from its whole history
+        (including ``item``) instead.
+        """
+        summary = session.get(StrategySummaryCache, item.strategy_id)
+        if summary is not None:
+            _apply_snapshot(summary, item)
+            return
+
+        session.flush()
+        history = session.query(StrategyPortfolioView).filter(
+            StrategyPortfolioView.strategy_id == item.strategy_id
+        )
+        summary = StrategySummaryCache(
+            strategy_id=item.strategy_id, snapshot_count=history.count()
+        )
+        _set_first_snapshot(
+            summary,
+            history.order_by(
+                asc(StrategyPortfolioView.snapshot_ts), asc(StrategyPortfolioView.id)
+            ).first(),
+        )
+        _set_latest_snapshot(
+            summary,
+            history.order_by(
+                desc(StrategyPortfolioView.snapshot_ts), desc(StrategyPortfolioView.id)
+            ).first(),
+        )
+        session.add(summary)
+        # Flushed so later snapshots of this transaction find the row
+        session.flush()
+
+    def count_strategies(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        name_filter: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        """Return (total, running) counts of strategies matching the filters."""
+        session = self._get_read_session()
+        try:
+            total, running = (
+                session.query(
+                    func.count(Strategy.id),
+                    func.coalesce(
+                        func.sum(
+                            case((func.lower(Strategy.status) == "running", 1), else_=0)
+                        ),
+                        0,
+                    ),
+                )
+                .filter(*self._strategy_filters(user_id, status, name_filter))
+                .one()
+            )
+            return int(total or 0), int(running or 0)
+        finally:
+            if not self.db_session:
+                session.close()
+
     def upsert_strategy(
         self,
         strategy_id: str,
@@ -190,6 +547,7 @@ class StrategyRepository:
                 snapshot_ts=snapshot_ts or datetime.utcnow(),
             )
             session.add(item)
+            self._update_portfolio_summary(session, item)
             session.commit()
             session.refresh(item)
             session.expunge(item)
@@ -203,7 +561,7 @@ class StrategyRepository:
 
     def get_latest_holdings(self, strategy_id: str) -> List[StrategyHolding]:
         """Get holdings for the latest snapshot of a strategy."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             # Find latest snapshot_ts
             latest_ts = (
@@ -234,7 +592,7 @@ class StrategyRepository:
         self, strategy_id: str, limit: Optional[int] = None, descending: bool = True
     ) -> List[StrategyPortfolioView]:
         """Get aggregated portfolio snapshots for a strategy ordered by snapshot_ts desc."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             query = (
                 session.query(StrategyPortfolioView)
@@ -255,11 +613,50 @@ class StrategyRepository:
             if not self.db_session:
                 session.close()
 
+    def get_portfolio_curves(
+        self, strategy_ids: List[str]
+    ) -> Dict[str, Tuple[List[datetime], List[float]]]:
+        """Equity (total_value) over time for several strategies, oldest first.
+
+        Loads only the two columns a curve needs, for all strategies in one
+        query. Strategies without snapshots are omitted.
+        """
+        if not strategy_ids:
+            return {}
+        session = self._get_read_session()
+        try:
+            rows = (
+                session.query(
+                    StrategyPortfolioView.strategy_id,
+                    StrategyPortfolioView.snapshot_ts,
+                    StrategyPortfolioView.total_value,
+                )
+                .filter(
+                    StrategyPortfolioView.strategy_id.in_(strategy_ids),
+                    StrategyPortfolioView.total_value.isnot(None),
+                )
+                .order_by(
+                    StrategyPortfolioView.strategy_id,
+                    asc(StrategyPortfolioView.snapshot_ts),
+                    asc(StrategyPortfolioView.id),
+                )
+                .all()
+            )
+        finally:
+            if not self.db_session:
+                session.close()
+        curves: Dict[str, Tuple[List[datetime], List[float]]] = {}
+        for strategy_id, snapshot_ts, total_value in rows:
+            times, values = curves.setdefault(strategy_id, ([], []))
+            times.append(snapshot_ts)
+            values.append(float(total_value))
+        return curves
+
     def get_first_portfolio_snapshot(
         self, strategy_id: str
     ) -> Optional[StrategyPortfolioView]:
         """Convenience: return the earliest portfolio snapshot or None."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             item = (
                 session.query(StrategyPortfolioView)
@@ -293,7 +690,7 @@ class StrategyRepository:
         self, strategy_id: str, snapshot_ts: datetime
     ) -> List[StrategyHolding]:
         """Get holdings by specific snapshot time."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             items = (
                 session.query(StrategyHolding)
@@ -445,10 +842,70 @@ class StrategyRepository:
             if not self.db_session:
                 session.close()
 
+    def add_cycle_rows(self, cycles: List[CycleRows]) -> List[bool]:
+        """Insert the rows of several decision cycles in one transaction.
+
+        Cycles of strategies that no longer exist are skipped and reported as
+        False. Unlike the single-row helpers, failures are raised (after a
+        rollback) so callers can tell which batch failed and retry.
+        """
+        if not cycles:
+            return []
+        session = self._get_session()
+        try:
+            strategy_ids = {rows.strategy_id for rows in cycles}
+            strategies = {
+                strategy.strategy_id: strategy
+                for strategy in session.query(Strategy).filter(
+                    Strategy.strategy_id.in_(strategy_ids)
+                )
+            }
+            written: List[bool] = []
+            for rows in cycles:
+                strategy = strategies.get(rows.strategy_id)
+                if strategy is None:
+                    written.append(False)
+                    continue
+                sid = rows.strategy_id
+                if rows.compose_cycle is not None:
+                    session.add(
+                        StrategyComposeCycle(strategy_id=sid, **rows.compose_cycle)
+                    )
+                session.add_all(
+                    StrategyInstruction(strategy_id=sid, **values)
+                    for values in rows.instructions
+                )
+                session.add_all(
+                    StrategyDetail(strategy_id=sid, **values) for values in rows.details
+                )
+                if rows.portfolio is not None:
+                    view = StrategyPortfolioView(strategy_id=sid, **rows.portfolio)
+                    session.add(view)
+                    self._update_portfolio_summary(session, view)
+                session.add_all(
+                    StrategyHolding(strategy_id=sid, **values)
+                    for values in rows.holdings
+                )
+                if rows.metadata:
+                    # Reassign so the JSON column is flagged as modified
+                    strategy.strategy_metadata = {
+                        **(strategy.strategy_metadata or {}),
+                        **rows.metadata,
+                    }
+                written.append(True)
+            session.commit()
+            return written
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if not self.db_session:
+                session.close()
+
     def get_cycles(
         self, strategy_id: str, limit: Optional[int] = None
     ) -> List[StrategyComposeCycle]:
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             query = (
                 session.query(StrategyComposeCycle)
@@ -468,7 +925,7 @@ class StrategyRepository:
     def get_instructions_by_compose(
         self, strategy_id: str, compose_id: str
     ) -> List[StrategyInstruction]:
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             items = (
                 session.query(StrategyInstruction)
@@ -491,7 +948,7 @@ class StrategyRepository:
     ) -> List[StrategyDetail]:
         if not instruction_ids:
             return []
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             items = (
                 session.query(StrategyDetail)
@@ -512,7 +969,7 @@ class StrategyRepository:
         self, strategy_id: str, limit: Optional[int] = None
     ) -> List[StrategyDetail]:
         """Get detail records for a strategy ordered by event_time desc."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             query = session.query(StrategyDetail).filter(
                 StrategyDetail.strategy_id == strategy_id
@@ -533,7 +990,7 @@ class StrategyRepository:
     # Prompts operations (kept under strategy namespace)
     def list_prompts(self) -> List[StrategyPrompt]:
         """Return all prompts ordered by updated_at desc."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             items = (
                 session.query(StrategyPrompt)
@@ -566,7 +1023,7 @@ class StrategyRepository:
 
     def get_prompt_by_id(self, prompt_id: str) -> Optional[StrategyPrompt]:
         """Fetch one prompt by UUID string."""
-        session = self._get_session()
+        session = self._get_read_session()
         try:
             try:
                 # Rely on DB to cast string to UUID
@@ -641,6 +1098,9 @@ class StrategyRepository:
                     StrategyDetail.strategy_id == strategy_id
                 ).delete(synchronize_session=False)
 
+            session.query(StrategySummaryCache).filter(
+                StrategySummaryCache.strategy_id == strategy_id
+            ).delete(synchronize_session=False)
             session.query(Strategy).filter(Strategy.strategy_id == strategy_id).delete(
                 synchronize_session=False
             )
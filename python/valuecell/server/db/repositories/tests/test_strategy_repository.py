@@ -0,0 +1,129 @@
+"""
+Unit tests for valuecell.server.db.repositories.strategy_repository module
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from valuecell.server.db.models.base import Base
+from valuecell.server.db.models.strategy import Strategy
+from valuecell.server.db.models.strategy_summary_cache import StrategySummaryCache
+from valuecell.server.db.repositories.strategy_repository import StrategyRepository
+
+
+@pytest.fixture()
+def repo():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield StrategyRepository(db_session=session)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _page_ids(rows):
+    return [strategy.strategy_id for strategy, _ in rows]
+
+
+def _cursor(rows):
+    strategy = rows[-1][0]
+    return strategy.created_at, strategy.id
+
+
+def test_list_pages_cover_all_strategies_once(repo):
+    # Server-default timestamps: several strategies share one second
+    for n in range(5):
+        repo.upsert_strategy(f"s{n}")
+    # One with an explicit, fractional timestamp in between
+    repo.upsert_strategy("late")
+    late = repo.db_session.query(Strategy).filter_by(strategy_id="late").one()
+    late.created_at = datetime.utcnow() + timedelta(minutes=1, microseconds=5)
+    repo.db_session.commit()
+
+    seen = []
+    after = None
+    for _ in range(6):
+        rows, has_more = repo.list_strategies_with_portfolio(limit=2, after=after)
+        seen.extend(_page_ids(rows))
+        if not has_more:
+            break
+        after = _cursor(rows)
+
+    assert seen == ["late", "s4", "s3", "s2", "s1", "s0"]
+
+
+def test_list_continues_after_cursor_strategy_is_deleted(repo):
+    for n in range(5):
+        repo.upsert_strategy(f"s{n}")
+
+    rows, has_more = repo.list_strategies_with_portfolio(limit=2)
+    assert _page_ids(rows) == ["s4", "s3"]
+    assert has_more
+    after = _cursor(rows)
+
+    assert repo.delete_strategy("s3")
+
+    rows, has_more = repo.list_strategies_with_portfolio(limit=2, after=after)
+    assert _page_ids(rows) == ["s2", "s1"]
+    assert has_more
+    rows, has_more = repo.list_strategies_with_portfolio(limit=2, after=_cursor(rows))
+    assert _page_ids(rows) == ["s0"]
+    assert not has_more
+
+
+def _snapshot(repo, strategy_id, minute, total_value):
+    return repo.add_portfolio_snapshot(
+        strategy_id,
+        cash=total_value,
+        total_value=total_value,
+        total_unrealized_pnl=0.0,
+        snapshot_ts=datetime(2026, 1, 1, 0, minute),
+    )
+
+
+def test_snapshots_fold_into_summary_in_time_order(repo):
+    repo.upsert_strategy("s")
+    _snapshot(repo, "s", 10, 110.0)
+    _snapshot(repo, "s", 20, 120.0)
+    # Arrives late: older than both, so it becomes the first snapshot only
+    _snapshot(repo, "s", 5, 100.0)
+    # Also late, but neither first nor latest
+    _snapshot(repo, "s", 15, 115.0)
+
+    summary = repo.get_portfolio_summary("s")
+    assert summary.snapshot_count == 4
+    assert summary.first_snapshot_ts == datetime(2026, 1, 1, 0, 5)
+    assert float(summary.first_total_value) == 100.0
+    assert summary.snapshot_ts == datetime(2026, 1, 1, 0, 20)
+    assert float(summary.total_value) == 120.0
+
+
+def test_backfill_builds_missing_summaries_only(repo):
+    for strategy_id in ("a", "b", "empty"):
+        repo.upsert_strategy(strategy_id)
+    for minute, value in ((1, 100.0), (3, 130.0), (2, 90.0)):
+        _snapshot(repo, "a", minute, value)
+    _snapshot(repo, "b", 1, 50.0)
+    # As if the snapshots predated the summary table
+    repo.db_session.query(StrategySummaryCache).filter_by(strategy_id="a").delete()
+    repo.db_session.commit()
+
+    assert repo.get_portfolio_summary("a") is None
+    assert repo.backfill_portfolio_summaries() == 1
+    assert repo.backfill_portfolio_summaries() == 0
+
+    summary = repo.get_portfolio_summary("a")
+    assert summary.snapshot_count == 3
+    assert float(summary.first_total_value) == 100.0
+    assert float(summary.total_value) == 130.0
+    assert repo.get_portfolio_summary("empty") is None
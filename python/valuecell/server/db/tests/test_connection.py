@@ -0,0 +1,65 @@
+"""
+Unit tests for valuecell.server.db.connection module
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from valuecell.server.db import connection as connection_mod
+from valuecell.server.db.connection import DatabaseManager
+from valuecell.server.db.repositories.strategy_repository import StrategyRepository
+
+
+def _manager(monkeypatch: pytest.MonkeyPatch, url: str, async_reads: bool):
+    config = {"url": url, "busy_timeout_ms": 1000, "async_reads": async_reads}
+    monkeypatch.setattr(
+        connection_mod,
+        "get_settings",
+        lambda: SimpleNamespace(get_database_config=lambda: config),
+    )
+    return DatabaseManager()
+
+
+def _count(session):
+    return StrategyRepository(db_session=session).count_strategies()
+
+
+def _list(session):
+    rows, _ = StrategyRepository(db_session=session).list_strategies_with_portfolio()
+    return [strategy.strategy_id for strategy, _ in rows]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_reads", [True, False])
+async def test_run_read_sees_committed_writes(monkeypatch, tmp_path, async_reads):
+    manager = _manager(monkeypatch, f"sqlite:///{tmp_path / 'db.sqlite'}", async_reads)
+    manager.create_tables()
+    writer = manager.get_session()
+    try:
+        repo = StrategyRepository(db_session=writer)
+        repo.upsert_strategy("s1", status="running")
+        repo.upsert_strategy("s2", status="stopped")
+    finally:
+        writer.close()
+
+    try:
+        assert await manager.run_read(_count) == (2, 1)
+        assert await manager.run_read(_list) == ["s2", "s1"]
+        # Only the async path creates the aiosqlite engine
+        assert (manager._async_engine is not None) is async_reads
+    finally:
+        await manager.dispose_async()
+        manager.engine.dispose()
+        manager.read_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database_reads_on_worker_thread(monkeypatch):
+    manager = _manager(monkeypatch, "sqlite://", async_reads=True)
+    manager.create_tables()
+
+    assert not manager.async_reads_enabled
+    assert await manager.run_read(_count) == (0, 0)
+    with pytest.raises(ValueError):
+        manager.get_async_engine()
@@ -3,22 +3,43 @@ Agent stream service for handling streaming agent interactions.
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 
 from loguru import logger
 
 from valuecell.core.agent.connect import RemoteConnections
 from valuecell.core.coordinate.orchestrator import AgentOrchestrator
+from valuecell.core.event.replay import OverflowPolicy, ReplayHub
 from valuecell.core.task.executor import TaskExecutor
 from valuecell.core.task.locator import get_task_service
 from valuecell.core.task.models import TaskPattern, TaskStatus
 from valuecell.core.types import UserInput, UserInputMetadata
+from valuecell.server.config.settings import get_settings
 from valuecell.utils.uuid import generate_conversation_id
 
 _TASK_AUTORESTART_STARTED = False
 _AGENT_CLASSES_PRELOADED = False
 
 
+def _create_replay_hub() -> ReplayHub:
+    """Build the stream replay hub from the server settings."""
+    settings = get_settings()
+    try:
+        policy = OverflowPolicy(settings.STREAM_OVERFLOW_POLICY.lower())
+    except ValueError:
+        logger.warning(
+            "Unknown STREAM_OVERFLOW_POLICY {!r}; using {}",
+            settings.STREAM_OVERFLOW_POLICY,
+            OverflowPolicy.COALESCE.value,
+        )
+        policy = OverflowPolicy.COALESCE
+    return ReplayHub(
+        capacity=settings.STREAM_REPLAY_CAPACITY,
+        queue_size=settings.STREAM_QUEUE_SIZE,
+        overflow_policy=policy,
+    )
+
+
 def _preload_agent_classes_once() -> None:
     """Preload local agent classes once to avoid Windows import lock deadlocks.
 
@@ -50,15 +71,19 @@ class AgentStreamService:
         # Windows import lock deadlocks when using thread pools
         _preload_agent_classes_once()
 
-        self.orchestrator = AgentOrchestrator()
+        self.orchestrator = AgentOrchestrator(replay_hub=_create_replay_hub())
         logger.info("Agent stream service initialized")
 
+    def stream_stats(self) -> Dict[str, Any]:
+        """Replay settings and live subscriber queue metrics per conversation."""
+        return self.orchestrator.replay_hub.stats()
+
     async def stream_query_agent(
         self,
         query: str,
         agent_name: Optional[str] = None,
         conversation_id: Optional[str] = None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Any, None]:
         """
         Stream agent responses for a given query.
 
@@ -70,6 +95,23 @@ class AgentStreamService:
         Yields:
             str: Content chunks from the agent response
         """
+        async for _, chunk in self.stream_query_agent_events(
+            query=query, agent_name=agent_name, conversation_id=conversation_id
+        ):
+            yield chunk
+
+    async def stream_query_agent_events(
+        self,
+        query: str,
+        agent_name: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+    ) -> AsyncGenerator[Tuple[Optional[int], Any], None]:
+        """
+        Stream agent responses together with their replay event ids.
+
+        Yields:
+            Tuple of the event id (None for error messages) and the chunk.
+        """
         try:
             logger.info(f"Processing streaming query: {query[:100]}...")
 
@@ -86,15 +128,40 @@ class AgentStreamService:
                 query=query, target_agent_name=target_agent_name, meta=user_input_meta
             )
 
-            # Use the orchestrator's process_user_input method for streaming
-            async for response_chunk in self.orchestrator.process_user_input(
+            # Use the orchestrator's stream_user_input method for streaming
+            async for event_id, response_chunk in self.orchestrator.stream_user_input(
                 user_input
             ):
-                yield response_chunk.model_dump(exclude_none=True)
+                yield event_id, response_chunk.model_dump(exclude_none=True)
 
         except Exception as e:
             logger.error(f"Error in stream_query_agent: {str(e)}")
-            yield f"Error processing query: {str(e)}"
+            yield None, f"Error processing query: {str(e)}"
+
+    def check_resumable(
+        self, conversation_id: str, last_event_id: Optional[int]
+    ) -> None:
+        """
+        Raise ``ReplayUnavailableError`` when the events after
+        ``last_event_id`` can no longer be replayed.
+        """
+        self.orchestrator.check_resumable(conversation_id, last_event_id)
+
+    async def resume_stream(
+        self, conversation_id: str, last_event_id: Optional[int] = None
+    ) -> AsyncGenerator[Tuple[Optional[int], Any], None]:
+        """
+        Replay the events missed after ``last_event_id`` and follow the live
+        producer of the conversation, if any.
+        """
+        try:
+            async for event_id, response_chunk in self.orchestrator.resume_stream(
+                conversation_id, last_event_id
+            ):
+                yield event_id, response_chunk.model_dump(exclude_none=True)
+        except Exception as e:
+            logger.error(f"Error in resume_stream: {str(e)}")
+            yield None, f"Error resuming stream: {str(e)}"
 
 
 async def _auto_resume_recurring_tasks(agent_service: AgentStreamService) -> None:
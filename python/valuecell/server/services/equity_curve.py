@@ -0,0 +1,154 @@
+"""Downsampling and alignment of portfolio equity curves for charts.
+
+A strategy deciding every few seconds stores thousands of portfolio snapshots
+a day, while a chart needs at most a few hundred points. This module bounds
+curve payloads:
+
+- a single curve is reduced with Largest-Triangle-Three-Buckets (LTTB), which
+  keeps the visual shape (peaks and drawdowns) of the series;
+- several curves are aligned on a common time grid whose bucket width grows
+  with the covered time span, taking each strategy's last equity value per
+  bucket, instead of joining on exact timestamps.
+
+Series at or below the point budget are returned unchanged (at one-second
+resolution for aligned curves).
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Points returned per curve when the caller does not ask otherwise
+DEFAULT_CURVE_MAX_POINTS = 1000
+# Candidate bucket widths (ms) for aligned curves, smallest first
+CURVE_BUCKET_WIDTHS_MS = (
+    1_000,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    5 * 60_000,
+    15 * 60_000,
+    30 * 60_000,
+    60 * 60_000,
+    4 * 60 * 60_000,
+    12 * 60 * 60_000,
+    24 * 60 * 60_000,
+    7 * 24 * 60 * 60_000,
+)
+CURVE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (epoch ms, values), both sorted by time
+Series = Tuple[np.ndarray, np.ndarray]
+
+
+def to_epoch_ms(times: Sequence[datetime]) -> np.ndarray:
+    """Convert datetimes (naive ones are UTC, as stored) to epoch milliseconds."""
+    return np.fromiter(
+        (
+            (t if t.tzinfo else t.replace(tzinfo=timezone.utc)).timestamp() * 1000
+            for t in times
+        ),
+        dtype=np.float64,
+        count=len(times),
+    ).astype(np.int64)
+
+
+def format_epoch_ms(ts_ms: int) -> str:
+    return datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).strftime(
+        CURVE_TIME_FORMAT
+    )
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps.
+
+    Always keeps the first and last points (only the last one for a budget
+    of one); returns every index when the series already fits in
+    ``max_points``.
+    """
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1][-max(1, max_points) :], dtype=np.int64)
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    every = (n - 2) / (max_points - 2)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return selected
+
+
+def downsample(series: Series, max_points: int) -> Series:
+    """Reduce one curve to at most ``max_points`` points with LTTB."""
+    ts, values = series
+    keep = lttb_indices(ts, values, max_points)
+    return ts[keep], values[keep]
+
+
+def _bucket_width_ms(ts: np.ndarray, max_points: int) -> int:
+    """Smallest candidate width giving at most ``max_points`` buckets."""
+    for width in CURVE_BUCKET_WIDTHS_MS:
+        if len(np.unique(ts // width)) <= max_points:
+            return width
+    # Wider than span / (max_points - 1), in whole multiples of the largest
+    # candidate, keeps the bucket count within max_points at any alignment
+    span = int(ts.max() - ts.min())
+    largest = CURVE_BUCKET_WIDTHS_MS[-1]
+    return (span // max(1, max_points - 1) // largest + 1) * largest
+
+
+def _last_per_bucket(series: Series, width: int) -> Series:
+    ts, values = series
+    buckets = ts // width * width
+    # Series are time-sorted: the last point of each run of equal buckets
+    last = np.flatnonzero(np.r_[buckets[1:] != buckets[:-1], True])
+    return buckets[last], values[last]
+
+
+def align(
+    series: Dict[str, Series], max_points: int
+) -> Tuple[np.ndarray, Dict[str, List[Optional[float]]]]:
+    """Align several curves on one time grid of at most ``max_points`` rows.
+
+    Returns the bucket start times (epoch ms) and, per series, its last value
+    in each bucket or None where it has no point. Budgets below two are
+    treated as two.
+    """
+    non_empty = {key: s for key, s in series.items() if len(s[0])}
+    if not non_empty:
+        return np.empty(0, dtype=np.int64), {key: [] for key in series}
+
+    all_ts = np.concatenate([s[0] for s in non_empty.values()])
+    width = _bucket_width_ms(all_ts, max(2, max_points))
+    bucketed = {key: _last_per_bucket(s, width) for key, s in non_empty.items()}
+    grid = np.unique(np.concatenate([b[0] for b in bucketed.values()]))
+
+    columns: Dict[str, List[Optional[float]]] = {}
+    for key in series:
+        column: List[Optional[float]] = [None] * len(grid)
+        if key in bucketed:
+            ts, values = bucketed[key]
+            for pos, value in zip(np.searchsorted(grid, ts).tolist(), values.tolist()):
+                column[pos] = value
+        columns[key] = column
+    return grid, columns
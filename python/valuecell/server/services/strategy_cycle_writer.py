@@ -0,0 +1,185 @@
+"""Batched, off-loop persistence of strategy decision cycles.
+
+Strategies run inside the server's event loop, while the strategy repository
+is synchronous SQLAlchemy. Writing a cycle result row by row from a strategy
+would block every other strategy (and the API) for several database
+round-trips per cycle. The :class:`StrategyCycleWriter` instead queues whole
+cycle results to a dedicated thread, which writes everything queued so far
+in a single transaction:
+
+- the event loop only enqueues; row building and I/O happen on the thread;
+- cycles of concurrently running strategies share one transaction;
+- each submitted cycle gets a future, so the caller learns whether its rows
+  were written, skipped (strategy deleted) or failed.
+
+If a batch transaction fails, its cycles are retried one by one so a single
+bad cycle cannot drop the rows of the other strategies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from valuecell.agents.common.trading import models as agent_models
+from valuecell.server.db.repositories.strategy_repository import (
+    CycleRows,
+    StrategyRepository,
+    get_strategy_repository,
+)
+from valuecell.server.services.strategy_persistence import build_cycle_rows
+
+# Upper bound on cycles written in one transaction
+DEFAULT_MAX_BATCH_CYCLES = 64
+# Longest wait at shutdown for queued cycles to be written
+DEFAULT_CLOSE_TIMEOUT_SECONDS = 30.0
+
+_Pending = Tuple[str, agent_models.DecisionCycleResult, Future]
+_STOP = object()
+
+
+class StrategyCycleWriter:
+    """Persist decision cycle results on a dedicated writer thread.
+
+    Thread-safe; one instance serves all strategies of the process (see
+    :func:`get_strategy_cycle_writer`). The thread starts on first use.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH_CYCLES,
+        repository_factory: Callable[[], StrategyRepository] = get_strategy_repository,
+    ) -> None:
+        self._max_batch = max(1, max_batch)
+        self._repository_factory = repository_factory
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self, strategy_id: str, result: agent_models.DecisionCycleResult
+    ) -> Future:
+        """Queue a cycle for writing.
+
+        The returned future resolves to True when the rows were written,
+        False when the strategy no longer exists, and raises if the write
+        failed.
+        """
+        future: Future = Future()
+        self._ensure_thread()
+        self._queue.put((strategy_id, result, future))
+        return future
+
+    async def write(
+        self, strategy_id: str, result: agent_models.DecisionCycleResult
+    ) -> bool:
+        """Submit a cycle and wait for it without blocking the event loop."""
+        future = asyncio.wrap_future(self.submit(strategy_id, result))
+        # Shielded: trades of a cancelled strategy must still be recorded
+        return await asyncio.shield(future)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write what is queued, then stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(
+                "Strategy cycle writer did not finish within {}s; "
+                "unwritten cycles are lost",
+                timeout,
+            )
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="strategy-cycle-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[_Pending] = []
+            item = self._queue.get()
+            # Drain whatever else arrived meanwhile, up to the batch limit
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self._max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: List[_Pending]) -> None:
+        pending: List[Tuple[CycleRows, Future]] = []
+        for strategy_id, result, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                pending.append((build_cycle_rows(strategy_id, result), future))
+            except Exception as exc:
+                future.set_exception(exc)
+        if not pending:
+            return
+
+        try:
+            self._write_pending(pending)
+        except Exception as exc:
+            logger.exception("Writing {} strategy cycles failed", len(pending))
+            error: Exception = exc
+        else:
+            error = RuntimeError("strategy cycle write returned no result")
+        # Whatever went wrong, no caller may be left waiting
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def _write_pending(self, pending: List[Tuple[CycleRows, Future]]) -> None:
+        repo = self._repository_factory()
+        try:
+            written = repo.add_cycle_rows([rows for rows, _ in pending])
+        except Exception as exc:
+            if len(pending) == 1:
+                pending[0][1].set_exception(exc)
+                return
+            logger.warning(
+                "Batched write of {} strategy cycles failed; retrying one by one",
+                len(pending),
+            )
+            for rows, future in pending:
+                try:
+                    future.set_result(repo.add_cycle_rows([rows])[0])
+                except Exception as exc:
+                    future.set_exception(exc)
+            return
+        for (_, future), ok in zip(pending, written):
+            future.set_result(ok)
+
+
+_WRITER: Optional[StrategyCycleWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_strategy_cycle_writer() -> StrategyCycleWriter:
+    """Return the process-wide cycle writer."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = StrategyCycleWriter()
+        return _WRITER
@@ -1,14 +1,194 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from loguru import logger
 
 from valuecell.agents.common.trading import models as agent_models
 from valuecell.server.db.repositories.strategy_repository import (
+    CycleRows,
     get_strategy_repository,
 )
 
 
+def _ms_to_datetime(ts_ms: Optional[int]) -> Optional[datetime]:
+    if ts_ms is None:
+        return None
+    return datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc)
+
+
+def _trade_detail_values(trade: agent_models.TradeHistoryEntry) -> Dict[str, Any]:
+    """Map a TradeHistoryEntry onto `StrategyRepository.add_detail_item` arguments."""
+    # map direction and type
+    ttype = trade.type.value if trade.type is not None else None
+    side = trade.side.value if trade.side is not None else None
+
+    # Prefer explicit entry/exit timestamps if provided; fall back to trade_ts
+    if trade.entry_ts is not None:
+        entry_time = _ms_to_datetime(trade.entry_ts)
+    else:
+        entry_time = _ms_to_datetime(trade.trade_ts)
+    exit_time = _ms_to_datetime(trade.exit_ts)
+
+    # Event time for repository: prefer entry_time, then exit_time, otherwise now
+    event_time = entry_time or exit_time or datetime.now(timezone.utc)
+
+    return dict(
+        compose_id=trade.compose_id,
+        trade_id=trade.trade_id,
+        instruction_id=trade.instruction_id,
+        symbol=trade.instrument.symbol,
+        type=ttype or ("LONG" if (trade.quantity or 0) > 0 else "SHORT"),
+        side=side or ("BUY" if (trade.quantity or 0) > 0 else "SELL"),
+        leverage=float(trade.leverage) if trade.leverage is not None else None,
+        quantity=abs(float(trade.quantity or 0.0)),
+        entry_price=(
+            float(trade.entry_price) if trade.entry_price is not None else None
+        ),
+        exit_price=(float(trade.exit_price) if trade.exit_price is not None else None),
+        avg_exec_price=(
+            float(trade.avg_exec_price) if trade.avg_exec_price is not None else None
+        ),
+        unrealized_pnl=(
+            float(trade.unrealized_pnl)
+            if trade.unrealized_pnl is not None
+            else (float(trade.realized_pnl) if trade.realized_pnl is not None else None)
+        ),
+        realized_pnl=(
+            float(trade.realized_pnl) if trade.realized_pnl is not None else None
+        ),
+        realized_pnl_pct=(
+            float(trade.realized_pnl_pct)
+            if trade.realized_pnl_pct is not None
+            else None
+        ),
+        notional_entry=(
+            float(trade.notional_entry) if trade.notional_entry is not None else None
+        ),
+        notional_exit=(
+            float(trade.notional_exit) if trade.notional_exit is not None else None
+        ),
+        fee_cost=(float(trade.fee_cost) if trade.fee_cost is not None else None),
+        # Note: StrategyDetail only stores unrealized_pnl; prefer
+        # trade.unrealized_pnl when present for backward-compatibility.
+        holding_ms=int(trade.holding_ms) if trade.holding_ms is not None else None,
+        event_time=event_time,
+        entry_time=entry_time,
+        exit_time=exit_time,
+        note=trade.note,
+    )
+
+
+def _portfolio_values(view: agent_models.PortfolioView) -> Dict[str, Any]:
+    """Map a PortfolioView onto `StrategyRepository.add_portfolio_snapshot` arguments."""
+    cash = float(view.free_cash)
+    return dict(
+        cash=cash,
+        total_value=float(view.total_value) if view.total_value is not None else cash,
+        total_unrealized_pnl=(
+            float(view.total_unrealized_pnl)
+            if view.total_unrealized_pnl is not None
+            else None
+        ),
+        total_realized_pnl=(
+            float(view.total_realized_pnl)
+            if view.total_realized_pnl is not None
+            else None
+        ),
+        gross_exposure=(
+            float(view.gross_exposure) if view.gross_exposure is not None else None
+        ),
+        net_exposure=(
+            float(view.net_exposure) if view.net_exposure is not None else None
+        ),
+        snapshot_ts=_ms_to_datetime(view.ts) if view.ts else None,
+    )
+
+
+def _holding_values(symbol: str, pos: agent_models.PositionSnapshot) -> Dict[str, Any]:
+    """Map a PositionSnapshot onto `StrategyRepository.add_holding_item` arguments."""
+    ttype = (
+        pos.trade_type.value
+        if pos.trade_type
+        else ("LONG" if pos.quantity >= 0 else "SHORT")
+    )
+    return dict(
+        symbol=symbol,
+        type=ttype,
+        leverage=float(pos.leverage) if pos.leverage is not None else None,
+        entry_price=float(pos.avg_price) if pos.avg_price is not None else None,
+        quantity=abs(float(pos.quantity)),
+        unrealized_pnl=(
+            float(pos.unrealized_pnl) if pos.unrealized_pnl is not None else None
+        ),
+        unrealized_pnl_pct=(
+            float(pos.unrealized_pnl_pct)
+            if pos.unrealized_pnl_pct is not None
+            else None
+        ),
+    )
+
+
+def _instruction_values(ins: agent_models.TradeInstruction) -> Dict[str, Any]:
+    """Map a TradeInstruction onto `StrategyRepository.add_instruction` arguments."""
+    return dict(
+        instruction_id=ins.instruction_id,
+        symbol=ins.instrument.symbol,
+        action=(ins.action.value if ins.action is not None else None),
+        side=(ins.side.value if ins.side is not None else None),
+        quantity=float(ins.quantity) if ins.quantity is not None else None,
+        leverage=float(ins.leverage) if ins.leverage is not None else None,
+        note=(ins.meta.get("rationale") if ins.meta else None),
+    )
+
+
+def _summary_metadata(summary: agent_models.StrategySummary) -> Dict[str, Any]:
+    return summary.model_dump(exclude_none=True, exclude={"strategy_id", "status"})
+
+
+def build_cycle_rows(
+    strategy_id: str, result: agent_models.DecisionCycleResult
+) -> CycleRows:
+    """Collect every row a decision cycle persists, for one batched write.
+
+    Produces the same rows as calling `persist_compose_cycle`,
+    `persist_instructions`, `persist_trade_history` (per trade),
+    `persist_portfolio_view` and `persist_strategy_summary` in turn.
+    """
+    now = datetime.utcnow()
+    details = []
+    for trade in result.trades:
+        values = _trade_detail_values(trade)
+        event_time = values.pop("event_time")
+        values["entry_time"] = values["entry_time"] or event_time
+        details.append(values)
+
+    view = result.portfolio_view
+    portfolio = _portfolio_values(view)
+    # One timestamp for the snapshot and its holdings keeps them grouped
+    portfolio["snapshot_ts"] = portfolio["snapshot_ts"] or now
+
+    return CycleRows(
+        strategy_id=strategy_id,
+        compose_cycle=dict(
+            compose_id=result.compose_id,
+            compose_time=_ms_to_datetime(result.timestamp_ms) or now,
+            cycle_index=result.cycle_index,
+            rationale=result.rationale,
+        ),
+        instructions=[
+            dict(compose_id=result.compose_id, **_instruction_values(ins))
+            for ins in result.instructions or []
+        ],
+        details=details,
+        portfolio=portfolio,
+        holdings=[
+            dict(snapshot_ts=portfolio["snapshot_ts"], **_holding_values(symbol, pos))
+            for symbol, pos in view.positions.items()
+        ],
+        metadata=_summary_metadata(result.strategy_summary),
+    )
+
+
 def persist_trade_history(
     strategy_id: str, trade: agent_models.TradeHistoryEntry
 ) -> Optional[dict]:
@@ -29,87 +209,8 @@ def persist_trade_history(
         except Exception:
             # If existence check fails, proceed but errors will be handled below
             pass
-        # map direction and type
-        ttype = trade.type.value if trade.type is not None else None
-        side = trade.side.value if trade.side is not None else None
-
-        # Prefer explicit entry/exit timestamps if provided; fall back to trade_ts
-        if trade.entry_ts is not None:
-            entry_time = datetime.fromtimestamp(
-                trade.entry_ts / 1000.0, tz=timezone.utc
-            )
-        elif trade.trade_ts is not None:
-            entry_time = datetime.fromtimestamp(
-                trade.trade_ts / 1000.0, tz=timezone.utc
-            )
-        else:
-            entry_time = None
-
-        exit_time = (
-            datetime.fromtimestamp(trade.exit_ts / 1000.0, tz=timezone.utc)
-            if trade.exit_ts is not None
-            else None
-        )
-
-        # Event time for repository: prefer entry_time, then exit_time, otherwise now
-        event_time = entry_time or exit_time or datetime.now(timezone.utc)
-
         item = repo.add_detail_item(
-            strategy_id=strategy_id,
-            compose_id=trade.compose_id,
-            trade_id=trade.trade_id,
-            instruction_id=trade.instruction_id,
-            symbol=trade.instrument.symbol,
-            type=ttype or ("LONG" if (trade.quantity or 0) > 0 else "SHORT"),
-            side=side or ("BUY" if (trade.quantity or 0) > 0 else "SELL"),
-            leverage=float(trade.leverage) if trade.leverage is not None else None,
-            quantity=abs(float(trade.quantity or 0.0)),
-            entry_price=(
-                float(trade.entry_price) if trade.entry_price is not None else None
-            ),
-            exit_price=(
-                float(trade.exit_price) if trade.exit_price is not None else None
-            ),
-            avg_exec_price=(
-                float(trade.avg_exec_price)
-                if trade.avg_exec_price is not None
-                else None
-            ),
-            unrealized_pnl=(
-                float(trade.unrealized_pnl)
-                if trade.unrealized_pnl is not None
-                else (
-                    float(trade.realized_pnl)
-                    if trade.realized_pnl is not None
-                    else None
-                )
-            ),
-            realized_pnl=(
-                float(trade.realized_pnl) if trade.realized_pnl is not None else None
-            ),
-            realized_pnl_pct=(
-                float(trade.realized_pnl_pct)
-                if trade.realized_pnl_pct is not None
-                else None
-            ),
-            notional_entry=(
-                float(trade.notional_entry)
-                if trade.notional_entry is not None
-                else None
-            ),
-            notional_exit=(
-                float(trade.notional_exit) if trade.notional_exit is not None else None
-            ),
-            fee_cost=(float(trade.fee_cost) if trade.fee_cost is not None else None),
-            # Note: store unrealized_pnl separately if available on the DTO
-            # (some callers may populate unrealized vs realized differently)
-            # Keep backward-compatibility: prefer trade.unrealized_pnl when present
-            # If both present, the DTO should include both; StrategyDetail currently only stores unrealized_pnl.
-            holding_ms=int(trade.holding_ms) if trade.holding_ms is not None else None,
-            event_time=event_time,
-            entry_time=entry_time,
-            exit_time=exit_time,
-            note=trade.note,
+            strategy_id=strategy_id, **_trade_detail_values(trade)
         )
 
         if item is None:
@@ -153,71 +254,18 @@ def persist_portfolio_view(view: agent_models.PortfolioView) -> bool:
             logger.error("persist_portfolio_view missing strategy_id on view")
             return False
 
-        snapshot_ts = (
-            datetime.fromtimestamp(view.ts / 1000.0, tz=timezone.utc)
-            if view.ts
-            else None
-        )
-
-        cash = float(view.free_cash)
-        total_value = float(view.total_value) if view.total_value is not None else cash
-        total_unrealized = (
-            float(view.total_unrealized_pnl)
-            if view.total_unrealized_pnl is not None
-            else None
-        )
-        total_realized = (
-            float(view.total_realized_pnl)
-            if view.total_realized_pnl is not None
-            else None
-        )
-        gross_exposure = (
-            float(view.gross_exposure) if view.gross_exposure is not None else None
-        )
-        net_exposure = (
-            float(view.net_exposure) if view.net_exposure is not None else None
-        )
-
-        portfolio_item = repo.add_portfolio_snapshot(
-            strategy_id=strategy_id,
-            cash=cash,
-            total_value=total_value,
-            total_unrealized_pnl=total_unrealized,
-            total_realized_pnl=total_realized,
-            gross_exposure=gross_exposure,
-            net_exposure=net_exposure,
-            snapshot_ts=snapshot_ts,
-        )
+        values = _portfolio_values(view)
+        portfolio_item = repo.add_portfolio_snapshot(strategy_id=strategy_id, **values)
         if portfolio_item is None:
             logger.warning(
                 "Failed to persist strategy portfolio snapshot for {}", strategy_id
             )
 
         for symbol, pos in view.positions.items():
-            # pos is PositionSnapshot
-            ttype = (
-                pos.trade_type.value
-                if pos.trade_type
-                else ("LONG" if pos.quantity >= 0 else "SHORT")
-            )
             repo.add_holding_item(
                 strategy_id=strategy_id,
-                symbol=symbol,
-                type=ttype,
-                leverage=float(pos.leverage) if pos.leverage is not None else None,
-                entry_price=float(pos.avg_price) if pos.avg_price is not None else None,
-                quantity=abs(float(pos.quantity)),
-                unrealized_pnl=(
-                    float(pos.unrealized_pnl)
-                    if pos.unrealized_pnl is not None
-                    else None
-                ),
-                unrealized_pnl_pct=(
-                    float(pos.unrealized_pnl_pct)
-                    if pos.unrealized_pnl_pct is not None
-                    else None
-                ),
-                snapshot_ts=snapshot_ts,
+                snapshot_ts=values["snapshot_ts"],
+                **_holding_values(symbol, pos),
             )
         return True
     except Exception:
@@ -243,13 +291,7 @@ def persist_strategy_summary(summary: agent_models.StrategySummary) -> bool:
             return False
 
         existing_meta = strategy.strategy_metadata or {}
-        meta = {
-            **dict(existing_meta),
-            **summary.model_dump(
-                exclude_none=True,
-                exclude={"strategy_id", "status"},
-            ),
-        }
+        meta = {**dict(existing_meta), **_summary_metadata(summary)}
         updated = repo.upsert_strategy(strategy_id, metadata=meta)
         return updated is not None
     except Exception:
@@ -314,11 +356,7 @@ def persist_compose_cycle(
     """
     repo = get_strategy_repository()
     try:
-        compose_time = (
-            datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc)
-            if ts_ms is not None
-            else None
-        )
+        compose_time = _ms_to_datetime(ts_ms)
         item = repo.add_compose_cycle(
             strategy_id=strategy_id,
             compose_id=compose_id,
@@ -350,13 +388,7 @@ def persist_instructions(
             ok = repo.add_instruction(
                 strategy_id=strategy_id,
                 compose_id=compose_id,
-                instruction_id=ins.instruction_id,
-                symbol=ins.instrument.symbol,
-                action=(ins.action.value if ins.action is not None else None),
-                side=(ins.side.value if ins.side is not None else None),
-                quantity=float(ins.quantity) if ins.quantity is not None else None,
-                leverage=float(ins.leverage) if ins.leverage is not None else None,
-                note=(ins.meta.get("rationale") if ins.meta else None),
+                **_instruction_values(ins),
             )
             if ok:
                 inserted += 1
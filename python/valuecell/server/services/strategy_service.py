@@ -12,6 +12,7 @@ from valuecell.server.api.schemas.strategy import (
     StrategyPortfolioSummaryData,
     StrategyType,
 )
+from valuecell.server.db import run_read
 from valuecell.server.db.repositories import get_strategy_repository
 
 
@@ -107,18 +108,30 @@ class StrategyService:
     async def get_strategy_portfolio_summary(
         strategy_id: str,
     ) -> Optional[StrategyPortfolioSummaryData]:
-        repo = get_strategy_repository()
-        snapshot = repo.get_latest_portfolio_snapshot(strategy_id)
-        if not snapshot:
+        summary = await run_read(
+            lambda session: get_strategy_repository(
+                db_session=session
+            ).get_portfolio_summary(strategy_id)
+        )
+        if not summary:
             return None
+        return StrategyService.summarize_portfolio(
+            strategy_id, summary, summary.first_total_value
+        )
 
-        first_snapshot = repo.get_first_portfolio_snapshot(strategy_id)
-        if not first_snapshot:
+    @staticmethod
+    def summarize_portfolio(
+        strategy_id: str, snapshot, first_total_value
+    ) -> Optional[StrategyPortfolioSummaryData]:
+        """Build the portfolio summary from the latest snapshot (or a
+        StrategySummaryCache row) and the equity of the first snapshot.
+        """
+        if not snapshot or snapshot.snapshot_ts is None:
             return None
 
-        ts = snapshot.snapshot_ts or datetime.now(datetime.timezone.utc)
+        ts = snapshot.snapshot_ts
         total_value = _to_optional_float(snapshot.total_value)
-        base_value = _to_optional_float(first_snapshot.total_value)
+        base_value = _to_optional_float(first_total_value)
 
         total_pnl = StrategyService._combine_realized_unrealized(snapshot)
         total_pnl_pct = 0.0
@@ -205,7 +218,8 @@ class StrategyService:
         if not strategy:
             return None
 
-        snapshot = repo.get_latest_portfolio_snapshot(strategy_id)
+        # Latest/first equity come from the maintained summary row
+        summary = repo.get_portfolio_summary(strategy_id)
         # Reference timestamp no longer included in performance response
 
         # Extract flattened config fields from original config/meta
@@ -238,15 +252,14 @@ class StrategyService:
             # Fast path: read from metadata set on first LIVE snapshot
             initial_total_cash = _to_optional_float(meta.get("initial_total_cash_live"))
             if initial_total_cash is None:
-                # Rare path: metadata missing (older strategies); query first snapshot once
+                # Rare path: metadata missing (older strategies); use the first snapshot
                 try:
-                    first_snapshot = repo.get_first_portfolio_snapshot(strategy_id)
                     initial_total_cash = (
                         _to_optional_float(
-                            first_snapshot.total_value
-                            - first_snapshot.total_unrealized_pnl
+                            summary.first_total_value
+                            - summary.first_total_unrealized_pnl
                         )
-                        if first_snapshot
+                        if summary and summary.first_snapshot_ts is not None
                         else None
                     )
                 except Exception:
@@ -273,8 +286,8 @@ class StrategyService:
                 prompt_name = None
 
         total_value = (
-            _to_optional_float(getattr(snapshot, "total_value", None))
-            if snapshot
+            _to_optional_float(getattr(summary, "total_value", None))
+            if summary
             else None
         )
 
@@ -0,0 +1,136 @@
+"""
+Unit tests for valuecell.server.services.equity_curve module
+"""
+
+import numpy as np
+import pytest
+
+from valuecell.server.services.equity_curve import (
+    CURVE_BUCKET_WIDTHS_MS,
+    align,
+    downsample,
+    lttb_indices,
+)
+
+WEEK_MS = 7 * 24 * 60 * 60_000
+
+
+def _series(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    ts = np.cumsum(rng.integers(1, 5_000, size=n)).astype(np.int64)
+    values = 1000 + np.cumsum(rng.normal(size=n))
+    return ts, values
+
+
+@pytest.mark.parametrize("n, max_points", [(10_000, 100), (1001, 1000), (50, 3)])
+def test_lttb_keeps_endpoints_within_budget(n, max_points):
+    ts, values = _series(n)
+
+    keep = lttb_indices(ts, values, max_points)
+
+    assert len(keep) == max_points
+    assert keep[0] == 0
+    assert keep[-1] == n - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_keeps_extremes():
+    ts = np.arange(1000, dtype=np.int64)
+    values = np.zeros(1000)
+    values[500] = 50.0
+    values[700] = -40.0
+
+    keep = set(lttb_indices(ts, values, 20).tolist())
+
+    assert {500, 700} <= keep
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 5])
+def test_lttb_returns_short_series_unchanged(n):
+    ts, values = _series(n)
+
+    assert lttb_indices(ts, values, 5).tolist() == list(range(n))
+
+
+@pytest.mark.parametrize("max_points, expected", [(2, [0, 99]), (1, [99])])
+def test_lttb_tiny_budget_stays_within_budget(max_points, expected):
+    ts, values = _series(100)
+
+    assert lttb_indices(ts, values, max_points).tolist() == expected
+
+
+def test_downsample_returns_matching_times_and_values():
+    ts, values = _series(5000)
+
+    out_ts, out_values = downsample((ts, values), 200)
+
+    assert len(out_ts) == len(out_values) == 200
+    assert out_ts[0] == ts[0] and out_ts[-1] == ts[-1]
+    assert np.isin(out_values, values).all()
+
+
+def test_align_series_without_shared_timestamps():
+    a = (np.array([0, 1_000, 2_000], dtype=np.int64), np.array([1.0, 2.0, 3.0]))
+    b = (np.array([400, 1_600], dtype=np.int64), np.array([10.0, 20.0]))
+    # Only starts once the others have ended
+    c = (np.array([5_000], dtype=np.int64), np.array([7.0]))
+
+    grid, columns = align({"a": a, "b": b, "c": c}, max_points=100)
+
+    assert grid.tolist() == [0, 1_000, 2_000, 5_000]
+    assert columns["a"] == [1.0, 2.0, 3.0, None]
+    assert columns["b"] == [10.0, 20.0, None, None]
+    assert columns["c"] == [None, None, None, 7.0]
+
+
+def test_align_takes_last_value_per_bucket():
+    # 999 and 1_000 sit on either side of a one-second bucket boundary
+    ts = np.array([0, 500, 999, 1_000, 1_999], dtype=np.int64)
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+    grid, columns = align({"a": (ts, values)}, max_points=10)
+
+    assert grid.tolist() == [0, 1_000]
+    assert columns["a"] == [3.0, 5.0]
+
+
+def test_align_handles_empty_input():
+    empty = (np.empty(0, dtype=np.int64), np.empty(0))
+
+    grid, columns = align({}, max_points=10)
+    assert len(grid) == 0 and columns == {}
+
+    grid, columns = align({"a": empty}, max_points=10)
+    assert len(grid) == 0 and columns == {"a": []}
+
+    one = (np.array([3_000], dtype=np.int64), np.array([1.0]))
+    grid, columns = align({"a": empty, "b": one}, max_points=10)
+    assert grid.tolist() == [3_000]
+    assert columns == {"a": [None], "b": [1.0]}
+
+
+@pytest.mark.parametrize("max_points", [2, 10, 100, 1000])
+def test_align_grid_stays_within_budget(max_points):
+    series = {f"s{n}": _series(3000, seed=n) for n in range(3)}
+
+    grid, columns = align(series, max_points)
+
+    assert 0 < len(grid) <= max_points
+    assert all(len(column) == len(grid) for column in columns.values())
+    # Every series keeps its final value
+    for key, (_, values) in series.items():
+        assert values[-1] in columns[key]
+
+
+def test_align_falls_back_to_widths_beyond_a_week():
+    assert CURVE_BUCKET_WIDTHS_MS[-1] == WEEK_MS
+    # Ten years of daily points cannot fit in 10 weekly buckets
+    ts = np.arange(0, 3650, dtype=np.int64) * 24 * 60 * 60_000 + 12_345
+    values = np.arange(3650, dtype=np.float64)
+
+    grid, columns = align({"a": (ts, values)}, max_points=10)
+
+    assert 0 < len(grid) <= 10
+    width = int(np.diff(grid).min())
+    assert width % WEEK_MS == 0 and width > WEEK_MS
+    assert columns["a"][-1] == values[-1]
@@ -0,0 +1,136 @@
+"""
+Unit tests for valuecell.server.services.strategy_cycle_writer module
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import List
+
+import pytest
+
+from valuecell.server.services import strategy_cycle_writer as writer_mod
+from valuecell.server.services.strategy_cycle_writer import StrategyCycleWriter
+
+
+class FakeRepository:
+    """Records the strategy ids of every ``add_cycle_rows`` call."""
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self.deleted: set = set()
+        self.bad: set = set()
+        self.gate = threading.Event()
+        self.gate.set()
+        # Set once a transaction has started
+        self.entered = threading.Event()
+
+    def add_cycle_rows(self, rows: List[str]) -> List[bool]:
+        self.entered.set()
+        self.gate.wait(5)
+        self.calls.append(list(rows))
+        if any(strategy_id in self.bad for strategy_id in rows):
+            raise RuntimeError("constraint violated")
+        return [strategy_id not in self.deleted for strategy_id in rows]
+
+
+@pytest.fixture(autouse=True)
+def _plain_rows(monkeypatch: pytest.MonkeyPatch):
+    # Rows are just the strategy id; the repository fake does the rest
+    monkeypatch.setattr(
+        writer_mod, "build_cycle_rows", lambda strategy_id, _result: strategy_id
+    )
+
+
+def _writer(repo: FakeRepository, **kwargs) -> StrategyCycleWriter:
+    return StrategyCycleWriter(repository_factory=lambda: repo, **kwargs)
+
+
+def _results(futures: List[Future]):
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result(timeout=5))
+        except Exception as exc:
+            outcomes.append(type(exc).__name__)
+    return outcomes
+
+
+def test_cycles_queued_meanwhile_share_one_transaction():
+    repo = FakeRepository()
+    repo.gate.clear()
+    writer = _writer(repo, max_batch=3)
+
+    first = writer.submit("s0", None)
+    # Wait until the writer thread is blocked inside the first transaction
+    assert repo.entered.wait(5)
+    rest = [writer.submit(f"s{i}", None) for i in range(1, 6)]
+    repo.gate.set()
+
+    assert _results([first, *rest]) == [True] * 6
+    assert repo.calls == [["s0"], ["s1", "s2", "s3"], ["s4", "s5"]]
+    writer.close(5)
+
+
+def test_failed_batch_is_retried_one_by_one():
+    repo = FakeRepository()
+    repo.gate.clear()
+    repo.bad.add("bad")
+    writer = _writer(repo)
+
+    blocker = writer.submit("first", None)
+    assert repo.entered.wait(5)
+    futures = [writer.submit(sid, None) for sid in ("a", "bad", "b")]
+    repo.gate.set()
+
+    assert _results([blocker, *futures]) == [True, True, "RuntimeError", True]
+    assert repo.calls[1:] == [["a", "bad", "b"], ["a"], ["bad"], ["b"]]
+    writer.close(5)
+
+
+def test_deleted_strategy_resolves_false():
+    repo = FakeRepository()
+    repo.deleted.add("gone")
+    writer = _writer(repo)
+
+    assert _results([writer.submit("gone", None), writer.submit("kept", None)]) == [
+        False,
+        True,
+    ]
+    writer.close(5)
+
+
+def test_unexpected_failure_fails_every_pending_cycle():
+    repo = FakeRepository()
+    calls = {"n": 0}
+
+    def factory() -> FakeRepository:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("database unavailable")
+        return repo
+
+    writer = StrategyCycleWriter(repository_factory=factory)
+
+    assert _results([writer.submit("s1", None)]) == ["RuntimeError"]
+    # The writer thread survived and keeps writing
+    assert _results([writer.submit("s2", None)]) == [True]
+    writer.close(5)
+
+
+def test_close_drains_queued_cycles():
+    repo = FakeRepository()
+    repo.gate.clear()
+    writer = _writer(repo)
+    futures = [writer.submit(f"s{i}", None) for i in range(4)]
+
+    threading.Timer(0.05, repo.gate.set).start()
+    writer.close(5)
+
+    assert all(future.done() for future in futures)
+    assert _results(futures) == [True] * 4
+    assert sorted(sid for call in repo.calls for sid in call) == [
+        "s0",
+        "s1",
+        "s2",
+        "s3",
+    ]
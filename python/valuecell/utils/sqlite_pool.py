@@ -0,0 +1,190 @@
+"""Shared aiosqlite connection pool used by the core SQLite stores.
+
+Opening an aiosqlite connection spawns a worker thread and a fresh sqlite3
+handle, so doing it per statement dominates the cost of small writes such as
+streamed conversation items. This module keeps, per database file and event
+loop, one long-lived writer connection in WAL mode plus a few reader
+connections. Because the connections persist, sqlite3's per-connection
+statement cache gives prepared-statement reuse for free.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+from loguru import logger
+
+DEFAULT_READER_COUNT = 4
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+def _is_memory_path(db_path: str) -> bool:
+    return db_path == ":memory:" or db_path.startswith("file::memory:")
+
+
+def _daemonize(conn: aiosqlite.Connection) -> None:
+    """Mark the aiosqlite worker thread as daemon before it starts.
+
+    Pooled connections live for the whole process; a non-daemon worker would
+    keep the interpreter alive at exit when nobody closes the pool. Committed
+    transactions are already durable, so nothing is lost by not joining it.
+    Older aiosqlite releases subclass ``Thread`` while newer ones hold it in
+    ``_thread``; handle both.
+    """
+    thread = conn if isinstance(conn, threading.Thread) else None
+    if thread is None:
+        thread = getattr(conn, "_thread", None)
+    if isinstance(thread, threading.Thread) and not thread.is_alive():
+        thread.daemon = True
+
+
+class SQLiteConnectionPool:
+    """Persistent writer/reader aiosqlite connections for one database file.
+
+    - ``writer()`` serializes access to a single connection and commits (or
+      rolls back) when the block exits, so a block is one transaction.
+    - ``reader()`` hands out one of up to ``reader_count`` read-only
+      connections. WAL mode lets them run alongside the writer.
+
+    Instances are bound to the event loop that created them; use
+    :func:`get_sqlite_pool` rather than constructing pools directly.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        reader_count: int = DEFAULT_READER_COUNT,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    ):
+        self.db_path = db_path
+        # Separate connections to an in-memory database see separate
+        # databases, so route every read through the writer in that case.
+        self.reader_count = 0 if _is_memory_path(db_path) else max(0, reader_count)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue = asyncio.Queue()
+        self._reader_lock = asyncio.Lock()
+        self._closed = False
+
+    async def _open(self, readonly: bool) -> aiosqlite.Connection:
+        conn = aiosqlite.connect(
+            self.db_path, cached_statements=DEFAULT_CACHED_STATEMENTS
+        )
+        _daemonize(conn)
+        await conn
+        conn.row_factory = sqlite3.Row
+        await conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        if readonly:
+            await conn.execute("PRAGMA query_only = ON")
+        else:
+            if not _is_memory_path(self.db_path):
+                await conn.execute("PRAGMA journal_mode = WAL")
+            await conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    async def _get_writer(self) -> aiosqlite.Connection:
+        if self._closed:
+            raise RuntimeError(f"SQLite pool for {self.db_path} is closed")
+        if self._writer is None:
+            self._writer = await self._open(readonly=False)
+        return self._writer
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Exclusive access to the writer connection as one transaction."""
+        async with self._write_lock:
+            conn = await self._get_writer()
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+
+    async def _acquire_reader(self) -> aiosqlite.Connection:
+        if not self._idle_readers.empty():
+            return self._idle_readers.get_nowait()
+        async with self._reader_lock:
+            if len(self._readers) < self.reader_count:
+                # Make sure the writer has switched the file to WAL first.
+                async with self._write_lock:
+                    await self._get_writer()
+                conn = await self._open(readonly=True)
+                self._readers.append(conn)
+                return conn
+        return await self._idle_readers.get()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        if self.reader_count == 0:
+            async with self._write_lock:
+                yield await self._get_writer()
+            return
+        if self._closed:
+            raise RuntimeError(f"SQLite pool for {self.db_path} is closed")
+        conn = await self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection owned by the pool."""
+        self._closed = True
+        conns = list(self._readers)
+        if self._writer is not None:
+            conns.append(self._writer)
+        self._readers.clear()
+        self._writer = None
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception as exc:
+                logger.warning(f"Failed to close SQLite connection: {exc}")
+
+
+# event loop -> normalized db path -> pool
+_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, SQLiteConnectionPool]]" = weakref.WeakKeyDictionary()
+_POOLS_LOCK = threading.Lock()
+
+
+def _normalize_path(db_path: str) -> str:
+    if _is_memory_path(db_path):
+        return db_path
+    return os.path.abspath(db_path)
+
+
+def get_sqlite_pool(db_path: str) -> SQLiteConnectionPool:
+    """Return the pool for ``db_path`` on the running event loop.
+
+    Pools are shared by every store pointing at the same file, so the item,
+    conversation and task stores funnel their writes through one connection.
+    """
+    loop = asyncio.get_running_loop()
+    key = _normalize_path(db_path)
+    with _POOLS_LOCK:
+        pools = _POOLS.setdefault(loop, {})
+        pool = pools.get(key)
+        if pool is None or pool._closed:
+            pool = SQLiteConnectionPool(key)
+            pools[key] = pool
+        return pool
+
+
+async def close_sqlite_pools() -> None:
+    """Close all pools bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _POOLS_LOCK:
+        pools = list(_POOLS.pop(loop, {}).values())
+    for pool in pools:
+        await pool.close()